@@ -0,0 +1,81 @@
+"""
+=================================================================================
+BENCHMARK: Import Time of the Solver Core
+=================================================================================
+The solver and instance core (src.algorithms, src.utils) must be importable
+with NumPy only; matplotlib, seaborn and pandas are optional layers that are
+imported on first use. Each module is imported in a fresh interpreter, the
+wall time is reported, and the run fails if a heavy library was pulled in.
+
+Usage:
+    python benchmarks/bench_import_time.py [--repeat 5] [--budget 0.5]
+=================================================================================
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Module -> libraries it must not import
+CORE_MODULES = {
+    'src.algorithms': ('matplotlib', 'seaborn', 'pandas', 'PyQt5'),
+    'src.utils': ('matplotlib', 'seaborn', 'pandas', 'PyQt5'),
+    'src.visualization': ('matplotlib', 'seaborn', 'pandas', 'PyQt5'),
+    'src.cli': ('matplotlib', 'seaborn', 'pandas', 'PyQt5'),
+}
+
+PROBE = '''
+import sys, time, json
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"elapsed": elapsed, "modules": sorted(sys.modules)}}))
+'''
+
+
+def measure_import(module: str) -> dict:
+    """Import a module in a fresh interpreter; returns elapsed time and loaded modules"""
+    output = subprocess.run(
+        [sys.executable, '-c', PROBE.format(module=module)],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Import-time guard for the solver core')
+    parser.add_argument('--repeat', type=int, default=5, help='Fresh interpreters per module')
+    parser.add_argument('--budget', type=float, default=None,
+                        help='Fail if the median import time (seconds) exceeds this')
+    args = parser.parse_args()
+
+    failed = False
+    print(f"{'Module':<22} {'median (ms)':>12} {'min (ms)':>10}  heavy imports")
+    for module, forbidden in CORE_MODULES.items():
+        runs = [measure_import(module) for _ in range(args.repeat)]
+        times = [run['elapsed'] for run in runs]
+        loaded = set(runs[0]['modules'])
+        heavy = [lib for lib in forbidden if lib in loaded]
+        median = statistics.median(times)
+
+        print(f"{module:<22} {median * 1000:>12.1f} {min(times) * 1000:>10.1f}  "
+              f"{', '.join(heavy) if heavy else '-'}")
+        if heavy:
+            failed = True
+        if args.budget is not None and median > args.budget:
+            print(f"  {module}: median {median:.3f}s exceeds budget {args.budget:.3f}s")
+            failed = True
+
+    if failed:
+        print("\n✗ Import-time guard failed")
+        sys.exit(1)
+    print("\n✓ Solver core imports without plotting/pandas")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,292 @@
+"""
+=================================================================================
+BENCHMARK: Solver, Loader and Fitness Kernels with Stored Baselines
+=================================================================================
+Times solve_knapsack_gbfs, solve_knapsack_bpso, the BPSO fitness kernel
+(evaluate_fitness_batch) and TestCaseLoader.load_test_case.
+
+- Solver/kernel instances come from src/data_generator.py (fixed seed), one
+  per size; BPSO runs with a fixed seed, so every run does the same work
+- Each case runs in fresh interpreters (--processes): the first call is
+  the cold timing, the next --repeat calls are warm timings
+- Reported per case: median / IQR / min of cold and warm times, peak
+  traced allocation (tracemalloc, one extra call) and max RSS
+- `run` writes a JSON baseline; `compare` checks a new run (or a second
+  JSON file) against it and exits 1 when a case got slower or allocates
+  more than --threshold
+
+benchmarks/baseline.json is a small CI-sized reference (n = 50, 200; 3 warm
+calls x 2 interpreters); its 'meta' records the machine, Python and numpy
+versions. Timings only compare on the same machine: refresh it there
+(after an intended performance change, or on a new CI runner) with
+
+    python benchmarks/bench_solvers.py run --sizes 50 200 --repeat 3 --processes 2 \
+        -o benchmarks/baseline.json
+
+and commit the file. `compare` reruns the suite with the baseline's sizes,
+--repeat and --processes.
+
+Usage:
+    python benchmarks/bench_solvers.py run -o benchmarks/baseline.json
+    python benchmarks/bench_solvers.py compare benchmarks/baseline.json [current.json]
+=================================================================================
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+SEED = 42
+SIZES = (50, 200, 1000)
+GBFS_PARAMS = {'max_states': 5000}
+BPSO_PARAMS = {'n_particles': 30, 'max_iterations': 50, 'seed': SEED}
+FITNESS_BATCH = 30  # Positions per evaluate_fitness_batch call (= swarm size)
+LOADER_CASES = ('Size Small 30', 'Size Medium 50', 'Size Large 70')
+
+PROBE = '''
+import sys, json
+sys.path.insert(0, {root!r})
+sys.path.insert(0, {bench_dir!r})
+import bench_solvers
+print(json.dumps(bench_solvers.measure_case({case!r}, {instances_dir!r}, {repeat})))
+'''
+
+
+def case_names(sizes=SIZES):
+    """All benchmark case names, e.g. 'gbfs/n=200', 'loader/Size Large 70'"""
+    names = [f'{kind}/n={n}' for kind in ('gbfs', 'bpso', 'fitness') for n in sizes]
+    return names + [f'loader/{name}' for name in LOADER_CASES]
+
+
+def generate_instances(sizes, out_dir):
+    """Seeded generator instances, one directory per size"""
+    from src.data_generator import generate_instance
+    for n in sizes:
+        generate_instance(n, out_dir, preset='size', seed=SEED, name=f'bench {n}')
+
+
+def _make_case(case, instances_dir):
+    """Zero-argument callable for a case (setup is not timed)"""
+    kind, arg = case.split('/', 1)
+
+    if kind == 'loader':
+        from src.utils import TestCaseLoader
+        loader = TestCaseLoader(str(ROOT / 'data' / 'test_cases'))
+
+        def load():
+            loader.clear_cache()  # Time the disk path, not the LRU hit
+            return loader.load_test_case(arg)
+        return load
+
+    from src.utils.streaming_loader import load_streamed_instance
+    n = int(arg.split('=')[1])
+    problem = load_streamed_instance(Path(instances_dir) / f'bench_{n}')
+    args = (problem['items'], problem['weights'], problem['values'], problem['capacity'])
+
+    if kind == 'gbfs':
+        from src.algorithms import solve_knapsack_gbfs
+        return lambda: solve_knapsack_gbfs(*args, regions=problem['regions'], **GBFS_PARAMS)
+    if kind == 'bpso':
+        from src.algorithms import solve_knapsack_bpso
+        return lambda: solve_knapsack_bpso(*args, regions=problem['regions'], **BPSO_PARAMS)
+    if kind == 'fitness':
+        from src.algorithms.bpso_knapsack import KnapsackBPSO
+        bpso = KnapsackBPSO(*args, regions=problem['regions'], seed=SEED)
+        positions = np.random.RandomState(SEED).randint(0, 2, (FITNESS_BATCH, n))
+        return lambda: bpso.evaluate_fitness_batch(positions)
+    raise ValueError(f"Unknown benchmark case: {case}")
+
+
+def measure_case(case, instances_dir, repeat):
+    """
+    Run one case in the current (fresh) interpreter
+
+    Returns:
+        Dict with 'cold' (first call), 'warm' (list of repeat calls),
+        'peak_alloc_bytes' and 'max_rss_bytes'
+    """
+    import resource
+    import tracemalloc
+
+    fn = _make_case(case, instances_dir)
+
+    start = time.perf_counter()
+    fn()
+    cold = time.perf_counter() - start
+
+    warm = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        warm.append(time.perf_counter() - start)
+
+    # Separate call: tracing slows allocation-heavy code down
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform != 'darwin':
+        max_rss *= 1024  # Linux reports kilobytes
+    return {'cold': cold, 'warm': warm, 'peak_alloc_bytes': peak, 'max_rss_bytes': max_rss}
+
+
+def summarize(times):
+    """median / IQR / min of a list of timings (seconds)"""
+    q1, median, q3 = np.percentile(times, [25, 50, 75])
+    return {'median': float(median), 'q1': float(q1), 'q3': float(q3),
+            'iqr': float(q3 - q1), 'min': float(min(times)), 'n': len(times)}
+
+
+def run_case(case, instances_dir, repeat, processes):
+    """Measure a case in `processes` fresh interpreters and aggregate"""
+    samples = []
+    for _ in range(processes):
+        output = subprocess.run(
+            [sys.executable, '-c', PROBE.format(root=str(ROOT), bench_dir=str(ROOT / 'benchmarks'),
+                                                case=case, instances_dir=str(instances_dir),
+                                                repeat=repeat)],
+            cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout
+        samples.append(json.loads(output.strip().splitlines()[-1]))
+    return {
+        'cold': summarize([s['cold'] for s in samples]),
+        'warm': summarize([t for s in samples for t in s['warm']]),
+        'peak_alloc_bytes': max(s['peak_alloc_bytes'] for s in samples),
+        'max_rss_bytes': max(s['max_rss_bytes'] for s in samples)
+    }
+
+
+def run_suite(sizes=SIZES, repeat=5, processes=3, pattern=None):
+    """Run all (or matching) cases; returns the baseline dict"""
+    cases = [case for case in case_names(sizes) if pattern is None or pattern in case]
+    results = {}
+    with tempfile.TemporaryDirectory(prefix='knapsack_bench_') as instances_dir:
+        generate_instances(sizes, instances_dir)
+        print(f"{'Case':<26} {'cold (ms)':>10} {'warm (ms)':>10} {'IQR (ms)':>9} {'peak (MB)':>10}")
+        for case in cases:
+            r = results[case] = run_case(case, instances_dir, repeat, processes)
+            print(f"{case:<26} {r['cold']['median'] * 1000:>10.2f} {r['warm']['median'] * 1000:>10.2f} "
+                  f"{r['warm']['iqr'] * 1000:>9.2f} {r['peak_alloc_bytes'] / 2**20:>10.2f}")
+
+    return {
+        'meta': {
+            'created': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'machine': platform.machine(),
+            'processor': platform.processor(),
+            'cpu_count': os.cpu_count(),
+            'sizes': list(sizes),
+            'repeat': repeat,
+            'processes': processes,
+            'seed': SEED
+        },
+        'cases': results
+    }
+
+
+def compare(baseline, current, threshold=0.10, min_delta=1e-4):
+    """
+    Compare two suite results
+
+    A timing regresses when its median is more than `threshold` above the
+    baseline median and the difference exceeds both the baseline IQR and
+    min_delta seconds (timer noise on sub-millisecond kernels); peak
+    allocation regresses when it grows by more than `threshold`.
+
+    Returns:
+        List of regression descriptions (empty: no regression)
+    """
+    regressions = []
+    print(f"{'Case':<26} {'phase':<6} {'base (ms)':>10} {'now (ms)':>10} {'ratio':>7}")
+    for case, base in baseline['cases'].items():
+        now = current['cases'].get(case)
+        if now is None:
+            print(f"{case:<26} (not in current run)")
+            continue
+        for phase in ('cold', 'warm'):
+            b, c = base[phase]['median'], now[phase]['median']
+            ratio = c / b if b > 0 else float('inf')
+            slower = ratio > 1 + threshold and c - b > max(base[phase]['iqr'], min_delta)
+            status = 'REGRESSION' if slower else ('improved' if ratio < 1 / (1 + threshold) else '')
+            print(f"{case:<26} {phase:<6} {b * 1000:>10.2f} {c * 1000:>10.2f} {ratio:>7.2f}  {status}")
+            if slower:
+                regressions.append(f"{case} {phase}: {b * 1000:.2f}ms -> {c * 1000:.2f}ms (x{ratio:.2f})")
+        b_mem, c_mem = base['peak_alloc_bytes'], now['peak_alloc_bytes']
+        if b_mem > 0 and c_mem > b_mem * (1 + threshold):
+            print(f"{case:<26} memory {b_mem / 2**20:>10.2f} {c_mem / 2**20:>10.2f} "
+                  f"{c_mem / b_mem:>7.2f}  REGRESSION (MB)")
+            regressions.append(f"{case} peak alloc: {b_mem / 2**20:.2f}MB -> {c_mem / 2**20:.2f}MB")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Solver/loader benchmarks with regression detection')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    def add_run_arguments(p, repeat=5, processes=3):
+        p.add_argument('--sizes', type=int, nargs='+', default=list(SIZES), help='Instance sizes (n_items)')
+        p.add_argument('--repeat', type=int, default=repeat, help='Warm calls per interpreter')
+        p.add_argument('--processes', type=int, default=processes,
+                       help='Fresh interpreters per case (cold samples)')
+        p.add_argument('-k', '--filter', default=None, help='Only cases containing this text')
+
+    run_parser = subparsers.add_parser('run', help='Run the suite and write a JSON baseline')
+    add_run_arguments(run_parser)
+    run_parser.add_argument('-o', '--output', default='benchmarks/baseline.json', help='Output JSON')
+
+    compare_parser = subparsers.add_parser('compare', help='Compare against a baseline')
+    compare_parser.add_argument('baseline', help='Baseline JSON')
+    compare_parser.add_argument('current', nargs='?', default=None,
+                                help='Result JSON to check (default: run the suite now)')
+    compare_parser.add_argument('--threshold', type=float, default=0.10,
+                                help='Allowed relative slowdown / memory growth (default 0.10)')
+    compare_parser.add_argument('--min-delta', type=float, default=1e-4,
+                                help='Ignore slowdowns smaller than this many seconds (default 1e-4)')
+    add_run_arguments(compare_parser, repeat=None, processes=None)  # default: the baseline's
+    args = parser.parse_args()
+
+    if args.command == 'run':
+        result = run_suite(args.sizes, args.repeat, args.processes, args.filter)
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(result, indent=2))
+        print(f"\n✓ Saved baseline: {output}")
+        return
+
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    if args.current:
+        with open(args.current, 'r', encoding='utf-8') as f:
+            current = json.load(f)
+    else:
+        meta = baseline['meta']
+        current = run_suite(meta['sizes'], args.repeat or meta['repeat'],
+                            args.processes or meta['processes'], args.filter)
+        print()
+
+    regressions = compare(baseline, current, args.threshold, args.min_delta)
+    if regressions:
+        print(f"\n✗ {len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+        for line in regressions:
+            print(f"  {line}")
+        sys.exit(1)
+    print(f"\n✓ No regression beyond {args.threshold:.0%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -6,33 +6,262 @@ Tổ chức experiments theo structure:
 3.1.1. Ảnh hưởng của tham số (Parameter Impact)
 3.1.2. Ảnh hưởng của thuật toán (Algorithm Comparison) 
 3.1.3. Ảnh hưởng của dữ liệu (Data Characteristics)
+3.1.4. Khả năng mở rộng (Scaling: n, capacity, số region trên instance sinh)
 
 Mỗi experiment sinh ra:
 - CSV data file
+- 3.1.1.b-d: <name>_history.npz (convergence float32 + index,
+  src/utils/history_store.py)
+
+Mỗi experiment được khai báo bằng SweepSpec (sweep.py): solver, grid tham
+số, test cases, số lần lặp. run_sweeps() gộp runs của nhiều spec, bỏ các
+run trùng (vd 3.1.2 và 3.1.3 cùng test case, cùng cấu hình) rồi chạy:
+- workers=1: tuần tự; workers=N: process pool (--workers N)
+- Seed mỗi run suy ra từ (algorithm, params, test case, run_id), kết quả
+  (CSV/history) giống nhau với mọi số worker
+- Kết quả từng run được cache theo nội dung (result_cache.py) trong
+  <output_dir>/.cache/runs; chạy lại chỉ tính các run còn thiếu (--no-cache
+  để tắt)
+- Mỗi run được lưu atomic ngay khi xong. Với cache (mặc định), sweep bị
+  dừng sẽ tự tiếp tục ở lần chạy sau. Với --no-cache, runs được lưu vào
+  checkpoint của sweep (<output_dir>/.cache/checkpoint): --resume tiếp tục
+  từ checkpoint, không có --resume thì bắt đầu lại; checkpoint bị xóa khi
+  sweep hoàn tất
+- --memory: thêm 1 run đo bộ nhớ mỗi ô (tracemalloc peak, số lần GC, RSS
+  high-water mark); CSV có thêm cột bộ nhớ, 3.1.1 vẽ thêm <name>_memory.png
+- --profile: solver ghi thời gian/counter theo phase (src/algorithms/profiling.py),
+  mỗi sweep ghi thêm <name>_profile.csv (tổng theo ô, mọi replicate)
 =================================================================================
 """
 
 import sys
 import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
 import numpy as np
 import pandas as pd
 import time
-import json
+import shutil
+import dataclasses
 from src.utils import TestCaseLoader
-from src.algorithms import solve_knapsack_gbfs, solve_knapsack_bpso
-from src.visualization import AdvancedKnapsackVisualizer
+from src.utils.instance_cache import read_cache_meta
+from src.utils.history_store import write_histories
+from src.data_generator import generate_instance, write_summary
+from experiment.chapter3.runner import run_all, make_pool
+from experiment.chapter3.result_cache import RunCache
+from experiment.chapter3.sweep import SweepSpec, SweepResult, expand_runs, load_sweep_specs
+
+STANDARD_TEST_CASE = 'Size Medium 50'
+
+# Cấu hình chuẩn cho so sánh thuật toán (3.1.2, 3.1.3)
+GBFS_PARAMS = {'max_states': 5000}
+BPSO_PARAMS = {'n_particles': 30, 'max_iterations': 50}
+
+# 3.1.1: ảnh hưởng tham số trên test case chuẩn (5 runs mỗi giá trị)
+SWEEP_3_1_1_A = SweepSpec(
+    name='3_1_1_a_gbfs_params', solvers={'gbfs': {}},
+    instances=[STANDARD_TEST_CASE], grid={'max_states': [1000, 2000, 3000, 5000, 7000, 10000]},
+    replicates=5
+)
+SWEEP_3_1_1_B = SweepSpec(
+    name='3_1_1_b_bpso_swarm_size', solvers={'bpso': {'max_iterations': 50}},
+    instances=[STANDARD_TEST_CASE], grid={'n_particles': [10, 20, 30, 50, 70, 100]},
+    replicates=5, use_regions=False
+)
+SWEEP_3_1_1_C = SweepSpec(
+    name='3_1_1_c_bpso_iterations', solvers={'bpso': {'n_particles': 30}},
+    instances=[STANDARD_TEST_CASE], grid={'max_iterations': [20, 30, 50, 70, 100, 150]},
+    replicates=5
+)
+SWEEP_3_1_1_D = SweepSpec(
+    name='3_1_1_d_bpso_w', solvers={'bpso': {'n_particles': 30, 'max_iterations': 50}},
+    instances=[STANDARD_TEST_CASE], grid={'w': [0.3, 0.5, 0.7, 0.9]},
+    replicates=5
+)
+
+# 3.1.3: test case đại diện cho mỗi đặc điểm dữ liệu
+DATA_CHARACTERISTIC_GROUPS = {
+    'low_correlation': 'Data Low Correlation Medium',
+    'high_correlation': 'Data High Correlation Medium',
+    'high_value': 'Data High Value Medium',
+    'region_1': 'Region 1Regions Medium',
+    'region_3': 'Region 3Regions Medium'
+}
+
+
+# 3.1.4: scaling trên instance sinh (src/data_generator.py, seed cố định),
+# thay đổi từng yếu tố quanh điểm chuẩn
+SCALING_SEED = 42
+SCALING_BASE = {'n_items': 1000, 'capacity_ratio': 0.15, 'n_regions': 4}
+SCALING_FACTORS = {
+    'n_items': [100, 300, 1000, 3000, 10000, 30000],
+    'capacity_ratio': [0.05, 0.1, 0.15, 0.3, 0.5],
+    'n_regions': [1, 2, 4, 8, 16]
+}
+# Ngân sách tìm kiếm CỐ ĐỊNH theo n (biến độc lập là kích thước bài toán với
+# ngân sách bị chặn): GBFS mở rộng mỗi state O(n) con nên tăng max_states theo
+# n không khả thi ở n = 30000; BPSO khởi tạo greedy để swarm bắt đầu khả thi
+SCALING_SOLVERS = {'gbfs': GBFS_PARAMS, 'bpso': dict(BPSO_PARAMS, init_strategy='greedy')}
+SCALING_BUDGET_NOTE = {
+    algorithm: 'capped: ' + ', '.join(f'{k}={v}' for k, v in params.items())
+    for algorithm, params in SCALING_SOLVERS.items()
+}
+
+
+def scaling_points():
+    """(factor, instance parameters, instance name) của sweep 3.1.4"""
+    points = []
+    for factor, levels in SCALING_FACTORS.items():
+        for level in levels:
+            p = dict(SCALING_BASE, **{factor: level})
+            name = f"Scale N{p['n_items']} C{p['capacity_ratio']} R{p['n_regions']} S{SCALING_SEED}"
+            points.append((factor, p, name))
+    return points
+
+
+def fractional_upper_bound(weights, values, capacity):
+    """Cận trên LP (knapsack phân số) của tổng giá trị, O(n log n)"""
+    weights = np.asarray(weights, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    order = np.argsort(-values / np.maximum(weights, 1e-12), kind='stable')
+    cum_weight = np.cumsum(weights[order])
+    k = int(np.searchsorted(cum_weight, capacity, side='right'))
+    bound = values[order[:k]].sum()
+    if k < len(order):
+        remaining = capacity - (cum_weight[k - 1] if k > 0 else 0.0)
+        bound += values[order[k]] * remaining / weights[order[k]]
+    return float(bound)
+
+
+def fit_exponent(x, y):
+    """Số mũ b của y ~ a * x^b (hồi quy log-log) và R^2"""
+    log_x, log_y = np.log(np.asarray(x, dtype=float)), np.log(np.asarray(y, dtype=float))
+    b, a = np.polyfit(log_x, log_y, 1)
+    residual = log_y - (a + b * log_x)
+    total = ((log_y - log_y.mean()) ** 2).sum()
+    r2 = 1 - (residual ** 2).sum() / total if total > 0 else 1.0
+    return float(b), float(r2)
+
+
+def comparison_sweep(name, instances, replicates=3):
+    """GBFS vs BPSO với cấu hình chuẩn (3.1.2, 3.1.3)"""
+    return SweepSpec(name=name, solvers={'gbfs': GBFS_PARAMS, 'bpso': BPSO_PARAMS},
+                     instances=list(instances), replicates=replicates, use_regions=False)
 
 
 class Chapter3Experiments:
     """Quản lý experiments cho Chương """
     
-    def __init__(self, output_dir='results/chapter3'):
+    def __init__(self, output_dir='results/chapter3', workers=1, use_cache=True, resume=False,
+                 profile=False, track_memory=False):
         self.output_dir = output_dir
         os.makedirs(output_dir, exist_ok=True)
         self.loader = TestCaseLoader()
-        self.visualizer = AdvancedKnapsackVisualizer()
+        self.base_test_cases = self.loader.list_test_cases()  # Không gồm suite đăng ký thêm
+        self._suites = []  # (summary_path, base_dir) đăng ký thêm, truyền cho workers
+        self._visualizer = None
+        self.workers = workers
+        self.profile = profile  # Solver profile theo phase cho mọi run
+        self.track_memory = track_memory  # Thêm run đo bộ nhớ cho mỗi ô
+        self._pool = None  # Process pool, tạo khi cần (workers > 1)
+        self._results = {}  # Run -> result của session này (dùng chung giữa experiments)
+        
+        # Nơi lưu kết quả từng run: cache lâu dài, hoặc checkpoint của sweep này
+        self.checkpoint_dir = None
+        if use_cache:
+            self.cache = RunCache(os.path.join(output_dir, '.cache', 'runs'))
+        else:
+            self.checkpoint_dir = os.path.join(output_dir, '.cache', 'checkpoint')
+            if resume and os.path.isdir(self.checkpoint_dir):
+                print(f"  [resume] Tiếp tục từ checkpoint: {self.checkpoint_dir}")
+            else:
+                shutil.rmtree(self.checkpoint_dir, ignore_errors=True)
+            self.cache = RunCache(self.checkpoint_dir)
+    
+    @property
+    def visualizer(self):
+        """Visualizer, tạo khi cần vẽ (tránh import matplotlib khi chỉ chạy solver)"""
+        if self._visualizer is None:
+            from src.visualization import AdvancedKnapsackVisualizer
+            self._visualizer = AdvancedKnapsackVisualizer()
+        return self._visualizer
+    
+    def run_grid(self, runs):
+        """Chạy danh sách Run (tuần tự hoặc song song), trả về dict Run -> result"""
+        if self.workers > 1 and self._pool is None:
+            self._pool = make_pool(self.workers, self.loader.test_cases_dir, self._suites)
+        hits = self.cache.hits
+        results = run_all(runs, self.loader, self._pool, self.cache)
+        source = 'checkpoint' if self.checkpoint_dir else 'cache'
+        print(f"  [{source}] {self.cache.hits - hits}/{len(runs)} runs từ {source}")
+        return dict(zip(runs, results))
+    
+    def register_suite(self, summary_path, base_dir=None):
+        """Đăng ký thêm test cases (loader và workers tạo sau đó)"""
+        self.loader.register_instances(summary_path, base_dir)
+        self._suites.append((str(summary_path), None if base_dir is None else str(base_dir)))
+        self.close()  # Workers hiện tại không biết suite mới
+    
+    def run_sweeps(self, specs):
+        """
+        Chạy nhiều SweepSpec cùng lúc: runs trùng giữa các spec chỉ chạy một lần
+        
+        Returns:
+            Dict spec.name -> SweepResult
+        """
+        if self.profile:
+            specs = [dataclasses.replace(spec, profile=True) for spec in specs]
+        scheduled = list(specs)
+        if self.track_memory:
+            scheduled += [spec.memory_spec() for spec in specs if not spec.track_memory]
+        runs = expand_runs(scheduled)
+        missing = [run for run in runs if run not in self._results]
+        n_declared = sum(len(spec.runs()) for spec in scheduled)
+        print(f"  [sweep] {len(runs)} runs duy nhất / {n_declared} runs khai báo, "
+              f"{len(missing)} cần chạy")
+        if missing:
+            self._results.update(self.run_grid(missing))
+        sweeps = {spec.name: SweepResult(spec, self._results) for spec in specs}
+        if self.profile:
+            for name, sweep in sweeps.items():
+                csv_path = os.path.join(self.output_dir, f'{name}_profile.csv')
+                pd.DataFrame(sweep.profile_rows()).to_csv(csv_path, index=False)
+                print(f"  [profile] {csv_path}")
+        return sweeps
+    
+    def run_sweep(self, spec):
+        """Chạy một SweepSpec, trả về SweepResult"""
+        return self.run_sweeps([spec])[spec.name]
+    
+    def all_sweeps(self):
+        """SweepSpec của tất cả experiments (dùng để lên lịch chung)"""
+        return [
+            SWEEP_3_1_1_A, SWEEP_3_1_1_B, SWEEP_3_1_1_C, SWEEP_3_1_1_D,
+            comparison_sweep('3_1_2_comparison_single', [STANDARD_TEST_CASE], replicates=5),
+            comparison_sweep('3_1_2_comparison_all', self.base_test_cases),
+            comparison_sweep('3_1_3_data_characteristics', DATA_CHARACTERISTIC_GROUPS.values())
+        ]
+    
+    @staticmethod
+    def _memory_columns(sweep, algorithm, test_name, prefix='', **point):
+        """Cột bộ nhớ của một ô (rỗng khi không đo bộ nhớ)"""
+        return {f'{prefix}{k}': v for k, v in sweep.memory(algorithm, test_name, **point).items()}
+    
+    def _print_test_case(self, name):
+        test_case = self.loader.load_test_case(name)
+        print(f"\nTest Case: {name}")
+        print(f"Items: {test_case['n_items']}, Capacity: {test_case['capacity']}\n")
+    
+    def finish_sweep(self):
+        """Sweep hoàn tất: xóa checkpoint (chế độ --no-cache)"""
+        if self.checkpoint_dir is not None:
+            shutil.rmtree(self.checkpoint_dir, ignore_errors=True)
+    
+    def close(self):
+        """Tắt process pool (nếu có)"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
     
     # =========================================================================
     # 3.1.1. ẢNH HƯỞNG CỦA THAM SỐ (Parameter Impact)
@@ -48,54 +277,38 @@ class Chapter3Experiments:
         print("="*70)
         
         # Dùng Size Medium 50 làm test case chuẩn
-        test_case = self.loader.load_test_case('Size Medium 50')
-        items, weights, values, capacity = (
-            test_case['items'], test_case['weights'], 
-            test_case['values'], test_case['capacity']
-        )
-        
-        print(f"\nTest Case: Size Medium 50")
-        print(f"Items: {len(items)}, Capacity: {capacity}\n")
+        self._print_test_case(STANDARD_TEST_CASE)
         
+        spec = SWEEP_3_1_1_A
+        sweep = self.run_sweep(spec)
         results = []
-        max_states_list = [1000, 2000, 3000, 5000, 7000, 10000]
         
-        for max_states in max_states_list:
+        for max_states in spec.grid['max_states']:
             print(f"Testing max_states = {max_states}...")
             
-            # Run 5 times để có mean/std
-            runs = []
-            for run_id in range(5):
-                # Reload test case mỗi lần để tránh mutation
-                test_case_run = self.loader.load_test_case('Size Medium 50')
-                result = solve_knapsack_gbfs(
-                    test_case_run['items'], 
-                    test_case_run['weights'], 
-                    test_case_run['values'], 
-                    test_case_run['capacity'],
-                    regions=test_case_run.get('regions'),
-                    max_states=max_states
-                )
-                runs.append(result)
+            # 5 runs để có mean/std
+            runs = sweep.replicates('gbfs', STANDARD_TEST_CASE, max_states=max_states)
+            for run_id, result in enumerate(runs):
                 print(f"  Run {run_id+1}: Value={result['total_value']}, Time={result['execution_time']:.4f}s")
             
             # Aggregate results
-            values = [r['total_value'] for r in runs]
-            times = [r['execution_time'] for r in runs]
+            value = sweep.stats('gbfs', STANDARD_TEST_CASE, 'total_value', max_states=max_states)
+            time_ = sweep.stats('gbfs', STANDARD_TEST_CASE, 'execution_time', max_states=max_states)
             
             results.append({
                 'max_states': max_states,
-                'value': np.mean(values),
-                'value_std': np.std(values),
-                'value_best': max(values),
-                'value_worst': min(values),
-                'time': np.mean(times),
-                'time_std': np.std(times),
-                'efficiency': np.mean(values) / np.mean(times)
+                'value': value['mean'],
+                'value_std': value['std'],
+                'value_best': value['best'],
+                'value_worst': value['worst'],
+                'time': time_['mean'],
+                'time_std': time_['std'],
+                'efficiency': value['mean'] / time_['mean'],
+                **self._memory_columns(sweep, 'gbfs', STANDARD_TEST_CASE, max_states=max_states)
             })
             
-            print(f"  → Mean Value: {np.mean(values):.2f} ± {np.std(values):.2f}")
-            print(f"  → Mean Time: {np.mean(times):.4f} ± {np.std(times):.4f}s\n")
+            print(f"  → Mean Value: {value['mean']:.2f} ± {value['std']:.2f}")
+            print(f"  → Mean Time: {time_['mean']:.4f} ± {time_['std']:.4f}s\n")
         
         # Save CSV
         df = pd.DataFrame(results)
@@ -108,6 +321,13 @@ class Chapter3Experiments:
         self.visualizer.plot_gbfs_parameter_impact(df, save_path=fig_path)
         print(f"✓ Saved Chart: {fig_path}")
         
+        if 'peak_memory_mb' in df:
+            fig_path = os.path.join(self.output_dir, '3_1_1_a_gbfs_params_memory.png')
+            self.visualizer.plot_memory_impact(df, 'max_states', algorithm='gbfs',
+                                               title='3.1.1.a: GBFS Memory vs Max States',
+                                               save_path=fig_path)
+            print(f"✓ Saved Chart: {fig_path}")
+        
         return df
     
     def experiment_3_1_1_b_bpso_swarm_size(self):
@@ -118,250 +338,91 @@ class Chapter3Experiments:
         print("\n" + "="*70)
         print("3.1.1.b: BPSO PARAMETER ANALYSIS - Swarm Size Impact")
         print("="*70)
-        
-        test_case = self.loader.load_test_case('Size Medium 50')
-        items, weights, values, capacity = (
-            test_case['items'], test_case['weights'], 
-            test_case['values'], test_case['capacity']
-        )
-        
-        print(f"\nTest Case: Size Medium 50")
-        print(f"Items: {len(items)}, Capacity: {capacity}\n")
-        
-        results = []
-        swarm_sizes = [10, 20, 30, 50, 70, 100]
-        
-        for n_particles in swarm_sizes:
-            print(f"Testing n_particles = {n_particles}...")
-            
-            runs = []
-            for run_id in range(5):
-                # Reload test case mỗi lần
-                test_case_run = self.loader.load_test_case('Size Medium 50')
-                result = solve_knapsack_bpso(
-                    test_case_run['items'],
-                    test_case_run['weights'],
-                    test_case_run['values'],
-                    test_case_run['capacity'],
-                    n_particles=n_particles, max_iterations=50
-                )
-                runs.append(result)
-                print(f"  Run {run_id+1}: Value={result['total_value']}, Time={result['execution_time']:.4f}s")
-            
-            # Aggregate
-            values = [r['total_value'] for r in runs]
-            times = [r['execution_time'] for r in runs]
-            
-            # Get best run's history for convergence plot
-            best_run = max(runs, key=lambda x: x['total_value'])
-            
-            results.append({
-                'param_value': n_particles,
-                'value': np.mean(values),
-                'value_std': np.std(values),
-                'time': np.mean(times),
-                'time_std': np.std(times),
-                'best_fitness_history': best_run.get('best_fitness_history', [])
-            })
-            
-            print(f"  → Mean Value: {np.mean(values):.2f} ± {np.std(values):.2f}")
-            print(f"  → Mean Time: {np.mean(times):.4f}s\n")
-        
-        # Save CSV (without history column)
-        df_save = pd.DataFrame([{k: v for k, v in r.items() if k != 'best_fitness_history'} 
-                               for r in results])
-        csv_path = os.path.join(self.output_dir, '3_1_1_b_bpso_swarm_size.csv')
-        df_save.to_csv(csv_path, index=False)
-        print(f"✓ Saved CSV: {csv_path}")
-        
-        # Save history to JSON for visualization
-        history_data = {
-            'experiment': '3_1_1_b_bpso_swarm_size',
-            'param_name': 'n_particles',
-            'results': [
-                {
-                    'param_value': r['param_value'],
-                    'value': r['value'],
-                    'best_fitness_history': r['best_fitness_history']
-                }
-                for r in results
-            ]
-        }
-        json_path = os.path.join(self.output_dir, '3_1_1_b_bpso_swarm_size_history.json')
-        with open(json_path, 'w') as f:
-            json.dump(history_data, f, indent=2)
-        print(f"✓ Saved History JSON: {json_path}")
-        
-        # Generate visualization
-        df_plot = pd.DataFrame(results)
-        fig_path = os.path.join(self.output_dir, '3_1_1_b_bpso_swarm_size.png')
-        self.visualizer.plot_bpso_parameter_impact(df_plot, param_name='n_particles', save_path=fig_path)
-        print(f"✓ Saved Chart: {fig_path}")
-        
-        return df_plot
+        return self._bpso_parameter_experiment(SWEEP_3_1_1_B, 'n_particles')
     
     def experiment_3_1_1_c_bpso_iterations(self):
         """Test BPSO với các max_iterations khác nhau"""
         print("\n" + "="*70)
         print("3.1.1.c: BPSO PARAMETER ANALYSIS - Max Iterations Impact")
         print("="*70)
-        
-        test_case = self.loader.load_test_case('Size Medium 50')
-        items, weights, values, capacity = (
-            test_case['items'], test_case['weights'], 
-            test_case['values'], test_case['capacity']
-        )
-        
-        print(f"\nTest Case: Size Medium 50\n")
-        
-        results = []
-        iterations_list = [20, 30, 50, 70, 100, 150]
-        
-        for max_iter in iterations_list:
-            print(f"Testing max_iterations = {max_iter}...")
-            
-            runs = []
-            for run_id in range(5):
-                # Reload test case mỗi lần
-                test_case_run = self.loader.load_test_case('Size Medium 50')
-                result = solve_knapsack_bpso(
-                    test_case_run['items'],
-                    test_case_run['weights'],
-                    test_case_run['values'],
-                    test_case_run['capacity'],
-                    regions=test_case_run.get('regions'),
-                    n_particles=30, max_iterations=max_iter
-                )
-                runs.append(result)
-            
-            values = [r['total_value'] for r in runs]
-            times = [r['execution_time'] for r in runs]
-            best_run = max(runs, key=lambda x: x['total_value'])
-            
-            results.append({
-                'param_value': max_iter,
-                'value': np.mean(values),
-                'value_std': np.std(values),
-                'time': np.mean(times),
-                'time_std': np.std(times),
-                'best_fitness_history': best_run.get('best_fitness_history', [])
-            })
-            
-            print(f"  → Mean Value: {np.mean(values):.2f}, Time: {np.mean(times):.4f}s\n")
-        
-        # Save CSV
-        df_save = pd.DataFrame([{k: v for k, v in r.items() if k != 'best_fitness_history'} 
-                               for r in results])
-        csv_path = os.path.join(self.output_dir, '3_1_1_c_bpso_iterations.csv')
-        df_save.to_csv(csv_path, index=False)
-        print(f"✓ Saved CSV: {csv_path}")
-        
-        # Save history to JSON
-        history_data = {
-            'experiment': '3_1_1_c_bpso_iterations',
-            'param_name': 'max_iterations',
-            'results': [
-                {
-                    'param_value': r['param_value'],
-                    'value': r['value'],
-                    'best_fitness_history': r['best_fitness_history']
-                }
-                for r in results
-            ]
-        }
-        json_path = os.path.join(self.output_dir, '3_1_1_c_bpso_iterations_history.json')
-        with open(json_path, 'w') as f:
-            json.dump(history_data, f, indent=2)
-        print(f"✓ Saved History JSON: {json_path}")
-        
-        # Visualize
-        df_plot = pd.DataFrame(results)
-        fig_path = os.path.join(self.output_dir, '3_1_1_c_bpso_iterations.png')
-        self.visualizer.plot_bpso_parameter_impact(df_plot, param_name='max_iterations', save_path=fig_path)
-        print(f"✓ Saved Chart: {fig_path}")
-        
-        return df_plot
+        return self._bpso_parameter_experiment(SWEEP_3_1_1_C, 'max_iterations')
     
     def experiment_3_1_1_d_bpso_inertia_weight(self):
         """Test BPSO với các w (inertia weight) khác nhau"""
         print("\n" + "="*70)
         print("3.1.1.d: BPSO PARAMETER ANALYSIS - Inertia Weight (w) Impact")
         print("="*70)
+        return self._bpso_parameter_experiment(SWEEP_3_1_1_D, 'w')
+    
+    def _bpso_parameter_experiment(self, spec, param_name):
+        """
+        3.1.1.b/c/d: quét một tham số BPSO trên test case chuẩn
         
-        test_case = self.loader.load_test_case('Size Medium 50')
-        items, weights, values, capacity, regions = (
-            test_case['items'], test_case['weights'], 
-            test_case['values'], test_case['capacity'],
-            test_case.get('regions')
-        )
-        
-        print(f"\nTest Case: Size Medium 50")
-        print(f"Items: {len(items)}, Capacity: {capacity}\n")
+        Sinh <spec.name>.csv, <spec.name>_history.npz (convergence của run
+        tốt nhất mỗi giá trị) và <spec.name>.png
+        """
+        self._print_test_case(STANDARD_TEST_CASE)
         
+        sweep = self.run_sweep(spec)
         results = []
-        w_values = [0.3, 0.5, 0.7, 0.9]
         
-        for w in w_values:
-            print(f"Testing w = {w}...")
+        for param_value in spec.grid[param_name]:
+            print(f"Testing {param_name} = {param_value}...")
             
-            runs = []
-            for run_id in range(5):
-                # Reload để tránh mutation
-                test_case_run = self.loader.load_test_case('Size Medium 50')
-                result = solve_knapsack_bpso(
-                    test_case_run['items'], test_case_run['weights'], 
-                    test_case_run['values'], test_case_run['capacity'],
-                    regions=test_case_run.get('regions'),
-                    n_particles=30, max_iterations=50, w=w
-                )
-                runs.append(result)
+            runs = sweep.replicates('bpso', STANDARD_TEST_CASE, **{param_name: param_value})
+            for run_id, result in enumerate(runs):
+                print(f"  Run {run_id+1}: Value={result['total_value']}, Time={result['execution_time']:.4f}s")
+            
+            # Aggregate
+            value = sweep.stats('bpso', STANDARD_TEST_CASE, 'total_value', **{param_name: param_value})
+            time_ = sweep.stats('bpso', STANDARD_TEST_CASE, 'execution_time', **{param_name: param_value})
             
-            values = [r['total_value'] for r in runs]
-            times = [r['execution_time'] for r in runs]
+            # Get best run's history for convergence plot
             best_run = max(runs, key=lambda x: x['total_value'])
             
             results.append({
-                'param_value': w,
-                'value': np.mean(values),
-                'value_std': np.std(values),
-                'time': np.mean(times),
-                'time_std': np.std(times),
+                'param_value': param_value,
+                'value': value['mean'],
+                'value_std': value['std'],
+                'time': time_['mean'],
+                'time_std': time_['std'],
+                **self._memory_columns(sweep, 'bpso', STANDARD_TEST_CASE, **{param_name: param_value}),
                 'best_fitness_history': best_run.get('best_fitness_history', [])
             })
             
-            print(f"  → Mean Value: {np.mean(values):.2f}, Time: {np.mean(times):.4f}s\n")
+            print(f"  → Mean Value: {value['mean']:.2f} ± {value['std']:.2f}")
+            print(f"  → Mean Time: {time_['mean']:.4f}s\n")
         
-        # Save CSV
+        # Save CSV (without history column)
         df_save = pd.DataFrame([{k: v for k, v in r.items() if k != 'best_fitness_history'} 
                                for r in results])
-        csv_path = os.path.join(self.output_dir, '3_1_1_d_bpso_w.csv')
+        csv_path = os.path.join(self.output_dir, f'{spec.name}.csv')
         df_save.to_csv(csv_path, index=False)
         print(f"✓ Saved CSV: {csv_path}")
         
-        # Save history to JSON
-        history_data = {
-            'experiment': '3_1_1_d_bpso_w',
-            'param_name': 'w',
-            'results': [
-                {
-                    'param_value': r['param_value'],
-                    'value': r['value'],
-                    'best_fitness_history': r['best_fitness_history']
-                }
-                for r in results
-            ]
-        }
-        json_path = os.path.join(self.output_dir, '3_1_1_d_bpso_w_history.json')
-        with open(json_path, 'w') as f:
-            json.dump(history_data, f, indent=2)
-        print(f"✓ Saved History JSON: {json_path}")
+        # Save histories (float32 .npz + index) for visualization
+        history_path = os.path.join(self.output_dir, f'{spec.name}_history.npz')
+        write_histories(
+            history_path,
+            [{'param_value': r['param_value'], 'value': r['value']} for r in results],
+            [r['best_fitness_history'] for r in results],
+            experiment=spec.name, param_name=param_name
+        )
+        print(f"✓ Saved History: {history_path}")
         
-        # Visualize
+        # Generate visualization
         df_plot = pd.DataFrame(results)
-        fig_path = os.path.join(self.output_dir, '3_1_1_d_bpso_w.png')
-        self.visualizer.plot_bpso_parameter_impact(df_plot, param_name='w', save_path=fig_path)
+        fig_path = os.path.join(self.output_dir, f'{spec.name}.png')
+        self.visualizer.plot_bpso_parameter_impact(df_plot, param_name=param_name, save_path=fig_path)
         print(f"✓ Saved Chart: {fig_path}")
         
+        if 'peak_memory_mb' in df_save:
+            fig_path = os.path.join(self.output_dir, f'{spec.name}_memory.png')
+            self.visualizer.plot_memory_impact(df_save, 'param_value', algorithm='bpso',
+                                               title=f'BPSO Memory vs {param_name}',
+                                               x_label=param_name, save_path=fig_path)
+            print(f"✓ Saved Chart: {fig_path}")
+        
         return df_plot
     
     # =========================================================================
@@ -377,63 +438,45 @@ class Chapter3Experiments:
         print(f"3.1.2: ALGORITHM COMPARISON - {test_case_name}")
         print("="*70)
         
-        test_case = self.loader.load_test_case(test_case_name)
-        items, weights, values, capacity = (
-            test_case['items'], test_case['weights'],
-            test_case['values'], test_case['capacity']
-        )
-        
-        print(f"\nTest Case: {test_case_name}")
-        print(f"Items: {len(items)}, Capacity: {capacity}\n")
-        
-        # GBFS - 5 runs
-        print("Running GBFS (5 runs)...")
-        gbfs_runs = []
-        for i in range(5):
-            r = solve_knapsack_gbfs(items, weights, values, capacity, max_states=5000)
-            gbfs_runs.append(r)
-            print(f"  Run {i+1}: Value={r['total_value']}, Time={r['execution_time']:.4f}s")
+        self._print_test_case(test_case_name)
         
-        gbfs_best = max(gbfs_runs, key=lambda x: x['total_value'])
-        print(f"→ GBFS Best: {gbfs_best['total_value']}\n")
+        sweep = self.run_sweep(comparison_sweep('3_1_2_comparison_single', [test_case_name], replicates=5))
+        runs = {}
+        best = {}
         
-        # BPSO - 5 runs
-        print("Running BPSO (5 runs)...")
-        bpso_runs = []
-        for i in range(5):
-            r = solve_knapsack_bpso(items, weights, values, capacity, n_particles=30, max_iterations=50)
-            bpso_runs.append(r)
-            print(f"  Run {i+1}: Value={r['total_value']}, Time={r['execution_time']:.4f}s")
-        
-        bpso_best = max(bpso_runs, key=lambda x: x['total_value'])
-        print(f"→ BPSO Best: {bpso_best['total_value']}\n")
+        for algorithm in ('gbfs', 'bpso'):
+            print(f"Running {algorithm.upper()} (5 runs)...")
+            runs[algorithm] = sweep.replicates(algorithm, test_case_name)
+            for i, r in enumerate(runs[algorithm]):
+                print(f"  Run {i+1}: Value={r['total_value']}, Time={r['execution_time']:.4f}s")
+            
+            best[algorithm] = max(runs[algorithm], key=lambda x: x['total_value'])
+            print(f"→ {algorithm.upper()} Best: {best[algorithm]['total_value']}\n")
         
         # Generate comparison visualization (GBFS vs BPSO only)
         fig_path = os.path.join(self.output_dir, f'3_1_2_comparison_{test_case_name.replace(" ", "_")}.png')
         self.visualizer.plot_algorithm_comparison_gbfs_bpso(
-            gbfs_best, bpso_best, save_path=fig_path
+            best['gbfs'], best['bpso'], save_path=fig_path
         )
         print(f"✓ Saved Chart: {fig_path}")
         
         # Summary CSV (GBFS vs BPSO only)
-        gbfs_mean = np.mean([r['total_value'] for r in gbfs_runs])
-        bpso_mean = np.mean([r['total_value'] for r in bpso_runs])
+        value = {a: sweep.stats(a, test_case_name, 'total_value') for a in ('gbfs', 'bpso')}
+        time_ = {a: sweep.stats(a, test_case_name, 'execution_time') for a in ('gbfs', 'bpso')}
+        gbfs_mean, bpso_mean = value['gbfs']['mean'], value['bpso']['mean']
         
         summary = {
             'algorithm': ['GBFS', 'BPSO'],
             'value_mean': [gbfs_mean, bpso_mean],
-            'value_std': [
-                np.std([r['total_value'] for r in gbfs_runs]),
-                np.std([r['total_value'] for r in bpso_runs])
-            ],
-            'value_best': [gbfs_best['total_value'], bpso_best['total_value']],
-            'time_mean': [
-                np.mean([r['execution_time'] for r in gbfs_runs]),
-                np.mean([r['execution_time'] for r in bpso_runs])
-            ],
+            'value_std': [value['gbfs']['std'], value['bpso']['std']],
+            'value_best': [best['gbfs']['total_value'], best['bpso']['total_value']],
+            'time_mean': [time_['gbfs']['mean'], time_['bpso']['mean']],
             'better_algorithm': 'GBFS' if gbfs_mean > bpso_mean else 'BPSO',
             'improvement_pct': abs((gbfs_mean - bpso_mean) / min(gbfs_mean, bpso_mean)) * 100
         }
+        memory = [sweep.memory(a, test_case_name) for a in ('gbfs', 'bpso')]
+        for column in memory[0]:
+            summary[column] = [m[column] for m in memory]
         
         df = pd.DataFrame(summary)
         csv_path = os.path.join(self.output_dir, f'3_1_2_comparison_{test_case_name.replace(" ", "_")}.csv')
@@ -448,51 +491,39 @@ class Chapter3Experiments:
         print("3.1.2: ALGORITHM COMPARISON - All 13 Test Cases")
         print("="*70)
         
-        test_cases = self.loader.list_test_cases()
+        test_cases = self.base_test_cases
+        sweep = self.run_sweep(comparison_sweep('3_1_2_comparison_all', test_cases))
         results = []
         
         for test_name in test_cases:
             print(f"\n--- {test_name} ---")
             
             test_case = self.loader.load_test_case(test_name)
-            items, weights, values, capacity = (
-                test_case['items'], test_case['weights'],
-                test_case['values'], test_case['capacity']
-            )
-            
-            # GBFS
-            gbfs_runs = [solve_knapsack_gbfs(items, weights, values, capacity, max_states=5000) 
-                        for _ in range(3)]
-            gbfs_values = [r['total_value'] for r in gbfs_runs]
-            gbfs_times = [r['execution_time'] for r in gbfs_runs]
-            
-            # BPSO
-            bpso_runs = [solve_knapsack_bpso(items, weights, values, capacity, n_particles=30, max_iterations=50) 
-                        for _ in range(3)]
-            bpso_values = [r['total_value'] for r in bpso_runs]
-            bpso_times = [r['execution_time'] for r in bpso_runs]
+            gbfs = sweep.stats('gbfs', test_name, 'total_value')
+            bpso = sweep.stats('bpso', test_name, 'total_value')
             
             # Determine better algorithm
-            gbfs_mean = np.mean(gbfs_values)
-            bpso_mean = np.mean(bpso_values)
+            gbfs_mean, bpso_mean = gbfs['mean'], bpso['mean']
             better_algo = 'GBFS' if gbfs_mean > bpso_mean else 'BPSO'
             
             results.append({
                 'test_case': test_name,
-                'n_items': len(items),
-                'capacity': capacity,
+                'n_items': len(test_case['items']),
+                'capacity': test_case['capacity'],
                 'gbfs_value': gbfs_mean,
-                'gbfs_value_std': np.std(gbfs_values),
-                'gbfs_time': np.mean(gbfs_times),
+                'gbfs_value_std': gbfs['std'],
+                'gbfs_time': sweep.stats('gbfs', test_name, 'execution_time')['mean'],
                 'bpso_value': bpso_mean,
-                'bpso_value_std': np.std(bpso_values),
-                'bpso_time': np.mean(bpso_times),
+                'bpso_value_std': bpso['std'],
+                'bpso_time': sweep.stats('bpso', test_name, 'execution_time')['mean'],
                 'better_algorithm': better_algo,
-                'improvement_pct': abs((gbfs_mean - bpso_mean) / min(gbfs_mean, bpso_mean)) * 100
+                'improvement_pct': abs((gbfs_mean - bpso_mean) / min(gbfs_mean, bpso_mean)) * 100,
+                **self._memory_columns(sweep, 'gbfs', test_name, prefix='gbfs_'),
+                **self._memory_columns(sweep, 'bpso', test_name, prefix='bpso_')
             })
             
-            print(f"  GBFS: {gbfs_mean:.1f} ± {np.std(gbfs_values):.1f}")
-            print(f"  BPSO: {bpso_mean:.1f} ± {np.std(bpso_values):.1f}")
+            print(f"  GBFS: {gbfs_mean:.1f} ± {gbfs['std']:.1f}")
+            print(f"  BPSO: {bpso_mean:.1f} ± {bpso['std']:.1f}")
             print(f"  → Better: {better_algo}")
         
         df = pd.DataFrame(results)
@@ -517,64 +548,43 @@ class Chapter3Experiments:
         print("3.1.3: DATA CHARACTERISTICS IMPACT ANALYSIS")
         print("="*70)
         
-        # Test cases for each characteristic
-        test_groups = {
-            'low_correlation': 'Data Low Correlation Medium',
-            'high_correlation': 'Data High Correlation Medium',
-            'high_value': 'Data High Value Medium',
-            'region_1': 'Region 1Regions Medium',
-            'region_3': 'Region 3Regions Medium'
-        }
-        
+        sweep = self.run_sweep(comparison_sweep('3_1_3_data_characteristics',
+                                                DATA_CHARACTERISTIC_GROUPS.values()))
         results_dict = {}
         summary_list = []
         
-        for group_name, test_name in test_groups.items():
+        for group_name, test_name in DATA_CHARACTERISTIC_GROUPS.items():
             print(f"\n--- {group_name.upper()}: {test_name} ---")
             
-            test_case = self.loader.load_test_case(test_name)
-            items, weights, values, capacity = (
-                test_case['items'], test_case['weights'],
-                test_case['values'], test_case['capacity']
-            )
-            
-            # Run all 3 algorithms (3 runs each for GBFS/BPSO)
-            print("  GBFS...", end=" ")
-            gbfs_runs = [solve_knapsack_gbfs(items, weights, values, capacity, max_states=5000) 
-                        for _ in range(3)]
-            gbfs_values = [r['total_value'] for r in gbfs_runs]
-            gbfs_times = [r['execution_time'] for r in gbfs_runs]
-            gbfs_best = max(gbfs_runs, key=lambda x: x['total_value'])
-            print(f"Mean={np.mean(gbfs_values):.1f}")
-            
-            print("  BPSO...", end=" ")
-            bpso_runs = [solve_knapsack_bpso(items, weights, values, capacity, n_particles=30, max_iterations=50) 
-                        for _ in range(3)]
-            bpso_values = [r['total_value'] for r in bpso_runs]
-            bpso_times = [r['execution_time'] for r in bpso_runs]
-            bpso_best = max(bpso_runs, key=lambda x: x['total_value'])
-            print(f"Mean={np.mean(bpso_values):.1f}")
+            # GBFS/BPSO (3 runs each)
+            best = {}
+            stats = {}
+            for algorithm in ('gbfs', 'bpso'):
+                runs = sweep.replicates(algorithm, test_name)
+                best[algorithm] = max(runs, key=lambda x: x['total_value'])
+                stats[algorithm] = (sweep.stats(algorithm, test_name, 'total_value'),
+                                    sweep.stats(algorithm, test_name, 'execution_time'))
+                print(f"  {algorithm.upper()}... Mean={stats[algorithm][0]['mean']:.1f}")
             
             # Store for visualization (GBFS vs BPSO only)
-            results_dict[group_name] = {
-                'gbfs': gbfs_best,
-                'bpso': bpso_best
-            }
+            results_dict[group_name] = best
             
             # Determine better algorithm
-            gbfs_mean = np.mean(gbfs_values)
-            bpso_mean = np.mean(bpso_values)
+            gbfs_mean = stats['gbfs'][0]['mean']
+            bpso_mean = stats['bpso'][0]['mean']
             
             # Add to summary
             summary_list.append({
                 'characteristic': group_name,
                 'test_case': test_name,
                 'gbfs_value': gbfs_mean,
-                'gbfs_time': np.mean(gbfs_times),
+                'gbfs_time': stats['gbfs'][1]['mean'],
                 'bpso_value': bpso_mean,
-                'bpso_time': np.mean(bpso_times),
+                'bpso_time': stats['bpso'][1]['mean'],
                 'better_algorithm': 'GBFS' if gbfs_mean > bpso_mean else 'BPSO',
-                'improvement_pct': abs((gbfs_mean - bpso_mean) / min(gbfs_mean, bpso_mean)) * 100
+                'improvement_pct': abs((gbfs_mean - bpso_mean) / min(gbfs_mean, bpso_mean)) * 100,
+                **self._memory_columns(sweep, 'gbfs', test_name, prefix='gbfs_'),
+                **self._memory_columns(sweep, 'bpso', test_name, prefix='bpso_')
             })
         
         # Save CSV
@@ -590,12 +600,146 @@ class Chapter3Experiments:
         
         return df
     
+    # =========================================================================
+    # 3.1.4. KHẢ NĂNG MỞ RỘNG (Scaling Analysis)
+    # =========================================================================
+    
+    def generate_scaling_suite(self):
+        """
+        Sinh (hoặc dùng lại) các instance của 3.1.4 trong <output_dir>/.cache/generated
+        và đăng ký chúng với loader
+        
+        Returns:
+            Danh sách (factor, params, name) như scaling_points()
+        """
+        out_dir = os.path.join(self.output_dir, '.cache', 'generated')
+        points = scaling_points()
+        rows = {}
+        for _, p, name in points:
+            if name in rows:
+                continue
+            meta = read_cache_meta(os.path.join(out_dir, name.replace(' ', '_').lower()))
+            if meta is not None and 'summary' in meta:
+                rows[name] = meta['summary']
+            else:
+                rows[name] = generate_instance(p['n_items'], out_dir, preset='size', seed=SCALING_SEED,
+                                               name=name, capacity_ratio=p['capacity_ratio'],
+                                               n_regions=p['n_regions'])
+        summary_path = os.path.join(out_dir, 'summary.csv')
+        write_summary(list(rows.values()), summary_path)
+        self.register_suite(summary_path, out_dir)
+        return points
+    
+    def experiment_3_1_4_scaling(self):
+        """
+        Thời gian, bộ nhớ và chất lượng lời giải khi tăng kích thước bài toán:
+        - n_items: 100 → 30000 (capacity 15%, 4 regions)
+        - capacity_ratio: 5% → 50% (n = 1000)
+        - n_regions: 1 → 16 (n = 1000)
+        
+        Ngân sách solver cố định (SCALING_SOLVERS), không tăng theo n.
+        Chất lượng = total_value / cận trên LP, trung bình trên các run khả thi
+        (NaN nếu không run nào khả thi); tỉ lệ khả thi ghi riêng (feasible_rate).
+        Số mũ thực nghiệm: time ~ x^b, memory ~ x^b (hồi quy log-log).
+        """
+        print("\n" + "="*70)
+        print("3.1.4: SCALING ANALYSIS (n, capacity, regions)")
+        print("="*70)
+        
+        points = self.generate_scaling_suite()
+        names = list(dict.fromkeys(name for _, _, name in points))
+        solvers = SCALING_SOLVERS
+        # Thời gian từ các run thường; bộ nhớ từ một run riêng dưới tracemalloc
+        spec = SweepSpec(name='3_1_4_scaling', solvers=solvers, instances=names, replicates=3)
+        timing = self.run_sweeps([spec, spec.memory_spec()])[spec.name]
+        
+        bounds = {}
+        results = []
+        for factor, p, name in points:
+            test_case = self.loader.load_test_case(name)
+            if name not in bounds:
+                bounds[name] = fractional_upper_bound(test_case['weights'], test_case['values'],
+                                                      test_case['capacity'])
+            for algorithm in solvers:
+                runs = timing.replicates(algorithm, name)
+                feasible = [r['total_weight'] <= test_case['capacity'] for r in runs]
+                quality = [r['total_value'] / bounds[name] for r, ok in zip(runs, feasible) if ok]
+                time_stats = timing.stats(algorithm, name, 'execution_time')
+                results.append({
+                    'factor': factor,
+                    'algorithm': algorithm,
+                    'test_case': name,
+                    'n_items': p['n_items'],
+                    'capacity_ratio': p['capacity_ratio'],
+                    'n_regions': p['n_regions'],
+                    'capacity': test_case['capacity'],
+                    'time_mean': time_stats['mean'],
+                    'time_std': time_stats['std'],
+                    'value_mean': timing.stats(algorithm, name, 'total_value')['mean'],
+                    'quality_mean': np.mean(quality) if quality else np.nan,
+                    'feasible_rate': np.mean(feasible),
+                    'peak_memory_mb': timing.memory(algorithm, name)['peak_memory_mb']
+                })
+            print(f"  {name}: " + ", ".join(
+                f"{r['algorithm'].upper()} {r['time_mean']:.3f}s q={r['quality_mean']:.3f} "
+                f"feasible={r['feasible_rate']:.0%}"
+                for r in results[-len(solvers):]))
+        df = pd.DataFrame(results)
+        
+        # Số mũ thực nghiệm theo từng yếu tố (capacity tính theo giá trị tuyệt đối)
+        exponents = []
+        for (factor, algorithm), group in df.groupby(['factor', 'algorithm'], sort=False):
+            x = group['capacity'] if factor == 'capacity_ratio' else group[factor]
+            time_exp, time_r2 = fit_exponent(x, group['time_mean'])
+            mem_exp, mem_r2 = fit_exponent(x, group['peak_memory_mb'])
+            exponents.append({
+                'factor': 'capacity' if factor == 'capacity_ratio' else factor,
+                'algorithm': algorithm,
+                'time_exponent': time_exp,
+                'time_r2': time_r2,
+                'memory_exponent': mem_exp,
+                'memory_r2': mem_r2,
+                'quality_min': group['quality_mean'].min(),
+                'quality_at_max': group.loc[x.idxmax(), 'quality_mean'],
+                'feasible_rate_min': group['feasible_rate'].min(),
+                'budget': SCALING_BUDGET_NOTE[algorithm]
+            })
+            print(f"  {algorithm.upper()} vs {exponents[-1]['factor']}: "
+                  f"time ~ x^{time_exp:.2f} (R²={time_r2:.2f}), memory ~ x^{mem_exp:.2f}")
+        df_exp = pd.DataFrame(exponents)
+        
+        csv_path = os.path.join(self.output_dir, '3_1_4_scaling.csv')
+        df.to_csv(csv_path, index=False)
+        print(f"\n✓ Saved CSV: {csv_path}")
+        exp_path = os.path.join(self.output_dir, '3_1_4_scaling_exponents.csv')
+        df_exp.to_csv(exp_path, index=False)
+        print(f"✓ Saved CSV: {exp_path}")
+        
+        fig_path = os.path.join(self.output_dir, '3_1_4_scaling.png')
+        self.visualizer.plot_scaling_analysis(df, df_exp, save_path=fig_path,
+                                              budget_note=SCALING_BUDGET_NOTE)
+        print(f"✓ Saved Chart: {fig_path}\n")
+        
+        return df
+    
+    # =========================================================================
+    # CUSTOM SWEEPS (--spec file.json / file.toml)
+    # =========================================================================
+    
+    def run_spec_file(self, path):
+        """Chạy các sweep khai báo trong file, mỗi sweep ghi <name>.csv (mean/std/best/worst)"""
+        specs = load_sweep_specs(path)
+        for name, sweep in self.run_sweeps(specs).items():
+            csv_path = os.path.join(self.output_dir, f'{name}.csv')
+            pd.DataFrame(sweep.rows()).to_csv(csv_path, index=False)
+            print(f"✓ Saved CSV: {csv_path}")
+    
     # =========================================================================
     # RUN ALL EXPERIMENTS
     # =========================================================================
     
     def run_all_experiments(self):
-        """Chạy tất cả experiments cho Chapter 3"""
+        """Chạy tất cả experiments cho Chapter 3; trả về True nếu không có lỗi"""
         print("\n" + "="*80)
         print(" " * 20 + "CHƯƠNG 3: PHÂN TÍCH VÀ ĐÁNH GIÁ")
         print(" " * 15 + "Knapsack Problem - Learning from GA_TSP")
@@ -608,9 +752,17 @@ class Chapter3Experiments:
             ("3.1.1.d", "BPSO Inertia Weight", self.experiment_3_1_1_d_bpso_inertia_weight),
             ("3.1.2", "Algorithm Comparison (Single)", lambda: self.experiment_3_1_2_algorithm_comparison_single('Size Medium 50')),
             ("3.1.2", "Algorithm Comparison (All)", self.experiment_3_1_2_algorithm_comparison_all),
-            ("3.1.3", "Data Characteristics", self.experiment_3_1_3_data_characteristics)
+            ("3.1.3", "Data Characteristics", self.experiment_3_1_3_data_characteristics),
+            ("3.1.4", "Scaling Analysis", self.experiment_3_1_4_scaling)
         ]
         
+        # Lên lịch tất cả runs một lần: bỏ trùng giữa experiments, song song tối đa
+        try:
+            self.run_sweeps(self.all_sweeps())
+        except Exception as e:
+            print(f"\n❌ Error while scheduling runs: {e}")
+        
+        failed = 0
         for exp_id, exp_name, exp_func in experiments:
             try:
                 print(f"\n{'='*70}")
@@ -621,14 +773,21 @@ class Chapter3Experiments:
                 
                 print(f"\n✅ Completed: [{exp_id}] {exp_name}")
             except Exception as e:
+                failed += 1
                 print(f"\n❌ Error in [{exp_id}] {exp_name}: {str(e)}")
+                print("   Các run đã xong được giữ lại, chạy lại để tiếp tục")
                 import traceback
                 traceback.print_exc()
         
+        self.close()
+        if not failed:
+            self.finish_sweep()
+        
         print("\n" + "="*80)
         print("ALL EXPERIMENTS COMPLETED!")
         print(f"Results saved to: {self.output_dir}/")
         print("="*80)
+        return not failed
 
 
 def main():
@@ -637,30 +796,57 @@ def main():
     
     parser = argparse.ArgumentParser(description='Chapter 3 Experiments - Following GA_TSP')
     parser.add_argument('--experiment', type=str, default='all',
-                       help='Experiment to run: all, 3.1.1a, 3.1.1b, 3.1.1c, 3.1.1d, 3.1.2, 3.1.3')
+                       help='Experiment to run: all, 3.1.1a, 3.1.1b, 3.1.1c, 3.1.1d, 3.1.2, 3.1.3, 3.1.4')
+    parser.add_argument('--workers', type=int, default=1,
+                       help='Số process chạy song song (default: 1, tuần tự)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Không dùng cache kết quả (chạy lại tất cả runs)')
+    parser.add_argument('--resume', action='store_true',
+                       help='Với --no-cache: tiếp tục sweep bị dừng từ checkpoint')
+    parser.add_argument('--profile', action='store_true',
+                       help='Ghi profile theo phase của solver (<sweep>_profile.csv)')
+    parser.add_argument('--memory', action='store_true',
+                       help='Đo bộ nhớ (1 run tracemalloc thêm mỗi ô), thêm cột/chart bộ nhớ')
+    parser.add_argument('--spec', type=str, default=None,
+                       help='Chạy các sweep khai báo trong file JSON/TOML thay cho --experiment')
     
     args = parser.parse_args()
     
-    exp_runner = Chapter3Experiments()
-    
-    if args.experiment == 'all':
-        exp_runner.run_all_experiments()
-    elif args.experiment == '3.1.1a':
-        exp_runner.experiment_3_1_1_a_gbfs_parameters()
-    elif args.experiment == '3.1.1b':
-        exp_runner.experiment_3_1_1_b_bpso_swarm_size()
-    elif args.experiment == '3.1.1c':
-        exp_runner.experiment_3_1_1_c_bpso_iterations()
-    elif args.experiment == '3.1.1d':
-        exp_runner.experiment_3_1_1_d_bpso_inertia_weight()
-    elif args.experiment == '3.1.2':
-        exp_runner.experiment_3_1_2_algorithm_comparison_single()
-        exp_runner.experiment_3_1_2_algorithm_comparison_all()
-    elif args.experiment == '3.1.3':
-        exp_runner.experiment_3_1_3_data_characteristics()
-    else:
-        print(f"Unknown experiment: {args.experiment}")
-        print("Available: all, 3.1.1a, 3.1.1b, 3.1.1c, 3.1.1d, 3.1.2, 3.1.3")
+    exp_runner = Chapter3Experiments(workers=args.workers, use_cache=not args.no_cache,
+                                     resume=args.resume, profile=args.profile,
+                                     track_memory=args.memory)
+    
+    # Lỗi (exception) giữ lại checkpoint để --resume; mọi nhánh chạy xong
+    # thành công (kể cả --spec) xóa checkpoint
+    completed = True
+    try:
+        if args.spec:
+            exp_runner.run_spec_file(args.spec)
+        elif args.experiment == 'all':
+            completed = exp_runner.run_all_experiments()
+        elif args.experiment == '3.1.1a':
+            exp_runner.experiment_3_1_1_a_gbfs_parameters()
+        elif args.experiment == '3.1.1b':
+            exp_runner.experiment_3_1_1_b_bpso_swarm_size()
+        elif args.experiment == '3.1.1c':
+            exp_runner.experiment_3_1_1_c_bpso_iterations()
+        elif args.experiment == '3.1.1d':
+            exp_runner.experiment_3_1_1_d_bpso_inertia_weight()
+        elif args.experiment == '3.1.2':
+            exp_runner.experiment_3_1_2_algorithm_comparison_single()
+            exp_runner.experiment_3_1_2_algorithm_comparison_all()
+        elif args.experiment == '3.1.3':
+            exp_runner.experiment_3_1_3_data_characteristics()
+        elif args.experiment == '3.1.4':
+            exp_runner.experiment_3_1_4_scaling()
+        else:
+            print(f"Unknown experiment: {args.experiment}")
+            print("Available: all, 3.1.1a, 3.1.1b, 3.1.1c, 3.1.1d, 3.1.2, 3.1.3, 3.1.4")
+            completed = False  # Không chạy gì: giữ nguyên checkpoint
+    finally:
+        exp_runner.close()
+    if completed:
+        exp_runner.finish_sweep()
 
 
 if __name__ == '__main__':
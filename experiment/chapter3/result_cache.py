@@ -0,0 +1,123 @@
+"""
+=================================================================================
+CHƯƠNG 3: RESULT CACHE - Content-Addressed Run Results
+=================================================================================
+Kết quả của mỗi Run được lưu theo key:
+  sha256(algorithm, params, use_regions, seed, instance content, solver source)
+  (+ track_memory / profile khi bật: kết quả có thêm MEMORY_METRICS / 'profile')
+
+- instance content: hash của weights/values/regions/capacity của test case
+  (sửa CSV -> key mới)
+- solver source: hash của src/algorithms/*.py (sửa solver -> key mới)
+- seed: seed của run (BPSO); thuật toán không dùng seed (GBFS) dùng run_id
+  để mỗi lần lặp vẫn là một kết quả riêng (mean/std thời gian)
+
+Mỗi kết quả là một file JSON trong <cache_dir>/<2 ký tự đầu>/<key>.json,
+ghi atomic (tmp + os.replace). CSV/JSON/plot được dựng lại từ kết quả này.
+=================================================================================
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+
+from experiment.chapter3.runner import MEMORY_METRICS
+
+ALGORITHMS_DIR = Path(__file__).resolve().parent.parent.parent / 'src' / 'algorithms'
+
+_solver_hash = None
+
+
+def solver_source_hash() -> str:
+    """Hash of the solver sources (src/algorithms/*.py), computed once per process"""
+    global _solver_hash
+    if _solver_hash is None:
+        digest = hashlib.sha256()
+        for path in sorted(ALGORITHMS_DIR.glob('*.py')):
+            digest.update(path.name.encode())
+            digest.update(path.read_bytes())
+        _solver_hash = digest.hexdigest()
+    return _solver_hash
+
+
+def instance_digest(test_case: Dict) -> str:
+    """Hash of the instance content a solver sees (weights, values, regions, capacity)"""
+    digest = hashlib.sha256()
+    digest.update(np.ascontiguousarray(test_case['weights'], dtype=np.float64).tobytes())
+    digest.update(np.ascontiguousarray(test_case['values'], dtype=np.float64).tobytes())
+    regions = test_case.get('regions')
+    if regions is not None:
+        digest.update('\x1f'.join('' if r is None else str(r) for r in regions).encode())
+    digest.update(str(int(test_case['capacity'])).encode())
+    return digest.hexdigest()
+
+
+def _to_json(value):
+    """numpy scalars/arrays -> plain JSON types"""
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class RunCache:
+    """On-disk cache of run results keyed by content hash"""
+
+    def __init__(self, cache_dir):
+        self.cache_dir = Path(cache_dir)
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, run, test_case: Dict, seeded: bool) -> str:
+        """Cache key of a Run on a loaded test case"""
+        fields = {
+            'algorithm': run.algorithm,
+            'params': [list(p) for p in run.params],
+            'use_regions': run.use_regions,
+            'seed': run.seed if seeded else run.run_id,
+            'instance': instance_digest(test_case),
+            'solver': solver_source_hash()
+        }
+        # Only in the key when set, so keys of plain runs are unchanged
+        if run.track_memory:
+            fields['track_memory'] = list(MEMORY_METRICS)
+        if run.profile:
+            fields['profile'] = True
+        payload = json.dumps(fields, sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f'{key}.json'
+
+    def get(self, key: str):
+        """Cached result or None"""
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                result = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return result
+
+    def put(self, key: str, result: Dict) -> Dict:
+        """
+        Store a result atomically
+        
+        Returns the result as it will be read back from the cache, so fresh
+        and cached runs produce identical outputs.
+        """
+        text = json.dumps(result, default=_to_json)
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.json.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+        return json.loads(text)
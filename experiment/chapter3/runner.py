@@ -0,0 +1,194 @@
+"""
+=================================================================================
+CHƯƠNG 3: RUN EXECUTION - Serial / Process Pool
+=================================================================================
+Mỗi lần chạy solver trong experiments là một Run độc lập:
+  (algorithm, test case, params, run_id)
+
+- Seed của mỗi run được suy ra từ hash của (algorithm, params, test case,
+  run_id), nên kết quả không phụ thuộc vào thứ tự hay số worker
+- run_all() chạy tuần tự (prefetch test case kế tiếp trong background) hoặc
+  trên process pool; kết quả luôn trả về theo thứ tự của runs
+- Worker tự load test case (LRU cache riêng mỗi process) và bỏ
+  particle_history khỏi kết quả (không dùng trong experiments); các suite
+  đăng ký thêm (vd instance sinh bởi data_generator) được truyền cho worker
+- Run với track_memory=True chạy dưới tracemalloc và thêm MEMORY_METRICS
+  vào kết quả: peak_memory (bytes, tracemalloc), gc_collections (số lần GC
+  chạy trong lúc giải = mức cấp phát object Python), rss_peak (bytes, high-
+  water mark của process, tính cả các run trước trong cùng worker); thời
+  gian của run đó bị tracing làm chậm
+- Run với profile=True gọi solver với profile=True (field 'profile': thời
+  gian/counter theo phase, src/algorithms/profiling.py); seed không đổi
+- Với RunCache (result_cache.py), chỉ các run chưa có trong cache được chạy;
+  mỗi run được lưu ngay khi xong, nên sweep bị dừng giữa chừng chỉ mất
+  các run đang chạy dở
+=================================================================================
+"""
+
+import gc
+import hashlib
+import json
+import resource
+import sys
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Dict, List
+
+from src.algorithms import solve_knapsack_gbfs, solve_knapsack_bpso
+
+SOLVERS = {
+    'gbfs': solve_knapsack_gbfs,
+    'bpso': solve_knapsack_bpso
+}
+
+# Algorithms whose result depends on a random seed
+SEEDED_ALGORITHMS = ('bpso',)
+
+# Result fields added by track_memory runs (part of their cache key)
+MEMORY_METRICS = ('peak_memory', 'gc_collections', 'rss_peak')
+
+
+@dataclass(frozen=True)
+class Run:
+    """One solver run (hashable, so identical runs can be shared)"""
+    algorithm: str
+    test_case: str
+    params: tuple = ()        # Sorted (name, value) pairs
+    run_id: int = 0
+    use_regions: bool = True  # Pass region data (coverage objective)
+    track_memory: bool = False  # Measure peak traced allocation
+    profile: bool = False  # Per-phase solver profile in the result
+
+    @classmethod
+    def make(cls, algorithm, test_case, params=None, run_id=0, use_regions=True,
+             track_memory=False, profile=False):
+        if algorithm not in SOLVERS:
+            raise ValueError(f"Unknown algorithm: {algorithm}")
+        return cls(algorithm, test_case, tuple(sorted((params or {}).items())),
+                   run_id, use_regions, track_memory, profile)
+
+    @property
+    def seed(self) -> int:
+        """Deterministic per-run seed from (algorithm, params, test case, run_id)"""
+        key = json.dumps([self.algorithm, list(self.params), self.test_case,
+                          self.run_id, self.use_regions])
+        return int.from_bytes(hashlib.sha256(key.encode()).digest()[:4], 'little')
+
+
+_worker_loader = None
+
+
+def _init_worker(test_cases_dir, suites=()):
+    """Process pool initializer: one TestCaseLoader per worker (plus extra suites)"""
+    global _worker_loader
+    from src.utils import TestCaseLoader
+    _worker_loader = TestCaseLoader(test_cases_dir)
+    for summary_path, base_dir in suites:
+        _worker_loader.register_instances(summary_path, base_dir)
+
+
+def execute_run(run: Run, loader=None) -> Dict:
+    """Run one solver call and return its result (without particle_history)"""
+    test_case = (loader or _worker_loader).load_test_case(run.test_case)
+    params = dict(run.params)
+    if run.algorithm in SEEDED_ALGORITHMS:
+        params.setdefault('seed', run.seed)
+    if run.profile:
+        params['profile'] = True
+
+    if run.track_memory:
+        gc_before = _gc_collections()
+        tracemalloc.start()
+    try:
+        result = SOLVERS[run.algorithm](
+            test_case['items'], test_case['weights'],
+            test_case['values'], test_case['capacity'],
+            regions=test_case.get('regions') if run.use_regions else None,
+            **params
+        )
+        if run.track_memory:
+            result['peak_memory'] = tracemalloc.get_traced_memory()[1]
+            result['gc_collections'] = _gc_collections() - gc_before
+            result['rss_peak'] = _rss_peak()
+    finally:
+        if run.track_memory:
+            tracemalloc.stop()
+    result.pop('particle_history', None)
+    return result
+
+
+def _gc_collections() -> int:
+    """Garbage collector runs so far (all generations)"""
+    return sum(stats['collections'] for stats in gc.get_stats())
+
+
+def _rss_peak() -> int:
+    """RSS high-water mark of this process in bytes"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024  # Linux reports kilobytes
+
+
+def make_pool(workers, test_cases_dir='data/test_cases', suites=()):
+    """
+    Process pool whose workers load test cases from test_cases_dir
+
+    Args:
+        suites: Extra (summary_path, base_dir) pairs registered in every worker
+    """
+    return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                               initargs=(str(test_cases_dir), tuple(suites)))
+
+
+def run_all(runs: List[Run], loader, pool=None, cache=None) -> List[Dict]:
+    """
+    Execute runs, returning results in the order of runs
+
+    Args:
+        runs: Runs to execute
+        loader: TestCaseLoader for serial execution (and cache keys)
+        pool: Process pool from make_pool() (None: serial, in-process)
+        cache: RunCache; cached runs are not executed, new results are stored
+    """
+    if cache is None:
+        results = [None] * len(runs)
+        for i, result in _iter_completed(runs, loader, pool):
+            results[i] = result
+        return results
+
+    keys = [cache.key(run, loader.load_test_case(run.test_case),
+                      run.algorithm in SEEDED_ALGORITHMS) for run in runs]
+    results = [cache.get(key) for key in keys]
+    missing = [i for i, result in enumerate(results) if result is None]
+    # Store each run as soon as it finishes (per-cell checkpoint)
+    for j, result in _iter_completed([runs[i] for i in missing], loader, pool):
+        results[missing[j]] = cache.put(keys[missing[j]], result)
+    return results
+
+
+def _iter_completed(runs, loader, pool):
+    """Execute runs serially or on the pool, yielding (index, result) as each finishes"""
+    if not runs:
+        return
+    if pool is not None:
+        futures = {pool.submit(execute_run, run): i for i, run in enumerate(runs)}
+        try:
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+        return
+
+    # Serial: load test case k+1 in background while runs on test case k execute
+    names = list(dict.fromkeys(run.test_case for run in runs))
+    prefetch = loader.iter_test_cases(names)
+    started = set()
+    try:
+        for i, run in enumerate(runs):
+            if run.test_case not in started:
+                started.add(run.test_case)
+                next(prefetch, None)
+            yield i, execute_run(run, loader)
+    finally:
+        prefetch.close()
@@ -0,0 +1,188 @@
+"""
+=================================================================================
+CHƯƠNG 3: SWEEP SPEC - Khai báo experiment thay cho vòng lặp viết tay
+=================================================================================
+Một SweepSpec mô tả:
+  solvers     : algorithm -> params cố định, vd {'bpso': {'max_iterations': 50}}
+  instances   : tên test cases
+  grid        : params được quét (tích Descartes), áp dụng cho mọi solver
+  replicates  : số lần chạy mỗi ô (run_id 0..replicates-1)
+  use_regions : truyền region data cho solver hay không
+  track_memory: đo bộ nhớ (runner.MEMORY_METRICS) của mỗi run; thường dùng
+                qua memory_spec(): thêm 1 run đo bộ nhớ mỗi ô, thời gian vẫn
+                lấy từ các run không tracing
+  profile     : solver ghi 'profile' theo phase (gộp bằng SweepResult.profile)
+  metrics     : các khóa kết quả được tổng hợp (mean/std/best/worst)
+
+Mỗi ô (algorithm, instance, grid point) x replicate là một Run (runner.py).
+expand_runs() gộp runs của nhiều spec và bỏ trùng, nên các experiment dùng
+chung cấu hình (vd 3.1.2 và 3.1.3) chỉ giải mỗi run một lần.
+
+Spec có thể khai báo trong Python hoặc file JSON/TOML:
+  {"sweeps": [{"name": "bpso_w", "solvers": {"bpso": {"n_particles": 30}},
+               "instances": ["Size Medium 50"], "grid": {"w": [0.5, 0.7]},
+               "replicates": 5}]}
+=================================================================================
+"""
+
+import dataclasses
+import itertools
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from src.algorithms.profiling import merge_profiles
+from experiment.chapter3.runner import Run, SOLVERS
+
+
+@dataclass
+class SweepSpec:
+    """Declarative parameter sweep"""
+    name: str
+    solvers: Dict[str, Dict]
+    instances: Tuple[str, ...]
+    grid: Dict[str, Tuple] = field(default_factory=dict)
+    replicates: int = 3
+    use_regions: bool = True
+    track_memory: bool = False
+    profile: bool = False
+    metrics: Tuple[str, ...] = ('total_value', 'execution_time')
+
+    def __post_init__(self):
+        for algorithm in self.solvers:
+            if algorithm not in SOLVERS:
+                raise ValueError(f"Sweep '{self.name}': unknown algorithm '{algorithm}'")
+        self.instances = tuple(self.instances)
+        self.grid = {param: tuple(values) for param, values in self.grid.items()}
+        self.metrics = tuple(self.metrics)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'SweepSpec':
+        return cls(**data)
+
+    def memory_spec(self) -> 'SweepSpec':
+        """Companion sweep: one track_memory run per cell (replicate 0)"""
+        return dataclasses.replace(self, name=f'{self.name}_memory', replicates=1,
+                                   track_memory=True)
+    
+    def points(self) -> List[Dict]:
+        """Grid points (cartesian product, in declaration order)"""
+        names = list(self.grid)
+        return [dict(zip(names, values)) for values in itertools.product(*self.grid.values())]
+
+    def cell_runs(self, algorithm: str, instance: str, point: Dict = None) -> List[Run]:
+        """Replicate runs of one cell"""
+        params = {**self.solvers[algorithm], **(point or {})}
+        return [Run.make(algorithm, instance, params, run_id, self.use_regions,
+                         self.track_memory, self.profile)
+                for run_id in range(self.replicates)]
+
+    def runs(self) -> List[Run]:
+        """All runs, replicates of a cell adjacent"""
+        return [run
+                for instance in self.instances
+                for algorithm in self.solvers
+                for point in self.points()
+                for run in self.cell_runs(algorithm, instance, point)]
+
+
+def load_sweep_specs(path) -> List[SweepSpec]:
+    """Read sweep specs from a JSON or TOML file ({"sweeps": [...]})"""
+    path = Path(path)
+    if path.suffix == '.toml':
+        import tomllib  # Python 3.11+
+        with open(path, 'rb') as f:
+            data = tomllib.load(f)
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    return [SweepSpec.from_dict(entry) for entry in data['sweeps']]
+
+
+def expand_runs(specs: List[SweepSpec]) -> List[Run]:
+    """Runs of all specs, identical runs shared (first occurrence order)"""
+    return list(dict.fromkeys(run for spec in specs for run in spec.runs()))
+
+
+class SweepResult:
+    """Results of a sweep, addressed by (algorithm, instance, grid point)"""
+
+    def __init__(self, spec: SweepSpec, results: Dict[Run, Dict]):
+        self.spec = spec
+        self._results = results
+
+    def replicates(self, algorithm: str, instance: str, **point) -> List[Dict]:
+        """Result dicts of the replicates of one cell"""
+        return [self._results[run] for run in self.spec.cell_runs(algorithm, instance, point)]
+
+    def stats(self, algorithm: str, instance: str, metric: str, **point) -> Dict:
+        """mean / std / best / worst of a metric over the replicates of a cell"""
+        values = [r[metric] for r in self.replicates(algorithm, instance, **point)]
+        return {
+            'mean': np.mean(values),
+            'std': np.std(values),
+            'best': max(values),
+            'worst': min(values)
+        }
+
+    def memory(self, algorithm: str, instance: str, **point) -> Dict:
+        """
+        Memory of a cell from its memory_spec() run
+        
+        Returns:
+            {'peak_memory_mb', 'gc_collections', 'rss_peak_mb'}, or {} when
+            the memory run was not scheduled
+        """
+        run, = self.spec.memory_spec().cell_runs(algorithm, instance, point)
+        result = self._results.get(run)
+        if result is None:
+            return {}
+        return {
+            'peak_memory_mb': result['peak_memory'] / 2**20,
+            'gc_collections': result['gc_collections'],
+            'rss_peak_mb': result['rss_peak'] / 2**20
+        }
+    
+    def profile(self, algorithm: str, instance: str, **point) -> Dict:
+        """Solver profiles of the replicates of a cell, summed (merge_profiles)"""
+        return merge_profiles([r.get('profile') for r in self.replicates(algorithm, instance, **point)])
+    
+    def profile_rows(self) -> List[Dict]:
+        """One row per cell and phase / counter of the merged profiles"""
+        rows = []
+        for instance in self.spec.instances:
+            for algorithm in self.spec.solvers:
+                for point in self.spec.points():
+                    profile = self.profile(algorithm, instance, **point)
+                    if not profile['runs']:
+                        continue
+                    cell = {'algorithm': algorithm, 'test_case': instance, **point}
+                    total = profile['profiled_time']
+                    for phase, stats in profile['phases'].items():
+                        rows.append({**cell, 'kind': 'phase', 'name': phase,
+                                     'total': stats['time'],
+                                     'per_run': stats['time'] / profile['runs'],
+                                     'calls': stats['calls'],
+                                     'share': stats['time'] / total if total > 0 else 0.0})
+                    for name, value in profile['counters'].items():
+                        per_run = value if name.startswith('max_') else value / profile['runs']
+                        rows.append({**cell, 'kind': 'counter', 'name': name,
+                                     'total': value, 'per_run': per_run})
+        return rows
+    
+    def rows(self) -> List[Dict]:
+        """One row per cell with the statistics of every metric"""
+        rows = []
+        for instance in self.spec.instances:
+            for algorithm in self.spec.solvers:
+                for point in self.spec.points():
+                    row = {'algorithm': algorithm, 'test_case': instance, **point}
+                    for metric in self.spec.metrics:
+                        for stat, value in self.stats(algorithm, instance, metric, **point).items():
+                            row[f'{metric}_{stat}'] = value
+                    row.update(self.memory(algorithm, instance, **point))
+                    rows.append(row)
+        return rows
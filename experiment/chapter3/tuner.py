@@ -0,0 +1,303 @@
+"""
+=================================================================================
+CHƯƠNG 3: PARAMETER TUNER - Racing / Successive Halving
+=================================================================================
+Thay vì chạy cùng số lần cho mọi điểm trong grid (3.1.1.a-d), tuner:
+
+1. Lấy mẫu nhiều cấu hình từ không gian tham số (BPSO: n_particles,
+   max_iterations, w, c1, c2; GBFS: max_states)
+2. Mỗi vòng, các cấu hình còn sống được đánh giá thêm trên các cặp
+   (test case, replicate) của một lớp test case (cột Type trong
+   test_cases_summary.csv); ngân sách mỗi cấu hình nhân eta sau mỗi vòng
+3. Loại sớm cấu hình bị trội có ý nghĩa thống kê (paired t-test một phía
+   so với cấu hình tốt nhất, alpha=0.05, trên score trung bình mỗi test
+   case: bậc tự do = số test case - 1, replicate không phải quan sát độc
+   lập), sau đó giữ top 1/eta
+
+Chỉ solver có seed (runner.SEEDED_ALGORITHMS, vd BPSO) được chạy nhiều
+replicate (seed khác nhau theo run_id); GBFS tất định nên 1 replicate.
+
+Score của một run đo đúng mục tiêu mà solver tối ưu, chia cho cận trên
+của mục tiêu đó trên test case (0 nếu vượt capacity), nên các test case
+trong cùng lớp so sánh được với nhau:
+- Mặc định use_regions=False: solver chỉ tối ưu doanh thu, score =
+  total_value / tối ưu DP (chính xác)
+- --regions (use_regions=True): solver tối ưu 0.7*f1 + 0.3*f2 (doanh thu
+  chuẩn hóa + độ phủ region), score = fitness / (0.7*DP/tổng value + 0.3)
+
+Runs đi qua Chapter3Experiments.run_grid: dùng chung cache kết quả với
+experiments (run đã có không chạy lại), chạy song song với --workers.
+
+Usage:
+    python experiment/chapter3/tuner.py --algorithm bpso --configs 32 --workers 4
+=================================================================================
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+import math
+import numpy as np
+import pandas as pd
+from typing import Dict, List
+
+from src.algorithms import solve_knapsack_dp
+from experiment.chapter3.runner import Run, SEEDED_ALGORITHMS
+
+ALPHA = 0.7  # Trọng số doanh thu trong fitness của GBFS/BPSO (mặc định của solver)
+
+# Không gian tham số mặc định
+PARAMETER_SPACES = {
+    'bpso': {
+        'n_particles': [10, 20, 30, 50, 70],
+        'max_iterations': [30, 50, 100, 150],
+        'w': [0.3, 0.5, 0.7, 0.9],
+        'c1': [1.0, 1.5, 2.0, 2.5],
+        'c2': [1.0, 1.5, 2.0, 2.5]
+    },
+    'gbfs': {
+        'max_states': [500, 1000, 2000, 3000, 5000, 7000, 10000]
+    }
+}
+
+# t tới hạn một phía, alpha = 0.05, theo bậc tự do (df > 30: phân phối chuẩn)
+_T_CRITICAL = [6.314, 2.920, 2.353, 2.132, 2.015, 1.943, 1.895, 1.860, 1.833, 1.812,
+               1.796, 1.782, 1.771, 1.761, 1.753, 1.746, 1.740, 1.734, 1.729, 1.725,
+               1.721, 1.717, 1.714, 1.711, 1.708, 1.706, 1.703, 1.701, 1.699, 1.697]
+
+
+def t_critical(df: int) -> float:
+    """One-sided 5% critical value of Student's t"""
+    return _T_CRITICAL[df - 1] if df <= len(_T_CRITICAL) else 1.645
+
+
+def sample_configurations(space: Dict[str, List], n_configs: int, seed: int = 0) -> List[Dict]:
+    """
+    Up to n_configs distinct configurations from a parameter space
+
+    The full grid is used when it is small enough, otherwise a seeded
+    random sample of it.
+    """
+    names = list(space)
+    sizes = [len(space[name]) for name in names]
+    n_total = int(np.prod(sizes))
+    rng = np.random.RandomState(seed)
+    flat = np.arange(n_total) if n_total <= n_configs else rng.choice(n_total, n_configs, replace=False)
+    configs = []
+    for index in sorted(int(i) for i in flat):
+        config = {}
+        for name, size in zip(reversed(names), reversed(sizes)):
+            index, position = divmod(index, size)
+            config[name] = space[name][position]
+        configs.append({name: config[name] for name in names})
+    return configs
+
+
+def dominated(scores: np.ndarray, best: int) -> np.ndarray:
+    """
+    Configurations significantly worse than `best` (paired one-sided t-test)
+
+    Args:
+        scores: (n_configs, n_instances) mean score of each configuration per
+                test case (replicates averaged, so df = n_instances - 1)
+        best: Row of the reference configuration
+    """
+    n = scores.shape[1]
+    if n < 2:
+        return np.zeros(len(scores), dtype=bool)
+    diff = scores[best] - scores
+    mean = diff.mean(axis=1)
+    std = diff.std(axis=1, ddof=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t_stat = mean / (std / math.sqrt(n))
+    # Identical scores everywhere but lower mean (std 0) also count as dominated
+    t_stat = np.where(std > 0, t_stat, np.where(mean > 0, np.inf, 0.0))
+    return t_stat > t_critical(n - 1)
+
+
+class RacingTuner:
+    """Successive halving with statistical racing over (test case, replicate) evaluations"""
+
+    def __init__(self, experiments, algorithm='bpso', space=None, n_configs=32, eta=2,
+                 min_evaluations=3, max_replicates=3, use_regions=False, seed=0):
+        """
+        Args:
+            experiments: Chapter3Experiments (loader, run cache, worker pool)
+            algorithm: 'bpso' or 'gbfs'
+            space: Parameter space (default: PARAMETER_SPACES[algorithm])
+            n_configs: Number of starting configurations
+            eta: Budget multiplier / survivor fraction per round
+            min_evaluations: Evaluations per configuration in the first round
+            max_replicates: Replicates per test case for seeded solvers
+                            (evaluations = test cases x replicates); 1 for
+                            deterministic solvers (GBFS)
+            use_regions: Pass region data to the solver; runs are then scored
+                         on the multi-objective fitness instead of revenue
+            seed: Seed of the configuration sample
+        """
+        self.experiments = experiments
+        self.loader = experiments.loader
+        self.algorithm = algorithm
+        self.configs = sample_configurations(space or PARAMETER_SPACES[algorithm], n_configs, seed)
+        self.eta = eta
+        self.min_evaluations = min_evaluations
+        self.max_replicates = max_replicates if algorithm in SEEDED_ALGORITHMS else 1
+        self.use_regions = use_regions
+        self._optimum = {}
+
+    def optimum(self, test_case_name: str) -> float:
+        """Exact revenue optimum of a test case (DP, computed once)"""
+        if test_case_name not in self._optimum:
+            tc = self.loader.load_test_case(test_case_name)
+            result = solve_knapsack_dp(tc['items'], tc['weights'], tc['values'], tc['capacity'])
+            self._optimum[test_case_name] = result['total_value']
+        return self._optimum[test_case_name]
+
+    def score(self, test_case_name: str, result: Dict) -> float:
+        """
+        Solver objective relative to its upper bound, 0 for infeasible selections
+        
+        Revenue / DP optimum without regions; with regions the solvers'
+        fitness alpha*f1 + (1-alpha)*f2 over alpha*DP/total value + (1-alpha).
+        """
+        tc = self.loader.load_test_case(test_case_name)
+        if result['total_weight'] > tc['capacity']:
+            return 0.0
+        optimum = self.optimum(test_case_name)
+        if not self.use_regions:
+            return result['total_value'] / optimum if optimum > 0 else 0.0
+        n_regions = len(set(r for r in tc['regions'] if r is not None)) or 1
+        total_value = tc['total_value']
+        fitness = (ALPHA * result['total_value'] / total_value
+                   + (1 - ALPHA) * result['region_coverage'] / n_regions)
+        bound = ALPHA * optimum / total_value + (1 - ALPHA)
+        return fitness / bound
+
+    def _evaluate(self, config_ids, evaluations, scores):
+        """Fill scores[(config, test case, run_id)] for pairs not evaluated yet"""
+        pending = {}
+        for c in config_ids:
+            for test_case_name, run_id in evaluations:
+                if (c, test_case_name, run_id) not in scores:
+                    run = Run.make(self.algorithm, test_case_name, self.configs[c],
+                                   run_id, self.use_regions)
+                    pending[run] = c
+        if not pending:
+            return
+        for run, result in self.experiments.run_grid(list(pending)).items():
+            scores[(pending[run], run.test_case, run.run_id)] = self.score(run.test_case, result)
+
+    def race(self, instances: List[str]) -> Dict:
+        """
+        Race all configurations on one instance class
+
+        Returns:
+            Dict with best config, its mean score, survivors per round and
+            the number of runs used vs an exhaustive grid
+        """
+        evaluations = [(name, run_id) for run_id in range(self.max_replicates) for name in instances]
+        alive = list(range(len(self.configs)))
+        scores = {}
+        budget = min(self.min_evaluations, len(evaluations))
+        rounds = []
+
+        round_index = 0
+        while True:
+            used = evaluations[:budget]
+            self._evaluate(alive, used, scores)
+            # Replicates of a test case are averaged: the paired test is over test cases
+            by_instance = {}
+            for name, run_id in used:
+                by_instance.setdefault(name, []).append(run_id)
+            matrix = np.array([[np.mean([scores[(c, name, run_id)] for run_id in run_ids])
+                                for name, run_ids in by_instance.items()] for c in alive])
+            means = matrix.mean(axis=1)
+            best = int(np.argmax(means))
+
+            # Racing: drop statistically dominated configurations, then keep top 1/eta
+            keep = ~dominated(matrix, best)
+            order = [i for i in np.argsort(-means, kind='stable') if keep[i]]
+            n_keep = max(1, math.ceil(len(alive) / self.eta)) if budget < len(evaluations) else 1
+            rounds.append({'round': round_index, 'evaluations': budget, 'alive': len(alive),
+                           'dominated': int((~keep).sum())})
+            alive = [alive[i] for i in order[:n_keep]]
+
+            if len(alive) == 1 or budget >= len(evaluations):
+                break
+            budget = min(len(evaluations), budget * self.eta)
+            round_index += 1
+
+        winner = alive[0]
+        winner_scores = [scores[(winner, name, run_id)] for name, run_id in evaluations if (winner, name, run_id) in scores]
+        return {
+            'config': self.configs[winner],
+            'score_mean': float(np.mean(winner_scores)),
+            'score_std': float(np.std(winner_scores)),
+            'evaluations': len(winner_scores),
+            'runs_used': len(scores),
+            'runs_exhaustive': len(self.configs) * len(evaluations),
+            'rounds': rounds
+        }
+
+    def tune_by_type(self) -> pd.DataFrame:
+        """Best configuration per instance class (Type column of the summary)"""
+        rows = []
+        for test_type in self.loader.catalog.types():
+            instances = self.loader.query_test_cases(type=test_type)
+            print(f"\n--- {self.algorithm.upper()} / {test_type} ({len(instances)} test cases, "
+                  f"{len(self.configs)} configs) ---")
+            outcome = self.race(instances)
+            for r in outcome['rounds']:
+                print(f"  Round {r['round']}: {r['alive']} configs x {r['evaluations']} evals, "
+                      f"{r['dominated']} dominated")
+            print(f"  → Best: {outcome['config']} (score {outcome['score_mean']:.4f}), "
+                  f"{outcome['runs_used']}/{outcome['runs_exhaustive']} runs")
+            rows.append({
+                'algorithm': self.algorithm,
+                'type': test_type,
+                **outcome['config'],
+                'score_mean': outcome['score_mean'],
+                'score_std': outcome['score_std'],
+                'evaluations': outcome['evaluations'],
+                'runs_used': outcome['runs_used'],
+                'runs_exhaustive': outcome['runs_exhaustive']
+            })
+        return pd.DataFrame(rows)
+
+
+def main():
+    """Main entry point"""
+    import argparse
+    from experiment.chapter3.experiments import Chapter3Experiments
+
+    parser = argparse.ArgumentParser(description='Racing / successive-halving tuner for BPSO and GBFS')
+    parser.add_argument('--algorithm', choices=sorted(PARAMETER_SPACES), default='bpso')
+    parser.add_argument('--configs', type=int, default=32, help='Số cấu hình ban đầu')
+    parser.add_argument('--eta', type=int, default=2, help='Hệ số tăng ngân sách / giữ lại 1/eta')
+    parser.add_argument('--replicates', type=int, default=3,
+                        help='Số replicate mỗi test case (chỉ BPSO; GBFS tất định chạy 1 lần)')
+    parser.add_argument('--seed', type=int, default=0, help='Seed lấy mẫu cấu hình')
+    parser.add_argument('--workers', type=int, default=1, help='Số process chạy song song')
+    parser.add_argument('--regions', action='store_true',
+                        help='Tối ưu cả độ phủ region (score theo fitness đa mục tiêu)')
+    parser.add_argument('--no-cache', action='store_true', help='Không dùng cache kết quả')
+    args = parser.parse_args()
+
+    experiments = Chapter3Experiments(workers=args.workers, use_cache=not args.no_cache)
+    tuner = RacingTuner(experiments, args.algorithm, n_configs=args.configs, eta=args.eta,
+                        max_replicates=args.replicates, use_regions=args.regions, seed=args.seed)
+    try:
+        df = tuner.tune_by_type()
+    finally:
+        experiments.close()
+    experiments.finish_sweep()
+
+    suffix = '_regions' if args.regions else ''
+    csv_path = os.path.join(experiments.output_dir, f'tuning_{args.algorithm}_best_by_type{suffix}.csv')
+    df.to_csv(csv_path, index=False)
+    print(f"\n✓ Saved CSV: {csv_path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -590,9 +590,8 @@ class KnapsackSolverGUI(QMainWindow):
             # Get test case info
             info = self.loader.get_test_case_info(test_name)
             
-            # Load data as DataFrame
-            filepath = self.loader.test_cases_dir / info['File']
-            self.test_data_df = pd.read_csv(filepath)
+            # Load data as DataFrame (parsed once per session, used columns only)
+            self.test_data_df = self.loader.load_test_case_frame(test_name)
             
             # Rename columns for compatibility
             if 'Quantity' in self.test_data_df.columns:
@@ -608,7 +607,7 @@ class KnapsackSolverGUI(QMainWindow):
                     region_map = {}
                     for i, r in enumerate(self.test_data_df['Region'].unique()):
                         region_map[r] = i + 1
-                    self.test_data_df['region'] = self.test_data_df['Region'].map(region_map)
+                    self.test_data_df['region'] = self.test_data_df['Region'].map(region_map).astype(int)
                 else:
                     self.test_data_df['region'] = 1
             
@@ -13,6 +13,7 @@ Usage:
     python3 main.py --gui        # Launch GUI
     python3 main.py --experiments # Run Chapter 3 experiments
     python3 main.py --regenerate  # Regenerate all experiment data
+    python3 main.py solve FILES   # Headless batch solve (JSON lines)
 =================================================================================
 """
 
@@ -33,7 +34,7 @@ def launch_gui():
     main()
 
 
-def run_experiments():
+def run_experiments(workers=1, use_cache=True, resume=False, profile=False, track_memory=False):
     """Run Chapter 3 experiments interactively"""
     from experiment.chapter3.experiments import Chapter3Experiments
     
@@ -41,7 +42,8 @@ def run_experiments():
     print("CHAPTER 3 EXPERIMENTS - GBFS & BPSO Analysis")
     print("="*80)
     
-    exp = Chapter3Experiments()
+    exp = Chapter3Experiments(workers=workers, use_cache=use_cache, resume=resume,
+                              profile=profile, track_memory=track_memory)
     
     # Menu
     print("\n📊 Available experiments:")
@@ -52,12 +54,14 @@ def run_experiments():
     print("  5. 3.1.2   - Algorithm Comparison (Single test case)")
     print("  6. 3.1.2   - Algorithm Comparison (All test cases)")
     print("  7. 3.1.3   - Data Characteristics Analysis")
-    print("  8. Run ALL experiments")
+    print("  8. 3.1.4   - Scaling Analysis (n, capacity, regions)")
+    print("  9. Run ALL experiments")
     print("  0. Exit")
     
+    failed = False  # Any error keeps the --no-cache checkpoint for --resume
     while True:
         try:
-            choice = input("\n🔢 Select experiment (0-8): ").strip()
+            choice = input("\n🔢 Select experiment (0-9): ").strip()
             
             if choice == '0':
                 print("\n👋 Exiting...")
@@ -77,21 +81,37 @@ def run_experiments():
             elif choice == '7':
                 exp.experiment_3_1_3_data_characteristics()
             elif choice == '8':
-                exp.run_all_experiments()
+                exp.experiment_3_1_4_scaling()
+            elif choice == '9':
+                failed |= not exp.run_all_experiments()
                 break
             else:
-                print("❌ Invalid choice. Please select 0-8.")
+                print("❌ Invalid choice. Please select 0-9.")
         except KeyboardInterrupt:
             print("\n\n👋 Interrupted by user. Exiting...")
+            failed = True
             break
         except Exception as e:
+            failed = True
             print(f"\n❌ Error: {e}")
             import traceback
             traceback.print_exc()
+    
+    exp.close()
+    if not failed:
+        exp.finish_sweep()
 
 
-def regenerate_all_data():
-    """Regenerate all experiment data"""
+def regenerate_all_data(workers=1, use_cache=True, resume=False, profile=False,
+                        track_memory=False):
+    """
+    Regenerate all experiment data (runs fanned out to `workers` processes)
+    
+    Solver runs are served from the result cache when nothing changed;
+    CSV/JSON/plots are always rebuilt. Every finished run is persisted
+    immediately, so an interrupted regeneration continues where it stopped
+    (with --no-cache only when --resume is given).
+    """
     from experiment.chapter3.experiments import Chapter3Experiments
     
     print("\n" + "="*80)
@@ -99,7 +119,8 @@ def regenerate_all_data():
     print(" " * 15 + "TRUE GBFS + BPSO Implementation")
     print("="*80)
     
-    exp = Chapter3Experiments()
+    exp = Chapter3Experiments(workers=workers, use_cache=use_cache, resume=resume,
+                              profile=profile, track_memory=track_memory)
     
     experiments = [
         ("3.1.1.a", "GBFS Parameters (max_states)", exp.experiment_3_1_1_a_gbfs_parameters),
@@ -109,6 +130,7 @@ def regenerate_all_data():
         ("3.1.2", "Algorithm Comparison (Single)", lambda: exp.experiment_3_1_2_algorithm_comparison_single('Size Medium 50')),
         ("3.1.2", "Algorithm Comparison (All)", exp.experiment_3_1_2_algorithm_comparison_all),
         ("3.1.3", "Data Characteristics", exp.experiment_3_1_3_data_characteristics),
+        ("3.1.4", "Scaling Analysis", exp.experiment_3_1_4_scaling),
     ]
     
     results = []
@@ -127,6 +149,8 @@ def regenerate_all_data():
             import traceback
             traceback.print_exc()
     
+    exp.close()
+    
     # Summary
     print("\n" + "="*80)
     print(" " * 25 + "REGENERATION SUMMARY")
@@ -140,6 +164,7 @@ def regenerate_all_data():
     print(f"Completed: {success_count}/{len(results)} experiments")
     
     if success_count == len(results):
+        exp.finish_sweep()
         print("\n🎉 ALL DATA REGENERATED SUCCESSFULLY!")
         print("\nNext steps:")
         print("1. Open notebooks in experiment/chapter3/")
@@ -147,6 +172,8 @@ def regenerate_all_data():
         print("3. Review visualizations")
     else:
         print("\n⚠️  Some experiments failed - check errors above")
+        print("   Finished runs are kept; re-run to continue"
+              + (" (add --resume)" if not use_cache else ""))
 
 
 def main():
@@ -160,6 +187,8 @@ Examples:
   python3 main.py --gui              # Launch GUI
   python3 main.py --experiments      # Run experiments interactively
   python3 main.py --regenerate       # Regenerate all data
+  python3 main.py --regenerate --workers 8   # ... on 8 processes
+  python3 main.py solve data/test_cases/*.csv -a gbfs -p max_states=2000 --workers 4
         """
     )
     
@@ -170,9 +199,30 @@ Examples:
                       help='Run Chapter 3 experiments interactively')
     group.add_argument('--regenerate', action='store_true',
                       help='Regenerate all experiment data')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Worker processes for --experiments/--regenerate/solve (default: 1)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Recompute every solver run instead of using the result cache')
+    parser.add_argument('--resume', action='store_true',
+                        help='With --no-cache: continue an interrupted run from its checkpoint')
+    parser.add_argument('--profile', action='store_true',
+                        help='Record per-phase solver profiles (<sweep>_profile.csv)')
+    parser.add_argument('--memory', action='store_true',
+                        help='Add one memory-tracked run per cell (memory columns and charts)')
+    
+    subparsers = parser.add_subparsers(dest='command')
+    solve_parser = subparsers.add_parser(
+        'solve', help='Solve instance files headlessly, writing JSON lines'
+    )
+    from src.cli import add_solve_arguments
+    add_solve_arguments(solve_parser)
     
     args = parser.parse_args()
     
+    if args.command == 'solve':
+        from src.cli import run_solve
+        sys.exit(run_solve(args))
+    
     # Default to GUI if no args
     if not (args.experiments or args.regenerate):
         args.gui = True
@@ -181,9 +231,9 @@ Examples:
     if args.gui:
         launch_gui()
     elif args.experiments:
-        run_experiments()
+        run_experiments(args.workers, not args.no_cache, args.resume, args.profile, args.memory)
     elif args.regenerate:
-        regenerate_all_data()
+        regenerate_all_data(args.workers, not args.no_cache, args.resume, args.profile, args.memory)
 
 
 if __name__ == '__main__':
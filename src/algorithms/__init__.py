@@ -5,8 +5,15 @@ Contains implementations of GBFS, BPSO, and DP algorithms for Knapsack Problem
 
 from .gbfs_knapsack import solve_knapsack_gbfs
 from .bpso_knapsack import solve_knapsack_bpso
+from .dp_knapsack import solve_knapsack_dp
+from .incremental import apply_knapsack_diff, resolve_knapsack
+from .capacity_sweep import solve_capacity_sweep
 
 __all__ = [
     'solve_knapsack_gbfs',
-    'solve_knapsack_bpso'
+    'solve_knapsack_bpso',
+    'solve_knapsack_dp',
+    'apply_knapsack_diff',
+    'resolve_knapsack',
+    'solve_capacity_sweep'
 ]
@@ -11,23 +11,112 @@ MULTI-OBJECTIVE FITNESS (Weighted Sum Method):
   f2 = Region Coverage (maximize, 0-4 regions)
   alpha = 0.7 (revenue weight)
   penalty = 10.0 * overflow_ratio if over capacity
+
+WARM START:
+  seed_solutions = GBFS result / previous solution (result dict, item index
+                   list, or boolean mask)
+  init_strategy  = 'random' (default) or 'greedy' (value/weight ratio seeding)
+  Seeds + mutated copies fill seed_fraction of the swarm, the rest is random
+
+TOPOLOGY (social term of the velocity update):
+  'gbest'       - every particle follows the swarm best (default)
+  'ring'        - best pbest among particles i-k..i+k (k = neighborhood_size)
+  'von_neumann' - best pbest among grid neighbors (up/down/left/right)
+  The swarm is updated synchronously with array operations; neighborhood
+  bests come from one argmax over index-shifted pbest fitness.
+
+PARAMETER SCHEDULES:
+  schedule = None (fixed w/c1/c2/v_max), 'linear_inertia', 'tvac', 'adaptive'
+  or a callable (see bpso_schedules.py); applied once per iteration
+
+CHECKPOINT / RESUME:
+  checkpoint_path + checkpoint_every -> periodic swarm checkpoints (.npz)
+  resume_from=path continues a killed run (same problem and swarm size);
+  parameter_history and the schedule's state are restored too
+
+PROFILING (profile=True, see profiling.py):
+  phases: initialization, schedule, velocity_update, sampling, fitness,
+          best_update, tracking, checkpoint
+  counters: iterations, fitness_evaluations, pbest_updates, gbest_updates
 =================================================================================
 """
 
+import json
 import numpy as np
 from typing import Dict, List
 import time
 
+from .checkpoint import save_checkpoint, load_checkpoint, rng_state_arrays, restore_rng_state
+from .bpso_schedules import get_schedule
+from .profiling import PhaseProfiler
+
+
+TOPOLOGIES = ('gbest', 'ring', 'von_neumann')
+PARAMETER_NAMES = ('w', 'c1', 'c2', 'v_max')  # Columns of parameter_history
+
+
+def encode_regions(regions, n):
+    """
+    Integer region codes for the coverage objective
+    
+    Accepts region labels (None = missing) or an integer code array
+    (negative = missing, e.g. memory-mapped codes from the streaming loader).
+    
+    Returns:
+        Tuple (codes, labels): int array of length n with -1 for missing,
+        and the label of each code
+    """
+    if regions is None:
+        return np.full(n, -1, dtype=np.int64), []
+    if isinstance(regions, np.ndarray) and np.issubdtype(regions.dtype, np.integer):
+        codes = np.asarray(regions, dtype=np.int64)
+        n_codes = int(codes.max()) + 1 if len(codes) and codes.max() >= 0 else 0
+        return codes, list(range(n_codes))
+    labels = sorted(set(r for r in regions if r is not None), key=str)
+    lookup = {r: k for k, r in enumerate(labels)}
+    codes = np.fromiter((lookup[r] if r is not None else -1 for r in regions),
+                        dtype=np.int64, count=n)
+    return codes, labels
+
+
+def neighborhood_indices(n_particles, topology='ring', radius=1):
+    """
+    Neighbor index matrix for local-best topologies
+    
+    Returns:
+        (k, n_particles) int array; column i lists the particles (including
+        i itself) whose pbest particle i may follow
+    """
+    idx = np.arange(n_particles)
+    if topology == 'ring':
+        shifts = np.arange(-radius, radius + 1)
+        return (idx[None, :] + shifts[:, None]) % n_particles
+    if topology == 'von_neumann':
+        cols = int(np.ceil(np.sqrt(n_particles)))
+        row, col = idx // cols, idx % cols
+        return np.stack([
+            idx,
+            (idx - cols) % n_particles,                       # up
+            (idx + cols) % n_particles,                       # down
+            (row * cols + (col - 1) % cols) % n_particles,    # left
+            (row * cols + (col + 1) % cols) % n_particles     # right
+        ])
+    raise ValueError(f"Unknown topology: {topology}")
+
 
 class KnapsackBPSO:
     """BPSO implementation with Multi-Objective fitness"""
     
     def __init__(self, items, weights, values, capacity, regions=None,
                  n_particles=30, max_iterations=100, w=0.7, c1=2.0, c2=2.0,
-                 alpha=0.7):
+                 alpha=0.7, seed_solutions=None, init_strategy='random',
+                 seed_fraction=0.5, seed=None, checkpoint_path=None,
+                 checkpoint_every=10, resume_from=None, topology='gbest',
+                 neighborhood_size=1, schedule=None, v_max=6.0, item_order=None,
+                 time_limit=None, profile=False):
         self.items = items
-        self.weights = np.array(weights, dtype=float)
-        self.values = np.array(values, dtype=float)
+        self.weights = np.asarray(weights, dtype=float)
+        self.values = np.asarray(values, dtype=float)
         self.capacity = capacity
         self.n = len(items)
         self.n_particles = n_particles
@@ -36,14 +125,45 @@ class KnapsackBPSO:
         self.c1 = c1
         self.c2 = c2
         self.alpha = alpha  # Weight for revenue objective
+        self.v_max = v_max  # Velocity clamp
+        self.time_limit = time_limit  # Seconds; None = run all iterations
+        self.profile = profile  # Per-phase timers/counters in the result
+        self.schedule = get_schedule(schedule)
+        
+        # Warm start
+        if init_strategy not in ('random', 'greedy'):
+            raise ValueError(f"Unknown init_strategy: {init_strategy}")
+        self.seed_solutions = seed_solutions if seed_solutions is not None else []
+        self.init_strategy = init_strategy
+        self.seed_fraction = seed_fraction
+        self.item_order = item_order  # Precomputed value/weight order (optional)
+        
+        # Random source: private generator when seeded, else global np.random
+        self.rng = np.random.RandomState(seed) if seed is not None else np.random
+        
+        # Social topology
+        if topology not in TOPOLOGIES:
+            raise ValueError(f"Unknown topology: {topology}")
+        self.topology = topology
+        self.neighbors = (neighborhood_indices(n_particles, topology, neighborhood_size)
+                          if topology != 'gbest' else None)
+        
+        # Checkpointing
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_every = checkpoint_every
+        self.resume_from = resume_from
         
         # Region data for coverage objective
+        self.region_codes, self.region_labels = encode_regions(regions, self.n)
+        present = np.flatnonzero(self.region_codes >= 0)
         if regions is None:
-            self.regions = [None] * self.n
             self.max_regions = 1  # No region data
         else:
-            self.regions = regions
-            self.max_regions = len(set([r for r in regions if r is not None]))
+            self.max_regions = len(np.unique(self.region_codes[present]))
+        
+        # Item x region membership matrix for batch coverage evaluation
+        self.region_matrix = np.zeros((self.n, len(self.region_labels)))
+        self.region_matrix[present, self.region_codes[present]] = 1.0
         
         # Normalization bounds (updated during optimization)
         self.max_value = np.sum(self.values)  # Theoretical max revenue
@@ -53,6 +173,8 @@ class KnapsackBPSO:
         self.avg_fitness_history = []
         # Particle history for visualization (sample every 10 iterations)
         self.particle_history = []  # List of (iteration, positions, gbest_pos)
+        # Scheduled parameter values per iteration (mean over particles)
+        self.parameter_history = []
     
     def evaluate_fitness(self, position):
         """
@@ -64,85 +186,289 @@ class KnapsackBPSO:
         f2 = Region Coverage (normalized to 0-1, max=4 regions)
         penalty = 10.0 * overflow_ratio if exceeds capacity
         """
+        return self.evaluate_fitness_batch(np.asarray(position)[None, :])[0]
+    
+    def evaluate_fitness_batch(self, positions):
+        """Fitness of every row of a (n_particles, n) position matrix"""
         # Objective 1: Total Revenue
-        total_value = np.sum(self.values * position)
-        f1_normalized = total_value / self.max_value if self.max_value > 0 else 0
+        total_values = positions @ self.values
+        f1_normalized = total_values / self.max_value if self.max_value > 0 else np.zeros(len(positions))
         
         # Objective 2: Region Coverage (number of unique regions)
-        selected_indices = np.where(position == 1)[0]
-        if len(selected_indices) > 0 and self.regions[0] is not None:
-            selected_regions = set([self.regions[i] for i in selected_indices])
-            region_coverage = len(selected_regions)
-        else:
-            region_coverage = 0
-        f2_normalized = region_coverage / self.max_regions if self.max_regions > 0 else 0
+        region_coverage = np.count_nonzero(positions @ self.region_matrix, axis=1)
+        f2_normalized = region_coverage / self.max_regions if self.max_regions > 0 else np.zeros(len(positions))
         
         # Weighted Sum
         fitness = self.alpha * f1_normalized + (1 - self.alpha) * f2_normalized
         
         # Penalty for exceeding capacity
-        total_weight = np.sum(self.weights * position)
-        if total_weight > self.capacity:
-            overflow = total_weight - self.capacity
-            penalty_ratio = overflow / self.capacity
-            fitness -= 10.0 * penalty_ratio  # Heavy penalty (beta=10.0)
+        total_weights = positions @ self.weights
+        overflow = np.maximum(total_weights - self.capacity, 0)
+        fitness -= 10.0 * overflow / self.capacity  # Heavy penalty (beta=10.0)
         
         return fitness
     
-    def solve(self):
-        """Run BPSO optimization"""
-        start = time.time()
+    def seed_to_position(self, seed):
+        """
+        Convert a seed solution to a binary position vector
+        
+        Accepts a solver result dict (uses 'selected_indices'), a boolean mask
+        of length n, or a sequence of selected item indices. Integer
+        sequences are always indices ([0, 1] selects items 0 and 1, even
+        when n == 2); pass 0/1 masks as bool arrays.
+        """
+        if isinstance(seed, dict):
+            seed = seed['selected_indices']
+        seed = np.asarray(seed)
+        position = np.zeros(self.n, dtype=int)
+        if seed.dtype == bool:
+            if len(seed) != self.n:
+                raise ValueError(f"Seed mask has length {len(seed)}, expected {self.n}")
+            position[:] = seed
+        elif len(seed) > 0:
+            seed = seed.astype(int)
+            if seed.min() < 0 or seed.max() >= self.n:
+                raise ValueError(f"Seed solution has item index outside 0..{self.n - 1}")
+            position[seed] = 1
+        return position
+    
+    def greedy_position(self):
+        """Greedy solution: add items by value/weight ratio while capacity allows"""
+        if self.item_order is not None:
+            order = np.asarray(self.item_order, dtype=np.int64)
+        else:
+            ratios = self.values / np.maximum(self.weights, 1e-12)
+            order = np.argsort(-ratios, kind='stable')
+        position = np.zeros(self.n, dtype=int)
+        cumulative = np.cumsum(self.weights[order])
+        position[order[cumulative <= self.capacity]] = 1
+        return position
+    
+    def initialize_swarm(self):
+        """
+        Initialize positions and velocities
         
-        # Initialize swarm
-        positions = np.random.randint(0, 2, (self.n_particles, self.n))
-        velocities = np.random.uniform(-4, 4, (self.n_particles, self.n))
+        Random particles are drawn as before. With init_strategy='greedy' the
+        greedy ratio solution is added as a seed and random particles select
+        each item with probability capacity/total_weight instead of 0.5, so
+        they start near the capacity boundary. Seeds fill the first rows of
+        the swarm followed by mutated copies (up to seed_fraction of the swarm).
+        """
+        positions = self.rng.randint(0, 2, (self.n_particles, self.n))
+        velocities = self.rng.uniform(-4, 4, (self.n_particles, self.n))
+        
+        seeds = [self.seed_to_position(s) for s in self.seed_solutions]
+        if self.init_strategy == 'greedy':
+            seeds.append(self.greedy_position())
+            total_weight = np.sum(self.weights)
+            p_select = min(0.5, self.capacity / total_weight) if total_weight > 0 else 0.5
+            positions = (self.rng.random_sample((self.n_particles, self.n)) < p_select).astype(int)
         
-        # Evaluate
-        fitness = np.array([self.evaluate_fitness(p) for p in positions])
+        if not seeds:
+            return positions, velocities
         
-        # Personal best
-        pbest_positions = positions.copy()
-        pbest_fitness = fitness.copy()
+        n_seeded = min(self.n_particles, max(len(seeds), int(round(self.seed_fraction * self.n_particles))))
+        flip_prob = 1.0 / max(self.n, 1)
+        for i in range(n_seeded):
+            position = seeds[i % len(seeds)].copy()
+            if i >= len(seeds):
+                # Mutated copy: flip ~1 bit per particle around the seed
+                flips = self.rng.random_sample(self.n) < flip_prob
+                position[flips] = 1 - position[flips]
+            positions[i] = position
+            # Velocity pointing towards the seeded bits so sigmoid keeps them
+            velocities[i] = np.where(position == 1, 1.0, -1.0) * self.rng.uniform(2, 4, self.n)
+        
+        return positions, velocities
+    
+    def save_checkpoint(self, path, iteration, elapsed, positions, velocities, fitness,
+                        pbest_positions, pbest_fitness, gbest_position, gbest_fitness):
+        """Write swarm state after `iteration` completed iterations"""
+        history_iters = np.array([it for it, _, _ in self.particle_history], dtype=np.int64)
+        history_positions = np.array([np.packbits(pos, axis=1) for _, pos, _ in self.particle_history],
+                                     dtype=np.uint8)
+        history_gbest = np.array([np.packbits(gb) for _, _, gb in self.particle_history], dtype=np.uint8)
+        save_checkpoint(
+            path, 'bpso',
+            shape=np.array([self.n_particles, self.n, iteration], dtype=np.int64),
+            elapsed=np.array(elapsed),
+            positions=np.packbits(positions, axis=1),
+            velocities=velocities,
+            fitness=fitness,
+            pbest_positions=np.packbits(pbest_positions, axis=1),
+            pbest_fitness=pbest_fitness,
+            gbest_position=np.packbits(gbest_position),
+            gbest_fitness=np.array(gbest_fitness),
+            best_fitness_history=np.array(self.best_fitness_history, dtype=float),
+            avg_fitness_history=np.array(self.avg_fitness_history, dtype=float),
+            history_iters=history_iters,
+            history_positions=history_positions,
+            history_gbest=history_gbest,
+            parameter_history=np.array(
+                [[p[name] for name in PARAMETER_NAMES] for p in self.parameter_history],
+                dtype=float).reshape(-1, len(PARAMETER_NAMES)),
+            schedule_state=np.array(json.dumps(
+                self.schedule.state_dict() if hasattr(self.schedule, 'state_dict') else None)),
+            **rng_state_arrays(self.rng)
+        )
+    
+    def load_checkpoint(self, path):
+        """Restore swarm state written by save_checkpoint"""
+        data = load_checkpoint(path, 'bpso')
+        n_particles, n, iteration = (int(x) for x in data['shape'])
+        if (n_particles, n) != (self.n_particles, self.n):
+            raise ValueError(
+                f"Checkpoint {path} has {n_particles} particles x {n} items, "
+                f"expected {self.n_particles} x {self.n}"
+            )
         
-        # Global best
-        gbest_idx = np.argmax(fitness)
-        gbest_position = positions[gbest_idx].copy()
-        gbest_fitness = fitness[gbest_idx]
+        def unpack(packed):
+            return np.unpackbits(packed, axis=-1, count=n).astype(int)
         
-        # Track convergence
-        self.best_fitness_history = [gbest_fitness]
-        self.avg_fitness_history = [np.mean(fitness)]
+        restore_rng_state(self.rng, data)
+        self.best_fitness_history = data['best_fitness_history'].tolist()
+        self.avg_fitness_history = data['avg_fitness_history'].tolist()
+        self.particle_history = [
+            (int(it), unpack(pos), unpack(gb))
+            for it, pos, gb in zip(data['history_iters'], data['history_positions'], data['history_gbest'])
+        ]
+        self.parameter_history = [dict(zip(PARAMETER_NAMES, row.tolist()))
+                                  for row in data['parameter_history']]
+        schedule_state = json.loads(str(data['schedule_state']))
+        if schedule_state is not None and hasattr(self.schedule, 'load_state_dict'):
+            self.schedule.load_state_dict(schedule_state)
+        return {
+            'iteration': iteration,
+            'elapsed': float(data['elapsed']),
+            'positions': unpack(data['positions']),
+            'velocities': data['velocities'],
+            'fitness': data['fitness'],
+            'pbest_positions': unpack(data['pbest_positions']),
+            'pbest_fitness': data['pbest_fitness'],
+            'gbest_position': unpack(data['gbest_position']),
+            'gbest_fitness': float(data['gbest_fitness'])
+        }
+    
+    def solve(self):
+        """Run BPSO optimization"""
+        start = time.time()
+        prof = PhaseProfiler() if self.profile else None
+        if prof:
+            t = prof.now()
         
-        # Sample initial state for visualization
-        self.particle_history.append((0, positions.copy(), gbest_position.copy()))
+        if self.resume_from is not None:
+            # Continue from checkpoint
+            state = self.load_checkpoint(self.resume_from)
+            start -= state['elapsed']
+            start_iteration = state['iteration']
+            positions = state['positions']
+            velocities = state['velocities']
+            fitness = state['fitness']
+            pbest_positions = state['pbest_positions']
+            pbest_fitness = state['pbest_fitness']
+            gbest_position = state['gbest_position']
+            gbest_fitness = state['gbest_fitness']
+        else:
+            start_iteration = 0
+            
+            # Initialize swarm
+            positions, velocities = self.initialize_swarm()
+            if prof:
+                t = prof.lap('initialization', t)
+            
+            # Evaluate
+            fitness = self.evaluate_fitness_batch(positions)
+            if prof:
+                t = prof.lap('fitness', t)
+                prof.count('fitness_evaluations', self.n_particles)
+            
+            # Personal best
+            pbest_positions = positions.copy()
+            pbest_fitness = fitness.copy()
+            
+            # Global best
+            gbest_idx = np.argmax(fitness)
+            gbest_position = positions[gbest_idx].copy()
+            gbest_fitness = fitness[gbest_idx]
+            
+            # Track convergence
+            self.best_fitness_history = [gbest_fitness]
+            self.avg_fitness_history = [np.mean(fitness)]
+            
+            # Sample initial state for visualization
+            self.particle_history.append((0, positions.copy(), gbest_position.copy()))
         
         # Main loop
-        for iteration in range(self.max_iterations):
-            for i in range(self.n_particles):
-                # Update velocity
-                r1 = np.random.random(self.n)
-                r2 = np.random.random(self.n)
-                velocities[i] = (self.w * velocities[i] +
-                               self.c1 * r1 * (pbest_positions[i] - positions[i]) +
-                               self.c2 * r2 * (gbest_position - positions[i]))
-                velocities[i] = np.clip(velocities[i], -6, 6)
-                
-                # Update position (binary)
-                sigmoid = 1 / (1 + np.exp(-velocities[i]))
-                positions[i] = (np.random.random(self.n) < sigmoid).astype(int)
-                
-                # Evaluate
-                fitness[i] = self.evaluate_fitness(positions[i])
-                
-                # Update pbest
-                if fitness[i] > pbest_fitness[i]:
-                    pbest_positions[i] = positions[i].copy()
-                    pbest_fitness[i] = fitness[i]
-                
-                # Update gbest
-                if fitness[i] > gbest_fitness:
-                    gbest_position = positions[i].copy()
-                    gbest_fitness = fitness[i]
+        if prof:
+            t = prof.lap('initialization', t)
+        time_limit_reached = False
+        for iteration in range(start_iteration, self.max_iterations):
+            if self.time_limit is not None and time.time() - start >= self.time_limit:
+                time_limit_reached = True
+                break
+            
+            # Social target: swarm best or best pbest in each neighborhood
+            if self.neighbors is None:
+                social = gbest_position
+            else:
+                best_neighbor = np.argmax(pbest_fitness[self.neighbors], axis=0)
+                social = pbest_positions[self.neighbors[best_neighbor, np.arange(self.n_particles)]]
+            
+            # Parameters for this iteration
+            if prof:
+                t = prof.lap('velocity_update', t)
+            w, c1, c2, v_max = self.w, self.c1, self.c2, self.v_max
+            if self.schedule is not None:
+                params = self.schedule(iteration, self.max_iterations, positions, gbest_position)
+                w = params.get('w', w)
+                c1 = params.get('c1', c1)
+                c2 = params.get('c2', c2)
+                v_max = params.get('v_max', v_max)
+                self.parameter_history.append({
+                    name: float(np.mean(value))
+                    for name, value in zip(PARAMETER_NAMES, (w, c1, c2, v_max))
+                })
+                if prof:
+                    t = prof.lap('schedule', t)
+            
+            # Update velocity
+            r1 = self.rng.random_sample((self.n_particles, self.n))
+            r2 = self.rng.random_sample((self.n_particles, self.n))
+            velocities = (w * velocities +
+                          c1 * r1 * (pbest_positions - positions) +
+                          c2 * r2 * (social - positions))
+            velocities = np.clip(velocities, -v_max, v_max)
+            if prof:
+                t = prof.lap('velocity_update', t)
+            
+            # Update position (binary)
+            sigmoid = 1 / (1 + np.exp(-velocities))
+            positions = (self.rng.random_sample((self.n_particles, self.n)) < sigmoid).astype(int)
+            if prof:
+                t = prof.lap('sampling', t)
+            
+            # Evaluate
+            fitness = self.evaluate_fitness_batch(positions)
+            if prof:
+                t = prof.lap('fitness', t)
+                prof.count('fitness_evaluations', self.n_particles)
+            
+            # Update pbest
+            improved = fitness > pbest_fitness
+            pbest_positions[improved] = positions[improved]
+            pbest_fitness[improved] = fitness[improved]
+            
+            # Update gbest
+            best_idx = np.argmax(fitness)
+            if fitness[best_idx] > gbest_fitness:
+                gbest_position = positions[best_idx].copy()
+                gbest_fitness = fitness[best_idx]
+                if prof:
+                    prof.count('gbest_updates')
+            if prof:
+                t = prof.lap('best_update', t)
+                prof.count('pbest_updates', int(np.count_nonzero(improved)))
+                prof.count('iterations')
             
             # Track
             self.best_fitness_history.append(gbest_fitness)
@@ -151,6 +477,16 @@ class KnapsackBPSO:
             # Sample particle positions for visualization (every 10 iterations)
             if (iteration + 1) % 10 == 0 or iteration == self.max_iterations - 1:
                 self.particle_history.append((iteration + 1, positions.copy(), gbest_position.copy()))
+            if prof:
+                t = prof.lap('tracking', t)
+            
+            # Periodic checkpoint
+            if self.checkpoint_path is not None and (iteration + 1) % self.checkpoint_every == 0:
+                self.save_checkpoint(self.checkpoint_path, iteration + 1, time.time() - start,
+                                     positions, velocities, fitness, pbest_positions,
+                                     pbest_fitness, gbest_position, gbest_fitness)
+                if prof:
+                    t = prof.lap('checkpoint', t)
         
         elapsed = time.time() - start
         
@@ -158,15 +494,11 @@ class KnapsackBPSO:
         selected = np.where(gbest_position == 1)[0]
         
         # Calculate region coverage
-        if self.regions[0] is not None:
-            selected_regions = set([self.regions[i] for i in selected])
-            region_coverage = len(selected_regions)
-            regions_covered = list(selected_regions)
-        else:
-            region_coverage = 0
-            regions_covered = []
+        selected_codes = self.region_codes[selected]
+        regions_covered = [self.region_labels[k] for k in np.unique(selected_codes[selected_codes >= 0])]
+        region_coverage = len(regions_covered)
         
-        return {
+        result = {
             'selected_items': [self.items[i] for i in selected],
             'selected_indices': selected.tolist(),
             'total_value': np.sum(self.values[selected]),
@@ -180,20 +512,52 @@ class KnapsackBPSO:
                 'best_fitness': self.best_fitness_history,
                 'avg_fitness': self.avg_fitness_history
             },
-            'particle_history': self.particle_history  # For visualization
+            'particle_history': self.particle_history,  # For visualization
+            'parameter_history': self.parameter_history,
+            'time_limit_reached': time_limit_reached
         }
+        if prof:
+            result['profile'] = prof.as_dict()
+        return result
 
 
 def solve_knapsack_bpso(items, weights, values, capacity, regions=None,
                         n_particles=30, max_iterations=100, w=0.7, c1=2.0, c2=2.0,
-                        alpha=0.7):
+                        alpha=0.7, seed_solutions=None, init_strategy='random',
+                        seed_fraction=0.5, seed=None, checkpoint_path=None,
+                        checkpoint_every=10, resume_from=None, topology='gbest',
+                        neighborhood_size=1, schedule=None, v_max=6.0, item_order=None,
+                        time_limit=None, profile=False):
     """
     Run BPSO algorithm with Multi-Objective fitness
     
     Args:
-        regions: List of region names for each item (for coverage objective)
+        regions: List of region names for each item (for coverage objective),
+                 or an integer region code array (negative = missing)
         alpha: Weight for revenue objective (default 0.7)
+        seed_solutions: Warm-start solutions (GBFS result, previous result,
+                        item index list or boolean mask), mixed with random
+                        particles
+        init_strategy: 'random' (default) or 'greedy' (ratio-based seeding)
+        seed_fraction: Fraction of the swarm built from seeds (default 0.5)
+        seed: Random seed (default: global np.random state)
+        checkpoint_path: Write a checkpoint here every checkpoint_every iterations
+        resume_from: Continue the run saved in this checkpoint file
+        topology: 'gbest' (default), 'ring' or 'von_neumann'
+        neighborhood_size: Ring radius (neighbors on each side)
+        schedule: Per-iteration parameter schedule ('linear_inertia', 'tvac',
+                  'adaptive' or a callable); default keeps w/c1/c2/v_max fixed
+        v_max: Velocity clamp (default 6.0)
+        item_order: Precomputed value/weight ordering for greedy seeding
+                    (shared across a capacity sweep)
+        time_limit: Stop after this many seconds and return the best so far
+        profile: Add a per-phase 'profile' (timers and counters) to the result
+                 (see profiling.py)
     """
     solver = KnapsackBPSO(items, weights, values, capacity, regions,
-                          n_particles, max_iterations, w, c1, c2, alpha)
+                          n_particles, max_iterations, w, c1, c2, alpha,
+                          seed_solutions, init_strategy, seed_fraction, seed,
+                          checkpoint_path, checkpoint_every, resume_from,
+                          topology, neighborhood_size, schedule, v_max, item_order,
+                          time_limit, profile)
     return solver.solve()
@@ -0,0 +1,119 @@
+"""
+=================================================================================
+Per-Iteration Parameter Schedules for BPSO
+=================================================================================
+A schedule is called once per iteration inside the vectorized BPSO loop:
+
+  params = schedule(iteration, max_iterations, positions, gbest_position)
+
+and returns a dict overriding any of 'w', 'c1', 'c2', 'v_max'. Values are
+scalars or (n_particles, 1) arrays (per-particle parameters broadcast over
+items). Missing keys keep the solver's fixed values.
+
+BUILT-IN SCHEDULES:
+  'linear_inertia' - w decreases linearly 0.9 -> 0.4
+  'tvac'           - time-varying acceleration: c1 2.5 -> 0.5, c2 0.5 -> 2.5
+  'adaptive'       - driven by swarm diversity (see DiversityAdaptiveSchedule)
+  Any callable with the signature above can be passed instead.
+
+CHECKPOINTS: a stateful schedule provides state_dict() -> dict of
+JSON-serializable values and load_state_dict(state); BPSO saves and
+restores it with the swarm, so a resumed run gets the same parameters.
+=================================================================================
+"""
+
+import numpy as np
+
+
+def _progress(iteration, max_iterations):
+    """Fraction of the run completed (0 at the first iteration, 1 at the last)"""
+    return iteration / max(max_iterations - 1, 1)
+
+
+def swarm_diversity(positions):
+    """Mean per-bit diversity of the swarm (0 = all particles equal, 1 = maximal)"""
+    p = positions.mean(axis=0)
+    return float(np.mean(4 * p * (1 - p)))
+
+
+class LinearInertiaSchedule:
+    """Linearly decreasing inertia weight"""
+    
+    def __init__(self, w_start=0.9, w_end=0.4):
+        self.w_start = w_start
+        self.w_end = w_end
+    
+    def __call__(self, iteration, max_iterations, positions, gbest_position):
+        t = _progress(iteration, max_iterations)
+        return {'w': self.w_start + (self.w_end - self.w_start) * t}
+
+
+class TimeVaryingAccelerationSchedule:
+    """Time-varying acceleration (TVAC): cognitive term fades, social term grows"""
+    
+    def __init__(self, c1_start=2.5, c1_end=0.5, c2_start=0.5, c2_end=2.5,
+                 w_start=0.9, w_end=0.4):
+        self.c1_start, self.c1_end = c1_start, c1_end
+        self.c2_start, self.c2_end = c2_start, c2_end
+        self.inertia = LinearInertiaSchedule(w_start, w_end)
+    
+    def __call__(self, iteration, max_iterations, positions, gbest_position):
+        t = _progress(iteration, max_iterations)
+        params = self.inertia(iteration, max_iterations, positions, gbest_position)
+        params['c1'] = self.c1_start + (self.c1_end - self.c1_start) * t
+        params['c2'] = self.c2_start + (self.c2_end - self.c2_start) * t
+        return params
+
+
+class DiversityAdaptiveSchedule:
+    """
+    Adaptive parameters driven by swarm diversity
+    
+    - Per-particle inertia: particles far from gbest (Hamming distance) keep
+      less momentum so the social pull acts faster; particles sitting on gbest
+      keep more momentum.
+    - Velocity clamp shrinks with swarm diversity: a collapsed swarm gets
+      velocities closer to 0, i.e. sigmoid near 0.5 and more bit flips.
+    """
+    
+    def __init__(self, w_min=0.4, w_max=0.9, v_min=2.0, v_max=6.0):
+        self.w_min, self.w_max = w_min, w_max
+        self.v_min, self.v_max = v_min, v_max
+        self.initial_diversity = None
+    
+    def __call__(self, iteration, max_iterations, positions, gbest_position):
+        diversity = swarm_diversity(positions)
+        if self.initial_diversity is None or iteration == 0:
+            self.initial_diversity = max(diversity, 1e-12)
+        ratio = min(diversity / self.initial_diversity, 1.0)
+        
+        distance = np.mean(positions != gbest_position, axis=1, keepdims=True)
+        w = self.w_max - (self.w_max - self.w_min) * np.minimum(2 * distance, 1.0)
+        return {
+            'w': w,
+            'v_max': self.v_min + (self.v_max - self.v_min) * ratio
+        }
+    
+    def state_dict(self):
+        return {'initial_diversity': self.initial_diversity}
+    
+    def load_state_dict(self, state):
+        self.initial_diversity = state['initial_diversity']
+
+
+SCHEDULES = {
+    'linear_inertia': LinearInertiaSchedule,
+    'tvac': TimeVaryingAccelerationSchedule,
+    'adaptive': DiversityAdaptiveSchedule
+}
+
+
+def get_schedule(schedule):
+    """Resolve a schedule name, callable or None ('constant') to a callable or None"""
+    if schedule is None or schedule == 'constant':
+        return None
+    if callable(schedule):
+        return schedule
+    if schedule in SCHEDULES:
+        return SCHEDULES[schedule]()
+    raise ValueError(f"Unknown schedule: {schedule}. Available: constant, {', '.join(SCHEDULES)}")
@@ -0,0 +1,110 @@
+"""
+=================================================================================
+Capacity Sweep - Solve One Instance for Many Capacities
+=================================================================================
+Capacity what-if analysis solves the same items again and again with only the
+capacity changed. Everything that does not depend on the capacity is built
+once and shared by every variant:
+
+- DP:   one table up to max(capacities); column c is the optimum for capacity
+        c, so each capacity only costs a backtrack
+- GBFS: region codes are encoded once; states are expanded in input order,
+        as in a direct solve_knapsack_gbfs call, so every variant returns
+        exactly what solving that capacity directly returns
+- BPSO: region codes and the value/weight order (greedy seeding) are shared;
+        the order does not change the search, only avoids re-sorting
+
+Variants of a loaded test case share its read-only arrays
+(TestCaseLoader.capacity_variants).
+=================================================================================
+"""
+
+import numpy as np
+import time
+
+from .gbfs_knapsack import solve_knapsack_gbfs
+from .bpso_knapsack import solve_knapsack_bpso, encode_regions
+from .dp_knapsack import fill_dp_rows, backtrack_dp, dp_result
+
+
+def ratio_order(weights, values):
+    """Item indices by decreasing value/weight ratio (stable)"""
+    weights = np.asarray(weights, dtype=float)
+    values = np.asarray(values, dtype=float)
+    return np.argsort(-(values / np.maximum(weights, 1e-12)), kind='stable')
+
+
+def dp_capacity_sweep(items, weights, values, capacities, regions=None):
+    """
+    Exact DP for every capacity in one table fill
+
+    Returns:
+        List of DP result dicts (same order as capacities); execution_time is
+        the backtrack time plus an equal share of the table fill
+    """
+    start = time.time()
+    weights = np.rint(np.asarray(weights, dtype=float)).astype(np.int64)
+    values = np.asarray(values, dtype=float)
+    capacities = [int(c) for c in capacities]
+    n = len(items)
+    if regions is None:
+        regions = [None] * n
+
+    table = np.zeros((n + 1, max(capacities, default=0) + 1), dtype=float)
+    fill_dp_rows(table, weights, values, row_start=1)
+    fill_time = (time.time() - start) / max(len(capacities), 1)
+
+    results = []
+    for capacity in capacities:
+        start = time.time()
+        selected = backtrack_dp(table, weights, capacity)
+        result = dp_result(items, weights, values, regions, selected,
+                           fill_time + time.time() - start)
+        result['capacity'] = capacity
+        results.append(result)
+    return results
+
+
+def solve_capacity_sweep(problem, capacities, algorithm='dp', **params):
+    """
+    Solve a problem dict (items, weights, values, regions) for many capacities
+
+    Args:
+        problem: Problem dict, e.g. from TestCaseLoader.load_test_case
+        capacities: Capacities to solve
+        algorithm: 'gbfs', 'bpso' or 'dp'
+        **params: Extra solver parameters (GBFS/BPSO); an explicit
+                  item_order is passed through (for GBFS it changes the
+                  expansion order, so results then differ from a default solve)
+
+    Returns:
+        List of result dicts (same order as capacities), each with 'capacity'
+    """
+    items, weights, values = problem['items'], problem['weights'], problem['values']
+    regions = problem.get('regions')
+
+    if algorithm == 'dp':
+        return dp_capacity_sweep(items, weights, values, capacities, regions)
+
+    if algorithm == 'gbfs':
+        solve = solve_knapsack_gbfs
+    elif algorithm == 'bpso':
+        solve = solve_knapsack_bpso
+    else:
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+
+    # Capacity-independent preprocessing, shared by all solves
+    order = params.pop('item_order', None)
+    if order is None and algorithm == 'bpso':
+        order = ratio_order(weights, values)
+    region_codes, region_labels = encode_regions(regions, len(items))
+    shared_regions = region_codes if regions is not None else None
+
+    results = []
+    for capacity in capacities:
+        result = solve(items, weights, values, capacity, regions=shared_regions,
+                       item_order=order, **params)
+        result['regions_covered'] = [region_labels[int(code)] for code in result['regions_covered']]
+        result['capacity'] = int(capacity)
+        results.append(result)
+    return results
@@ -0,0 +1,117 @@
+"""
+=================================================================================
+Checkpoint Files for Long-Running Solves
+=================================================================================
+Compact binary checkpoints (uncompressed .npz, written atomically):
+
+- BPSO: swarm arrays (positions bit-packed), pbest/gbest, RNG state, histories
+- GBFS: open heap as packed index lists (CSR: flat int32 indices +
+        offsets), best state, counters; the closed set goes to an
+        append-only log '<path>.closed' (see append_index_lists)
+
+A checkpoint is written to '<path>.tmp' and renamed over '<path>', so a
+process killed mid-write always leaves the previous checkpoint intact.
+The closed log is appended before the rename and the checkpoint records
+the log size it covers: bytes past that size (a write interrupted before
+the rename) are ignored on load and overwritten by the next append.
+=================================================================================
+"""
+
+import os
+import numpy as np
+
+
+def save_checkpoint(path, kind, **arrays):
+    """Atomically write a checkpoint of the given kind ('bpso' or 'gbfs')"""
+    path = str(path)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        np.savez(f, kind=np.array(kind), **arrays)
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path, kind):
+    """Load a checkpoint written by save_checkpoint, checking its kind"""
+    with np.load(str(path), allow_pickle=False) as data:
+        arrays = {key: data[key] for key in data.files}
+    if str(arrays.pop('kind')) != kind:
+        raise ValueError(f"Checkpoint {path} is not a {kind.upper()} checkpoint")
+    return arrays
+
+
+def pack_index_lists(index_lists):
+    """Pack a list of index lists into (flat int32 indices, int64 offsets)"""
+    lengths = np.fromiter((len(lst) for lst in index_lists), dtype=np.int64,
+                          count=len(index_lists))
+    offsets = np.zeros(len(index_lists) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    flat = np.fromiter((i for lst in index_lists for i in lst), dtype=np.int32,
+                       count=int(offsets[-1]))
+    return flat, offsets
+
+
+def unpack_index_lists(flat, offsets):
+    """Inverse of pack_index_lists"""
+    return [flat[offsets[k]:offsets[k + 1]].tolist() for k in range(len(offsets) - 1)]
+
+
+def closed_log_path(path):
+    """Append-only closed set log belonging to a GBFS checkpoint"""
+    return str(path) + '.closed'
+
+
+def append_index_lists(path, index_lists, size):
+    """
+    Append index lists to an append-only int32 log
+
+    Records are [length, index, ...]. The log is first truncated to `size`
+    bytes (the size recorded by the last checkpoint), so a fresh log starts
+    at size 0.
+
+    Returns:
+        New log size in bytes
+    """
+    records = np.fromiter(
+        (x for lst in index_lists for x in (len(lst), *lst)), dtype=np.int32,
+        count=sum(len(lst) + 1 for lst in index_lists)
+    )
+    path = str(path)
+    with open(path, 'r+b' if os.path.exists(path) else 'wb') as f:
+        f.seek(size)
+        f.truncate()
+        f.write(records.tobytes())
+    return size + records.nbytes
+
+
+def read_index_lists(path, size):
+    """Index lists in the first `size` bytes of a log written by append_index_lists"""
+    if size == 0:
+        return []
+    records = np.fromfile(str(path), dtype=np.int32, count=size // 4)
+    lists = []
+    pos = 0
+    while pos < len(records):
+        length = int(records[pos])
+        lists.append(records[pos + 1:pos + 1 + length].tolist())
+        pos += 1 + length
+    return lists
+
+
+def rng_state_arrays(rng):
+    """Export a RandomState (or the np.random module) state as arrays"""
+    name, keys, pos, has_gauss, cached_gaussian = rng.get_state()
+    return {
+        'rng_keys': keys,
+        'rng_meta': np.array([pos, has_gauss], dtype=np.int64),
+        'rng_gauss': np.array(cached_gaussian, dtype=float)
+    }
+
+
+def restore_rng_state(rng, arrays):
+    """Restore a state exported by rng_state_arrays"""
+    pos, has_gauss = (int(x) for x in arrays['rng_meta'])
+    rng.set_state(('MT19937', arrays['rng_keys'], pos, has_gauss,
+                   float(arrays['rng_gauss'])))
@@ -0,0 +1,134 @@
+"""
+=================================================================================
+DP (Dynamic Programming) for 0/1 Knapsack - Exact Revenue Optimum
+=================================================================================
+Classic table-based DP over integer weights (Quantity):
+
+  table[i, c] = best revenue using the first i items with capacity c
+  table[i, c] = max(table[i-1, c], table[i-1, c - w_i] + v_i)
+
+- Single objective (revenue only): used as the exact reference for GBFS/BPSO
+- Region coverage of the optimal selection is reported but not optimized
+- Table rows only depend on the item prefix, so rows before the first changed
+  item stay valid when items are appended/removed/repriced (incremental re-solve)
+- Column c is the optimum for capacity c, so one table up to max(C) answers a
+  whole capacity sweep (capacity_sweep.py)
+=================================================================================
+"""
+
+import numpy as np
+import time
+
+
+def fill_dp_rows(table, weights, values, row_start, col_start=0, valid_rows=None):
+    """
+    Fill DP table rows in place
+    
+    Rows 1..valid_rows are only filled for columns >= col_start (their lower
+    columns are already valid); rows after valid_rows are filled completely.
+    
+    Args:
+        table: (n+1, C+1) array, row 0 must be initialized
+        weights: Integer item weights
+        values: Item values
+        row_start: First row to fill (>= 1)
+        col_start: First column to fill for rows <= valid_rows
+        valid_rows: Number of rows whose columns < col_start are valid
+    """
+    n = table.shape[0] - 1
+    capacity = table.shape[1] - 1
+    if valid_rows is None:
+        valid_rows = row_start - 1
+    
+    for row in range(row_start, n + 1):
+        first_col = col_start if row <= valid_rows else 0
+        if first_col > capacity:
+            continue
+        w = weights[row - 1]
+        prev = table[row - 1]
+        table[row, first_col:] = prev[first_col:]
+        take_from = max(first_col, w)
+        if take_from <= capacity:
+            candidate = prev[take_from - w:capacity + 1 - w] + values[row - 1]
+            np.maximum(table[row, take_from:], candidate, out=table[row, take_from:])
+    return table
+
+
+def backtrack_dp(table, weights, capacity):
+    """
+    Selected item indices for a capacity <= table.shape[1] - 1
+    
+    Columns 0..capacity of a larger table are exactly the table of the
+    smaller capacity, so one filled table answers every capacity up to C.
+    """
+    selected = []
+    c = capacity
+    for row in range(table.shape[0] - 1, 0, -1):
+        if table[row, c] != table[row - 1, c]:
+            selected.append(row - 1)
+            c -= weights[row - 1]
+    selected.reverse()
+    return selected
+
+
+def dp_result(items, weights, values, regions, selected, elapsed):
+    """Result dict of a DP selection (same keys as GBFS/BPSO)"""
+    regions_covered = set(regions[i] for i in selected if regions[i] is not None)
+    return {
+        'selected_items': [items[i] for i in selected],
+        'selected_indices': selected,
+        'total_value': float(np.sum(values[selected])) if selected else 0.0,
+        'total_weight': float(np.sum(weights[selected])) if selected else 0.0,
+        'region_coverage': len(regions_covered),
+        'regions_covered': list(regions_covered),
+        'execution_time': elapsed
+    }
+
+
+def solve_knapsack_dp(items, weights, values, capacity, regions=None,
+                      keep_table=False, previous_table=None, valid_rows=0):
+    """
+    Exact 0/1 Knapsack by Dynamic Programming (revenue objective)
+    
+    Args:
+        items: List of item names
+        weights: Item weights (rounded to integers)
+        values: Item values (Total revenue)
+        capacity: Knapsack capacity
+        regions: List of region names for each item (reported only)
+        keep_table: Return the DP table in the result (for re-solves)
+        previous_table: DP table of an earlier solve whose first valid_rows
+                        items are identical to the current ones
+        valid_rows: Number of item rows of previous_table that can be reused
+    
+    Returns:
+        Dict with solution details (same keys as GBFS/BPSO)
+    """
+    start = time.time()
+    
+    weights = np.rint(np.asarray(weights, dtype=float)).astype(np.int64)
+    values = np.asarray(values, dtype=float)
+    capacity = int(capacity)
+    n = len(items)
+    
+    if regions is None:
+        regions = [None] * n
+    
+    table = np.zeros((n + 1, capacity + 1), dtype=float)
+    
+    reused_rows = 0
+    if previous_table is not None and valid_rows > 0:
+        reused_rows = min(valid_rows, previous_table.shape[0] - 1, n)
+        reused_cols = min(previous_table.shape[1], capacity + 1)
+        table[:reused_rows + 1, :reused_cols] = previous_table[:reused_rows + 1, :reused_cols]
+        fill_dp_rows(table, weights, values, row_start=1,
+                     col_start=reused_cols, valid_rows=reused_rows)
+    else:
+        fill_dp_rows(table, weights, values, row_start=1)
+    
+    selected = backtrack_dp(table, weights, capacity)
+    result = dp_result(items, weights, values, regions, selected, time.time() - start)
+    result['reused_rows'] = reused_rows
+    if keep_table:
+        result['dp_table'] = table
+    return result
@@ -15,14 +15,33 @@ Fitness = alpha * f1_norm + beta * f2_norm - penalty
   penalty = 10.0 * overflow_ratio if exceeds capacity
   
 Default: alpha=0.7, beta=0.3 (same as BPSO)
+
+CHECKPOINT / RESUME:
+  checkpoint_path + checkpoint_every -> periodic open/closed set checkpoints
+  resume_from=path continues a killed search
+  Each checkpoint rewrites the open heap and appends only the states closed
+  since the previous one to '<checkpoint_path>.closed', so checkpoint I/O
+  grows with open set size + checkpoint_every, not with all closed states
+  (200 items, 20000 states, checkpoint_every=1000: about +15% solve time)
+
+PROFILING (profile=True, see profiling.py):
+  phases: initialization, heap_pop, closed_lookup, expansion, fitness,
+          heap_push, checkpoint
+  counters: states_generated / expanded / pushed, closed_hits,
+            duplicates_popped, capacity_pruned, max_open_size, max_closed_size
 =================================================================================
 """
 
+import os
 import numpy as np
 from typing import Dict, List, Tuple
 import time
 import heapq
 
+from .checkpoint import (save_checkpoint, load_checkpoint, pack_index_lists, unpack_index_lists,
+                         closed_log_path, append_index_lists, read_index_lists)
+from .profiling import PhaseProfiler
+
 
 class KnapsackState:
     """Represents a state in the GBFS search tree"""
@@ -32,7 +51,7 @@ class KnapsackState:
         self.total_weight = total_weight
         self.total_value = total_value
         self.regions_covered = regions_covered  # Set of covered regions
-        self.next_item_idx = next_item_idx  # Next item to consider expanding
+        self.next_item_idx = next_item_idx  # Next position (in item order) to consider expanding
         
     def __hash__(self):
         """Hash based on selected items for closed set"""
@@ -43,8 +62,40 @@ class KnapsackState:
         return set(self.selected_indices) == set(other.selected_indices)
 
 
+def _save_gbfs_checkpoint(path, n, open_set, closed_pending, closed_log_size, best_state,
+                          best_fitness, states_explored, state_counter, elapsed):
+    """
+    Write open heap (in heap order) and best state as packed arrays
+    
+    Only the states closed since the last checkpoint (closed_pending) are
+    written: they are appended to the closed log, and the checkpoint records
+    the new log size. Returns that size.
+    """
+    closed_log_size = append_index_lists(closed_log_path(path), closed_pending, closed_log_size)
+    open_flat, open_offsets = pack_index_lists([entry[2].selected_indices for entry in open_set])
+    save_checkpoint(
+        path, 'gbfs',
+        counters=np.array([n, states_explored, state_counter, closed_log_size], dtype=np.int64),
+        elapsed=np.array(elapsed),
+        open_neg_fitness=np.array([entry[0] for entry in open_set], dtype=float),
+        open_ids=np.array([entry[1] for entry in open_set], dtype=np.int64),
+        open_next=np.array([entry[2].next_item_idx for entry in open_set], dtype=np.int64),
+        open_totals=np.array([(entry[2].total_weight, entry[2].total_value) for entry in open_set],
+                             dtype=float).reshape(-1, 2),
+        open_flat=open_flat,
+        open_offsets=open_offsets,
+        best_indices=np.array(best_state.selected_indices, dtype=np.int32),
+        best_next=np.array(best_state.next_item_idx),
+        best_totals=np.array([best_state.total_weight, best_state.total_value], dtype=float),
+        best_fitness=np.array(best_fitness)
+    )
+    return closed_log_size
+
+
 def solve_knapsack_gbfs(items, weights, values, capacity, regions=None, max_states=5000, 
-                       alpha=0.7, beta=0.3):
+                       alpha=0.7, beta=0.3, initial_selection=None,
+                       checkpoint_path=None, checkpoint_every=1000, resume_from=None,
+                       item_order=None, time_limit=None, profile=False):
     """
     TRUE Greedy Best-First Search for Multi-Objective Knapsack
     
@@ -53,23 +104,41 @@ def solve_knapsack_gbfs(items, weights, values, capacity, regions=None, max_stat
         weights: List of item weights (Quantity)
         values: List of item values (Total revenue)
         capacity: Knapsack capacity
-        regions: List of region names for each item (for coverage bonus)
+        regions: List of region names for each item (for coverage bonus),
+                 or an integer region code array (negative = missing)
         max_states: Maximum states to explore (default 5000)
         alpha: Weight for revenue objective (default 0.7)
         beta: Weight for region coverage objective (default 0.3)
+        initial_selection: Item indices of the root state (e.g. the best state
+                           of a previous solve); default is the empty knapsack
+        checkpoint_path: Write a checkpoint here every checkpoint_every states
+        resume_from: Continue the search saved in this checkpoint file
+        item_order: Permutation of item indices in which states are expanded
+                    (e.g. a shared value/weight ordering for a capacity sweep);
+                    default is the input order
+        time_limit: Stop after this many seconds and return the best state so far
+        profile: Add a per-phase 'profile' (timers and counters) to the result
+                 (see profiling.py)
     
     Returns:
         Dict with solution details including region_coverage
     """
     start = time.time()
+    prof = PhaseProfiler() if profile else None
+    if prof:
+        t = prof.now()
     
-    weights = np.array(weights, dtype=float)
-    values = np.array(values, dtype=float)
+    weights = np.asarray(weights, dtype=float)
+    values = np.asarray(values, dtype=float)
     n = len(items)
+    order = np.arange(n) if item_order is None else np.asarray(item_order, dtype=np.int64)
     
     # If no regions provided, treat as single-objective
     if regions is None:
         regions = [None] * n
+    elif isinstance(regions, np.ndarray) and np.issubdtype(regions.dtype, np.integer):
+        # Integer region codes (negative = missing)
+        regions = np.where(regions >= 0, regions, None)
     
     # Calculate normalization factors
     max_value = np.sum(values)
@@ -98,42 +167,100 @@ def solve_knapsack_gbfs(items, weights, values, capacity, regions=None, max_stat
         
         return fitness
     
-    # Initialize: Initial state (empty knapsack)
-    initial_state = KnapsackState(
-        selected_indices=[],
-        total_weight=0,
-        total_value=0,
-        regions_covered=set(),
-        next_item_idx=0
-    )
+    def make_state(indices, next_item_idx, totals=None):
+        """Rebuild a state from its selected item indices (and saved totals)"""
+        if totals is None:
+            totals = (float(np.sum(weights[indices])) if indices else 0,
+                      float(np.sum(values[indices])) if indices else 0)
+        return KnapsackState(
+            selected_indices=indices,
+            total_weight=totals[0],
+            total_value=totals[1],
+            regions_covered=set(regions[i] for i in indices if regions[i] is not None),
+            next_item_idx=next_item_idx
+        )
     
-    # Priority queue: (negative_fitness, state_id, state)
-    # We use negative fitness because heapq is a min-heap
-    open_set = []
-    state_counter = 0
-    heapq.heappush(open_set, (-evaluate_fitness(initial_state), state_counter, initial_state))
-    state_counter += 1
+    # States closed since the last checkpoint, and the closed log size
+    closed_pending = []
+    closed_log_size = 0
     
-    # Closed set: Track visited states to avoid revisiting
-    closed_set = set()
-    
-    # Track best solution found
-    best_state = initial_state
-    best_fitness = evaluate_fitness(initial_state)
-    
-    states_explored = 0
+    if resume_from is not None:
+        # Restore search from checkpoint
+        data = load_checkpoint(resume_from, 'gbfs')
+        n_saved, states_explored, state_counter, saved_log_size = (int(x) for x in data['counters'])
+        if n_saved != n:
+            raise ValueError(f"Checkpoint {resume_from} has {n_saved} items, expected {n}")
+        start -= float(data['elapsed'])
+        
+        open_indices = unpack_index_lists(data['open_flat'], data['open_offsets'])
+        # Saved in heap order, so still a valid heap. Totals are saved too:
+        # children then get the same (incrementally summed) fitness as before
+        open_set = [
+            (float(neg), int(state_id), make_state(indices, int(nxt), (float(w), float(v))))
+            for neg, state_id, nxt, (w, v), indices in zip(
+                data['open_neg_fitness'], data['open_ids'], data['open_next'],
+                data['open_totals'], open_indices)
+        ]
+        closed_lists = read_index_lists(closed_log_path(resume_from), saved_log_size)
+        closed_set = set(make_state(indices, 0) for indices in closed_lists)
+        if checkpoint_path is not None:
+            if os.path.abspath(checkpoint_path) == os.path.abspath(resume_from):
+                closed_log_size = saved_log_size  # Keep appending to the same log
+            else:
+                closed_pending = closed_lists  # New log starts with the restored states
+        best_state = make_state(data['best_indices'].tolist(), int(data['best_next']),
+                                tuple(float(x) for x in data['best_totals']))
+        best_fitness = float(data['best_fitness'])
+    else:
+        # Initialize: Initial state (empty knapsack or given selection)
+        initial_indices = sorted(set(int(i) for i in initial_selection)) if initial_selection is not None else []
+        initial_state = make_state(initial_indices, 0)
+        
+        # Priority queue: (negative_fitness, state_id, state)
+        # We use negative fitness because heapq is a min-heap
+        open_set = []
+        state_counter = 0
+        heapq.heappush(open_set, (-evaluate_fitness(initial_state), state_counter, initial_state))
+        state_counter += 1
+        
+        # Closed set: Track visited states to avoid revisiting
+        closed_set = set()
+        
+        # Track best solution found
+        best_state = initial_state
+        best_fitness = evaluate_fitness(initial_state)
+        
+        states_explored = 0
     
     # GBFS main loop
+    if prof:
+        t = prof.lap('initialization', t)
+    time_limit_reached = False
     while open_set and states_explored < max_states:
+        if time_limit is not None and time.time() - start >= time_limit:
+            time_limit_reached = True
+            break
+        
         # Pop state with highest fitness (lowest negative fitness)
+        if prof:
+            prof.maximum('max_open_size', len(open_set))
         neg_fitness, _, current_state = heapq.heappop(open_set)
+        if prof:
+            t = prof.lap('heap_pop', t)
         
         # Check if already visited
         if current_state in closed_set:
+            if prof:
+                t = prof.lap('closed_lookup', t)
+                prof.count('duplicates_popped')
             continue
         
         closed_set.add(current_state)
         states_explored += 1
+        if checkpoint_path is not None:
+            closed_pending.append(current_state.selected_indices)
+        if prof:
+            t = prof.lap('closed_lookup', t)
         
         # Update best solution if current is better
         current_fitness = -neg_fitness
@@ -141,8 +268,9 @@ def solve_knapsack_gbfs(items, weights, values, capacity, regions=None, max_stat
             best_fitness = current_fitness
             best_state = current_state
         
-        # State expansion: Try adding each remaining item
-        for item_idx in range(current_state.next_item_idx, n):
+        # State expansion: Try adding each remaining item (in item_order)
+        for position in range(current_state.next_item_idx, n):
+            item_idx = int(order[position])
             # Skip if already selected
             if item_idx in current_state.selected_indices:
                 continue
@@ -160,22 +288,44 @@ def solve_knapsack_gbfs(items, weights, values, capacity, regions=None, max_stat
                 total_weight=new_weight,
                 total_value=new_value,
                 regions_covered=new_regions,
-                next_item_idx=item_idx + 1
+                next_item_idx=position + 1
             )
+            if prof:
+                t = prof.lap('expansion', t)
             
             # Only add to open set if:
             # 1. Not visited before
             # 2. Doesn't exceed capacity too much (allow small violations for exploration)
-            if new_state not in closed_set:
+            seen = new_state in closed_set
+            if prof:
+                t = prof.lap('closed_lookup', t)
+                prof.count('closed_hits' if seen else 'states_generated')
+            if not seen:
                 if new_weight <= capacity * 1.2:  # Allow 20% overflow for exploration
                     new_fitness = evaluate_fitness(new_state)
+                    if prof:
+                        t = prof.lap('fitness', t)
                     heapq.heappush(open_set, (-new_fitness, state_counter, new_state))
                     state_counter += 1
+                    if prof:
+                        t = prof.lap('heap_push', t)
+                elif prof:
+                    prof.count('capacity_pruned')
+        
+        # Periodic checkpoint (after the expansion: every closed state has
+        # pushed its children, so the saved search resumes exactly)
+        if checkpoint_path is not None and states_explored % checkpoint_every == 0:
+            closed_log_size = _save_gbfs_checkpoint(
+                checkpoint_path, n, open_set, closed_pending, closed_log_size, best_state,
+                best_fitness, states_explored, state_counter, time.time() - start)
+            closed_pending = []
+            if prof:
+                t = prof.lap('checkpoint', t)
     
     elapsed = time.time() - start
     
     # Extract final solution from best state
-    return {
+    result = {
         'selected_items': [items[i] for i in best_state.selected_indices],
         'selected_indices': best_state.selected_indices,
         'total_value': float(best_state.total_value),
@@ -184,6 +334,13 @@ def solve_knapsack_gbfs(items, weights, values, capacity, regions=None, max_stat
         'regions_covered': list(best_state.regions_covered),
         'execution_time': elapsed,
         'states_explored': states_explored,
-        'fitness': best_fitness
+        'fitness': best_fitness,
+        'time_limit_reached': time_limit_reached
     }
+    if prof:
+        prof.count('states_expanded', states_explored)
+        prof.count('states_pushed', state_counter)
+        prof.maximum('max_closed_size', len(closed_set))
+        result['profile'] = prof.as_dict()
+    return result
 
@@ -0,0 +1,158 @@
+"""
+=================================================================================
+Incremental Re-solve for Knapsack Problems with Small Changes
+=================================================================================
+Most production solves are small deltas against the previous plan. Instead of
+starting over, a re-solve reuses the previous solution/state:
+
+- DP:   keep the table rows of the unchanged item prefix (and old capacity
+        columns), only recompute the rest
+- BPSO: re-seed the swarm with the previous gbest (warm start)
+- GBFS: restart the search from the previous best state (repaired if the new
+        capacity makes it infeasible)
+
+DIFF FORMAT (all keys optional):
+  {
+      'capacity': 250,                      # new capacity
+      'removed': [3, 17],                   # old item indices to drop
+      'repriced': {5: 1234.5},              # old item index -> new value
+      'added': [{'item': 'Item_71', 'weight': 12, 'value': 830.0,
+                 'region': 'North'}]         # appended at the end
+  }
+=================================================================================
+"""
+
+import numpy as np
+
+from .gbfs_knapsack import solve_knapsack_gbfs
+from .bpso_knapsack import solve_knapsack_bpso
+from .dp_knapsack import solve_knapsack_dp
+
+
+def apply_knapsack_diff(problem, diff):
+    """
+    Apply a diff to a problem dict (items, weights, values, regions, capacity)
+    
+    Kept items stay in their old order, added items are appended.
+    
+    Returns:
+        Tuple (new_problem, index_map, valid_rows)
+        index_map: array old index -> new index (-1 if removed)
+        valid_rows: length of the unchanged item prefix (reusable DP rows)
+    """
+    n = len(problem['items'])
+    removed = set(int(i) for i in diff.get('removed', []))
+    repriced = {int(i): float(v) for i, v in diff.get('repriced', {}).items()}
+    added = diff.get('added', [])
+    
+    for idx in list(removed) + list(repriced):
+        if idx < 0 or idx >= n:
+            raise ValueError(f"Diff refers to item index {idx} outside 0..{n - 1}")
+    
+    regions = problem.get('regions')
+    if regions is None:
+        regions = [None] * n
+    
+    kept = [i for i in range(n) if i not in removed]
+    index_map = np.full(n, -1, dtype=int)
+    index_map[kept] = np.arange(len(kept))
+    
+    items = [problem['items'][i] for i in kept]
+    weights = [problem['weights'][i] for i in kept]
+    values = [repriced.get(i, problem['values'][i]) for i in kept]
+    new_regions = [regions[i] for i in kept]
+    
+    for item in added:
+        items.append(item['item'])
+        weights.append(item['weight'])
+        values.append(item['value'])
+        new_regions.append(item.get('region'))
+    
+    # Unchanged prefix: new row i is old row i with the same value
+    valid_rows = 0
+    for new_idx, old_idx in enumerate(kept):
+        if old_idx != new_idx or old_idx in repriced:
+            break
+        valid_rows += 1
+    
+    new_problem = dict(problem)
+    new_problem.update({
+        'items': items,
+        'weights': weights,
+        'values': values,
+        'regions': new_regions,
+        'capacity': diff.get('capacity', problem['capacity']),
+        'n_items': len(items)
+    })
+    return new_problem, index_map, valid_rows
+
+
+def repair_selection(indices, weights, values, capacity):
+    """Drop lowest value/weight ratio items until the selection fits capacity"""
+    indices = list(indices)
+    weights = np.asarray(weights, dtype=float)
+    values = np.asarray(values, dtype=float)
+    total_weight = float(np.sum(weights[indices])) if indices else 0.0
+    if total_weight <= capacity:
+        return indices
+    
+    ratios = values[indices] / np.maximum(weights[indices], 1e-12)
+    for pos in np.argsort(ratios, kind='stable'):
+        total_weight -= weights[indices[pos]]
+        indices[pos] = None
+        if total_weight <= capacity:
+            break
+    return [i for i in indices if i is not None]
+
+
+def resolve_knapsack(problem, previous_result, diff, algorithm='bpso', **params):
+    """
+    Re-solve a problem after a small change, reusing the previous solve
+    
+    Args:
+        problem: Problem dict the previous result was computed on
+        previous_result: Result of solve_knapsack_{gbfs,bpso,dp} on problem
+                         (DP results must have been solved with keep_table=True)
+        diff: Changes (see module docstring)
+        algorithm: 'gbfs', 'bpso' or 'dp'
+        **params: Extra solver parameters
+    
+    Returns:
+        Solver result dict, plus 'problem' (the new problem dict, to chain
+        further re-solves) and 'index_map' (old -> new item indices)
+    """
+    new_problem, index_map, valid_rows = apply_knapsack_diff(problem, diff)
+    
+    # Previous selection mapped to new indices (removed items dropped)
+    old_selected = np.asarray(previous_result.get('selected_indices', []), dtype=int)
+    mapped = index_map[old_selected] if len(old_selected) else old_selected
+    selected = sorted(int(i) for i in mapped if i >= 0)
+    
+    args = (new_problem['items'], new_problem['weights'],
+            new_problem['values'], new_problem['capacity'])
+    regions = new_problem.get('regions')
+    
+    if algorithm == 'dp':
+        result = solve_knapsack_dp(
+            *args, regions=regions, keep_table=True,
+            previous_table=previous_result.get('dp_table'), valid_rows=valid_rows,
+            **params
+        )
+    elif algorithm == 'bpso':
+        seeds = list(params.pop('seed_solutions', None) or [])
+        result = solve_knapsack_bpso(
+            *args, regions=regions, seed_solutions=[selected] + seeds, **params
+        )
+    elif algorithm == 'gbfs':
+        start_selection = repair_selection(
+            selected, new_problem['weights'], new_problem['values'], new_problem['capacity']
+        )
+        result = solve_knapsack_gbfs(
+            *args, regions=regions, initial_selection=start_selection, **params
+        )
+    else:
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+    
+    result['problem'] = new_problem
+    result['index_map'] = index_map
+    return result
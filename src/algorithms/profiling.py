@@ -0,0 +1,88 @@
+"""
+=================================================================================
+Per-Phase Solver Profiling (opt-in)
+=================================================================================
+solve_knapsack_gbfs(..., profile=True) / solve_knapsack_bpso(..., profile=True)
+add a 'profile' field to the result:
+
+  {'phases':   {phase: {'time': seconds, 'calls': n}},
+   'counters': {name: value},
+   'profiled_time': sum of phase times}
+
+Phases are timed with time.perf_counter between consecutive laps, so the
+phase times of one solve add up to (almost) its execution_time. With
+profile=False (default) the solvers skip every timer behind an
+`if prof:` check and the result has no 'profile' field.
+
+merge_profiles() sums the profiles of several runs (experiment harness).
+=================================================================================
+"""
+
+from time import perf_counter
+from typing import Dict, List
+
+
+class PhaseProfiler:
+    """Accumulated time and call counts per phase, plus named counters"""
+
+    __slots__ = ('times', 'calls', 'counters')
+
+    def __init__(self):
+        self.times = {}
+        self.calls = {}
+        self.counters = {}
+
+    @staticmethod
+    def now() -> float:
+        return perf_counter()
+
+    def lap(self, phase: str, start: float) -> float:
+        """Charge the time since `start` to a phase; returns the current time"""
+        now = perf_counter()
+        self.times[phase] = self.times.get(phase, 0.0) + (now - start)
+        self.calls[phase] = self.calls.get(phase, 0) + 1
+        return now
+
+    def count(self, name: str, k: int = 1):
+        self.counters[name] = self.counters.get(name, 0) + k
+
+    def maximum(self, name: str, value):
+        """Keep the high-water mark of a counter (e.g. open set size)"""
+        if value > self.counters.get(name, 0):
+            self.counters[name] = value
+
+    def as_dict(self) -> Dict:
+        return {
+            'phases': {phase: {'time': self.times[phase], 'calls': self.calls[phase]}
+                       for phase in self.times},
+            'counters': dict(self.counters),
+            'profiled_time': sum(self.times.values())
+        }
+
+
+def merge_profiles(profiles: List[Dict]) -> Dict:
+    """
+    Sum the profiles of several runs
+
+    Phase times, calls and counters are summed ('max_*' counters keep the
+    maximum); 'runs' is the number of merged profiles.
+    """
+    phases = {}
+    counters = {}
+    profiles = [p for p in profiles if p]
+    for profile in profiles:
+        for phase, stats in profile['phases'].items():
+            merged = phases.setdefault(phase, {'time': 0.0, 'calls': 0})
+            merged['time'] += stats['time']
+            merged['calls'] += stats['calls']
+        for name, value in profile['counters'].items():
+            if name.startswith('max_'):
+                counters[name] = max(counters.get(name, value), value)
+            else:
+                counters[name] = counters.get(name, 0) + value
+    return {
+        'phases': phases,
+        'counters': counters,
+        'profiled_time': sum(stats['time'] for stats in phases.values()),
+        'runs': len(profiles)
+    }
@@ -0,0 +1,238 @@
+"""
+=================================================================================
+HEADLESS BATCH SOLVER - `python main.py solve`
+=================================================================================
+Non-interactive solving for cron jobs and pipelines:
+
+    python main.py solve data/test_cases/*.csv --algorithm bpso \\
+        -p n_particles=50 -p seed=1 --workers 4 --time-limit 10 -o results.jsonl
+
+- Inputs: test case CSV files, binary instance directories (generator /
+  streaming loader output) or glob patterns of either
+- One JSON object per instance is written as soon as it is solved
+  (stdout by default); failures are written as {"instance", "error"} lines
+- Only NumPy and the solver core are imported (no PyQt5 / matplotlib);
+  pandas is only needed the first time a CSV is compiled to the binary cache
+=================================================================================
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+ALGORITHMS = ('gbfs', 'bpso', 'dp')
+
+# Result keys written to the JSON line when the solver returns them
+RESULT_FIELDS = ('total_value', 'total_weight', 'region_coverage', 'regions_covered',
+                 'selected_indices', 'execution_time', 'states_explored', 'fitness',
+                 'time_limit_reached')
+
+
+def expand_inputs(patterns: List[str]) -> List[str]:
+    """
+    Expand files/directories/glob patterns (order kept, duplicates dropped)
+    
+    Duplicates are detected on the resolved path, so 'a.csv', './a.csv' and
+    symlinks to it are solved once (and do not race on the instance cache).
+    """
+    paths = {}
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True)) if glob.has_magic(pattern) else [pattern]
+        for path in matches:
+            paths.setdefault(os.path.realpath(path), path)
+    return list(paths.values())
+
+
+def parse_params(pairs: List[str]) -> Dict:
+    """Parse key=value solver parameters (values as JSON, else strings)"""
+    params = {}
+    for pair in pairs:
+        key, sep, raw = pair.partition('=')
+        if not sep or not key:
+            raise ValueError(f"Invalid parameter '{pair}' (expected key=value)")
+        try:
+            params[key] = json.loads(raw)
+        except json.JSONDecodeError:
+            params[key] = raw
+    return params
+
+
+def load_problem(path, capacity=None, capacity_ratio=None) -> Dict:
+    """
+    Problem dict for a test case CSV or a binary instance directory
+
+    CSV files are compiled to the binary instance cache first. Capacity:
+    explicit value, else capacity_ratio * total weight, else the capacity
+    stored with the instance (15% of the total weight by default).
+    """
+    from src.utils.instance_cache import default_cache_dir, load_instance_cache
+    from src.utils.streaming_loader import load_streamed_instance
+
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(f"Instance not found: {path}")
+    if path.is_file():
+        load_instance_cache(path)  # Build or refresh the binary cache
+        path = Path(default_cache_dir(path)) / path.stem
+
+    problem = load_streamed_instance(path, capacity_ratio)
+    if capacity is not None:
+        problem['capacity'] = int(capacity)
+    return problem
+
+
+def _jsonable(value):
+    """Convert numpy scalars/arrays inside a result to plain JSON types"""
+    if isinstance(value, dict):
+        return {k: _jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, set)):
+        return [_jsonable(v) for v in value]
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def solve_instance(path, algorithm, params, capacity=None, capacity_ratio=None,
+                   time_limit=None) -> Dict:
+    """Solve one instance; returns the JSON record (runs in worker processes)"""
+    from src.algorithms import solve_knapsack_gbfs, solve_knapsack_bpso, solve_knapsack_dp
+    from src.utils.instance_cache import decode_labels
+
+    problem = load_problem(path, capacity, capacity_ratio)
+    labels = problem['region_labels']
+    regions = problem['regions']
+    args = (problem['items'], problem['weights'], problem['values'], problem['capacity'])
+
+    params = dict(params)
+    if algorithm == 'gbfs':
+        result = solve_knapsack_gbfs(*args, regions=regions, time_limit=time_limit, **params)
+    elif algorithm == 'bpso':
+        result = solve_knapsack_bpso(*args, regions=regions, time_limit=time_limit, **params)
+    elif algorithm == 'dp':
+        # DP is exact and runs to completion; time_limit does not apply
+        if regions is not None:
+            regions = decode_labels(regions, labels)
+        result = solve_knapsack_dp(*args, regions=regions, **params)
+    else:
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+
+    if algorithm != 'dp':
+        result['regions_covered'] = sorted(labels[int(code)] for code in result['regions_covered'])
+    else:
+        result['regions_covered'] = sorted(result['regions_covered'])
+
+    record = {
+        'instance': str(path),
+        'algorithm': algorithm,
+        'params': params,
+        'n_items': int(problem['n_items']),
+        'capacity': int(problem['capacity'])
+    }
+    record.update({key: result[key] for key in RESULT_FIELDS if key in result})
+    return _jsonable(record)
+
+
+def _solve_task(task):
+    """Worker entry point: never raises, errors become records"""
+    path = task[0]
+    try:
+        return solve_instance(*task)
+    except Exception as e:
+        return {'instance': str(path), 'algorithm': task[1], 'error': f"{type(e).__name__}: {e}"}
+
+
+def iter_results(tasks, workers=1, ordered=False):
+    """Yield result records, in completion order unless ordered=True"""
+    if workers <= 1:
+        for task in tasks:
+            yield _solve_task(task)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_solve_task, task) for task in tasks]
+        for future in (futures if ordered else as_completed(futures)):
+            yield future.result()
+
+
+def add_solve_arguments(parser):
+    """Arguments of the `solve` subcommand"""
+    parser.add_argument('inputs', nargs='+',
+                        help='Instance CSV files, instance directories or glob patterns')
+    parser.add_argument('-a', '--algorithm', choices=ALGORITHMS, default='bpso',
+                        help='Solver (default: bpso)')
+    parser.add_argument('-p', '--param', action='append', default=[], metavar='KEY=VALUE',
+                        help='Solver parameter, repeatable (e.g. -p max_states=5000)')
+    capacity = parser.add_mutually_exclusive_group()
+    capacity.add_argument('--capacity', type=int, default=None,
+                          help='Absolute knapsack capacity for every instance')
+    capacity.add_argument('--capacity-ratio', type=float, default=None,
+                          help='Capacity as a fraction of each instance\'s total weight')
+    # Own dest: `main.py --workers N solve ...` sets the top-level args.workers
+    parser.add_argument('-w', '--workers', dest='solve_workers', type=int, default=None,
+                        help='Worker processes (default: 1, in-process)')
+    parser.add_argument('-t', '--time-limit', type=float, default=None,
+                        help='Time budget per instance in seconds (GBFS/BPSO)')
+    parser.add_argument('--ordered', action='store_true',
+                        help='Write results in input order instead of completion order')
+    parser.add_argument('-o', '--output', default='-',
+                        help='JSON lines output file (default: stdout)')
+    return parser
+
+
+def run_solve(args) -> int:
+    """Run the `solve` subcommand; returns the exit code"""
+    try:
+        params = parse_params(args.param)
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+
+    workers = args.solve_workers
+    if workers is None:
+        workers = getattr(args, 'workers', 1)  # main.py's top-level --workers
+
+    paths = expand_inputs(args.inputs)
+    if not paths:
+        print("error: no instances match the given inputs", file=sys.stderr)
+        return 2
+
+    tasks = [(path, args.algorithm, params, args.capacity, args.capacity_ratio, args.time_limit)
+             for path in paths]
+
+    out = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8')
+    n_failed = 0
+    try:
+        for record in iter_results(tasks, workers, args.ordered):
+            n_failed += 'error' in record
+            out.write(json.dumps(record) + '\n')
+            out.flush()
+    except BrokenPipeError:
+        # Reader went away (e.g. piped into head): stop quietly
+        sys.stdout = open(os.devnull, 'w')
+        return 1
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    if n_failed:
+        print(f"{n_failed}/{len(tasks)} instances failed", file=sys.stderr)
+    return 1 if n_failed else 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='solve', description='Headless batch knapsack solver')
+    add_solve_arguments(parser)
+    return run_solve(parser.parse_args(argv))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
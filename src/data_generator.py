@@ -0,0 +1,233 @@
+"""
+=================================================================================
+MODULE: Synthetic Instance Generator (Scaling Benchmarks)
+=================================================================================
+Deterministic, seeded generator for knapsack instances from 10^2 to 10^7
+items, written directly to the binary instance cache layout (.npy + meta.json,
+see src/utils/instance_cache.py). Each instance is built in a private staging
+directory and renamed into place when complete (publish_directory), so an
+interrupted or concurrent run never leaves a half-written instance.
+
+MODEL (Gaussian copula, vectorized, generated in fixed-size chunks):
+  z_w, e ~ N(0, 1);  z_v = rho * z_w + sqrt(1 - rho^2) * e
+  Quantity = clip(round(exp(log(weight_mean) + 0.6 * z_w)), 1, weight_max)
+  Total    = value_mean * exp(value_spread * z_v - value_spread^2 / 2)
+  Region   ~ uniform over n_regions, Category ~ uniform over n_categories
+  capacity = capacity_ratio * total quantity
+
+PRESETS mirror the Type column of test_cases_summary.csv:
+  size, regional, category, data_characteristic (high/low correlation,
+  high value)
+
+Usage:
+    python src/data_generator.py --n 100 1000 100000 --preset size --seed 42
+=================================================================================
+"""
+
+import sys
+import json
+import numpy as np
+from pathlib import Path
+from typing import Dict, List
+
+if __name__ == '__main__':
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.utils.instance_cache import write_cache_meta, staging_directory, publish_directory
+
+
+CHUNK_SIZE = 1 << 20  # Part of the seed contract: changing it changes instances
+
+REGION_NAMES = ['North', 'South', 'East', 'West']
+CATEGORY_NAMES = ['Clothing', 'Electronics', 'Food', 'Furniture']
+
+DEFAULTS = {
+    'correlation': 0.0,
+    'value_mean': 5000.0,
+    'value_spread': 0.5,
+    'weight_mean': 20.0,
+    'weight_max': 50,
+    'n_regions': 4,
+    'n_categories': 4,
+    'capacity_ratio': 0.15
+}
+
+# preset -> (summary Type, parameter overrides)
+PRESETS = {
+    'size': ('size', {}),
+    'regional': ('regional', {'n_regions': 2}),
+    'category': ('category', {'n_categories': 1}),
+    'high_correlation': ('data_characteristic', {'correlation': 0.9}),
+    'low_correlation': ('data_characteristic', {'correlation': 0.0, 'value_spread': 0.8}),
+    'high_value': ('data_characteristic', {'value_mean': 7500.0})
+}
+
+
+def size_label(n_items: int) -> str:
+    """Size class used in instance names and the summary 'Size' column"""
+    if n_items < 1_000:
+        return 'small'
+    if n_items < 100_000:
+        return 'medium'
+    if n_items < 1_000_000:
+        return 'large'
+    return 'xlarge'
+
+
+def _labels(prefix_names, count):
+    """First `count` names, extended with numbered names beyond the defaults"""
+    return [prefix_names[k] if k < len(prefix_names) else f'{prefix_names[0][:1]}{k + 1}'
+            for k in range(count)]
+
+
+def generate_instance(n_items: int, out_dir, preset: str = 'size', seed: int = 42,
+                      name: str = None, **params) -> Dict:
+    """
+    Generate one instance into <out_dir>/<name>/
+    
+    Args:
+        n_items: Number of items
+        out_dir: Parent directory of the instance directory
+        preset: Key of PRESETS (sets the summary Type and defaults)
+        seed: Random seed (same seed + parameters -> identical arrays)
+        name: Instance name (default 'Gen <Preset> <n_items> S<seed>')
+        **params: Overrides of DEFAULTS (correlation, value_spread, n_regions, ...)
+    
+    Returns:
+        Summary row dict with the columns of test_cases_summary.csv
+    """
+    if preset not in PRESETS:
+        raise ValueError(f"Unknown preset: {preset}. Available: {', '.join(PRESETS)}")
+    test_type, overrides = PRESETS[preset]
+    unknown = set(params) - set(DEFAULTS)
+    if unknown:
+        raise ValueError(f"Unknown generator parameters: {', '.join(sorted(unknown))}")
+    p = dict(DEFAULTS, **overrides, **params)
+    rho = float(p['correlation'])
+    spread = float(p['value_spread'])
+    
+    name = name or f"Gen {preset.replace('_', ' ').title()} {n_items} S{seed}"
+    inst_dir = Path(out_dir) / name.replace(' ', '_').lower()
+    build_dir = staging_directory(inst_dir)
+    
+    open_memmap = np.lib.format.open_memmap
+    weights = open_memmap(build_dir / 'weights.npy', mode='w+', dtype=np.int32, shape=(n_items,))
+    values = open_memmap(build_dir / 'values.npy', mode='w+', dtype=np.float32, shape=(n_items,))
+    region_codes = open_memmap(build_dir / 'region_codes.npy', mode='w+', dtype=np.int32, shape=(n_items,))
+    category_codes = open_memmap(build_dir / 'category_codes.npy', mode='w+', dtype=np.int32, shape=(n_items,))
+    
+    rng = np.random.default_rng(seed)
+    sums = np.zeros(5)  # sum w, sum v, sum w^2, sum v^2, sum w*v
+    region_counts = np.zeros(p['n_regions'], dtype=np.int64)
+    
+    for start in range(0, n_items, CHUNK_SIZE):
+        m = min(CHUNK_SIZE, n_items - start)
+        z_w = rng.standard_normal(m)
+        z_v = rho * z_w + np.sqrt(1 - rho ** 2) * rng.standard_normal(m)
+        w = np.clip(np.rint(np.exp(np.log(p['weight_mean']) + 0.6 * z_w)), 1, p['weight_max'])
+        v = p['value_mean'] * np.exp(spread * z_v - spread ** 2 / 2)
+        r = rng.integers(0, p['n_regions'], m)
+        c = rng.integers(0, p['n_categories'], m)
+        
+        sl = slice(start, start + m)
+        weights[sl] = w
+        values[sl] = v
+        region_codes[sl] = r
+        category_codes[sl] = c
+        
+        wf = weights[sl].astype(np.float64)
+        vf = values[sl].astype(np.float64)
+        sums += (wf.sum(), vf.sum(), wf @ wf, vf @ vf, wf @ vf)
+        region_counts += np.bincount(r, minlength=p['n_regions'])
+    
+    for array in (weights, values, region_codes, category_codes):
+        array.flush()
+    del weights, values, region_codes, category_codes
+    
+    sum_w, sum_v, sum_ww, sum_vv, sum_wv = sums
+    var_w = sum_ww - sum_w ** 2 / n_items
+    var_v = sum_vv - sum_v ** 2 / n_items
+    cov = sum_wv - sum_w * sum_v / n_items
+    correlation = cov / np.sqrt(var_w * var_v) if var_w > 0 and var_v > 0 else 0.0
+    capacity = int(sum_w * p['capacity_ratio'])
+    regions = _labels(REGION_NAMES, p['n_regions'])
+    
+    summary = {
+        'Name': name,
+        'File': inst_dir.name,
+        'Type': test_type,
+        'Size': size_label(n_items),
+        'N_Items': n_items,
+        'Capacity': capacity,
+        'Total_Quantity': int(sum_w),
+        'Total_Value': round(float(sum_v), 2),
+        'Avg_Value': round(float(sum_v / n_items), 2),
+        'Correlation_VW': round(float(correlation), 4),
+        'N_Regions': p['n_regions'],
+        'N_Categories': p['n_categories']
+    }
+    write_cache_meta(build_dir, {
+        'n_items': n_items,
+        'regions': regions,
+        'categories': _labels(CATEGORY_NAMES, p['n_categories']),
+        'has_regions': True,
+        'has_categories': True,
+        'capacity': capacity,
+        'stats': {
+            'total_weight': float(sum_w),
+            'total_value': float(sum_v),
+            'avg_value': float(sum_v / n_items),
+            'correlation': float(correlation),
+            'region_counts': {label: int(k) for label, k in zip(regions, region_counts)}
+        },
+        'generator': {'preset': preset, 'seed': seed, **p},
+        'summary': summary
+    })
+    publish_directory(build_dir, inst_dir)
+    return summary
+
+
+def generate_suite(sizes: List[int], out_dir='data/generated', presets=('size',),
+                   seed: int = 42, **params) -> List[Dict]:
+    """Generate one instance per (preset, size) and write summary.csv in out_dir"""
+    rows = [generate_instance(n, out_dir, preset, seed, **params)
+            for preset in presets for n in sizes]
+    write_summary(rows, Path(out_dir) / 'summary.csv')
+    return rows
+
+
+def write_summary(rows: List[Dict], path):
+    """Write summary rows in the test_cases_summary.csv format"""
+    import csv
+    
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()) if rows else [])
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def main():
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Generate synthetic knapsack instances')
+    parser.add_argument('--n', type=float, nargs='+', default=[1e2, 1e3, 1e4, 1e5],
+                        help='Instance sizes (e.g. 100 1e6)')
+    parser.add_argument('--preset', nargs='+', default=['size'], choices=list(PRESETS))
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--out', default='data/generated')
+    for key, value in DEFAULTS.items():
+        parser.add_argument(f'--{key.replace("_", "-")}', type=type(value), default=None)
+    args = parser.parse_args()
+    
+    params = {k: getattr(args, k) for k in DEFAULTS if getattr(args, k) is not None}
+    rows = generate_suite([int(n) for n in args.n], args.out, args.preset, args.seed, **params)
+    for row in rows:
+        print(f"✓ {row['Name']}: {row['N_Items']} items, capacity={row['Capacity']}, "
+              f"correlation={row['Correlation_VW']:.3f}")
+    print(f"Summary: {Path(args.out) / 'summary.csv'}")
+
+
+if __name__ == '__main__':
+    main()
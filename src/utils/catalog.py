@@ -0,0 +1,190 @@
+"""
+=================================================================================
+MODULE: Indexed Test Case Catalog
+=================================================================================
+test_cases_summary.csv compiled into lightweight records:
+
+- Name-keyed dict -> O(1) get(name) instead of a pandas boolean mask per call
+- Secondary indexes on Type / Size / N_Regions for query()
+- Per-instance statistics are computed lazily (first access) from the
+  instance arrays, so registering thousands of generated instances is cheap
+- Parsed with the csv module (no pandas import needed)
+=================================================================================
+"""
+
+import csv
+import numpy as np
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+
+# Summary column -> (record attribute, converter)
+SUMMARY_COLUMNS = {
+    'Name': ('name', str),
+    'File': ('file', str),
+    'Type': ('type', str),
+    'Size': ('size', str),
+    'N_Items': ('n_items', int),
+    'Capacity': ('capacity', int),
+    'Total_Quantity': ('total_quantity', float),
+    'Total_Value': ('total_value', float),
+    'Avg_Value': ('avg_value', float),
+    'Correlation_VW': ('correlation', float),
+    'N_Regions': ('n_regions', int),
+    'N_Categories': ('n_categories', int)
+}
+
+
+def _convert(converter, value):
+    if value in (None, ''):
+        return None
+    if converter is int:
+        return int(float(value))
+    return converter(value)
+
+
+class TestCaseRecord:
+    """One catalog entry (a summary row) with lazily computed statistics"""
+    
+    __slots__ = tuple(attr for attr, _ in SUMMARY_COLUMNS.values()) + ('base_dir', '_stats')
+    
+    def __init__(self, base_dir=None, **fields):
+        for attr, _ in SUMMARY_COLUMNS.values():
+            setattr(self, attr, fields.get(attr))
+        self.base_dir = Path(base_dir) if base_dir is not None else None
+        self._stats = None
+    
+    @classmethod
+    def from_row(cls, row: Dict, base_dir=None) -> 'TestCaseRecord':
+        """Build a record from a summary row (summary column names)"""
+        fields = {attr: _convert(converter, row.get(column))
+                  for column, (attr, converter) in SUMMARY_COLUMNS.items()}
+        return cls(base_dir=base_dir, **fields)
+    
+    def to_dict(self) -> Dict:
+        """Summary row dict (same keys as test_cases_summary.csv)"""
+        return {column: getattr(self, attr) for column, (attr, _) in SUMMARY_COLUMNS.items()}
+    
+    @property
+    def path(self) -> Path:
+        """CSV file or binary instance directory of this test case"""
+        return (self.base_dir or Path('.')) / self.file
+    
+    @property
+    def stats(self) -> Dict:
+        """Per-instance statistics, computed from the instance arrays on first access"""
+        if self._stats is None:
+            self._stats = compute_instance_stats(self.path)
+        return self._stats
+    
+    def __repr__(self):
+        return f"TestCaseRecord({self.name!r}, type={self.type!r}, n_items={self.n_items})"
+
+
+def load_instance_data(path) -> Dict:
+    """Instance arrays for a test case CSV (via the binary cache) or a binary instance directory"""
+    from .instance_cache import load_instance_arrays, load_instance_cache
+    
+    path = Path(path)
+    if path.is_dir():
+        return load_instance_arrays(path)
+    return load_instance_cache(path)
+
+
+def compute_instance_stats(path) -> Dict:
+    """Summary statistics of an instance (weights, values, ratios, regions)"""
+    data = load_instance_data(path)
+    weights = np.asarray(data['weights'], dtype=np.float64)
+    values = np.asarray(data['values'], dtype=np.float64)
+    ratios = values / np.maximum(weights, 1e-12)
+    codes = np.asarray(data['region_codes'])
+    labels = data['meta']['regions']
+    counts = np.bincount(codes[codes >= 0], minlength=len(labels))
+    return {
+        'n_items': len(weights),
+        'total_weight': float(weights.sum()),
+        'total_value': float(values.sum()),
+        'weight_mean': float(weights.mean()) if len(weights) else 0.0,
+        'value_mean': float(values.mean()) if len(values) else 0.0,
+        'value_std': float(values.std()) if len(values) else 0.0,
+        'ratio_mean': float(ratios.mean()) if len(ratios) else 0.0,
+        'ratio_max': float(ratios.max()) if len(ratios) else 0.0,
+        'correlation': float(np.corrcoef(weights, values)[0, 1]) if len(weights) > 1 else 0.0,
+        'region_counts': {label: int(c) for label, c in zip(labels, counts)}
+    }
+
+
+class TestCaseCatalog:
+    """Name-keyed index of test case records with Type/Size/N_Regions queries"""
+    
+    def __init__(self):
+        self._records = {}  # name -> record (insertion ordered)
+        self._by_type = defaultdict(list)
+        self._by_size = defaultdict(list)
+        self._by_regions = defaultdict(list)
+    
+    @classmethod
+    def from_csv(cls, summary_path, base_dir=None) -> 'TestCaseCatalog':
+        """Compile a summary CSV into a catalog"""
+        catalog = cls()
+        catalog.register_summary(summary_path, base_dir)
+        return catalog
+    
+    def register_summary(self, summary_path, base_dir=None) -> int:
+        """Register every row of a summary CSV; returns the number of records"""
+        summary_path = Path(summary_path)
+        base_dir = base_dir if base_dir is not None else summary_path.parent
+        with open(summary_path, newline='') as f:
+            rows = list(csv.DictReader(f))
+        for row in rows:
+            self.register(TestCaseRecord.from_row(row, base_dir))
+        return len(rows)
+    
+    def register(self, record) -> TestCaseRecord:
+        """Add (or replace) a record; accepts a TestCaseRecord or a summary row dict"""
+        if isinstance(record, dict):
+            record = TestCaseRecord.from_row(record)
+        if record.name in self._records:
+            self._unindex(self._records[record.name])
+        self._records[record.name] = record
+        self._by_type[record.type].append(record.name)
+        self._by_size[record.size].append(record.name)
+        self._by_regions[record.n_regions].append(record.name)
+        return record
+    
+    def _unindex(self, record):
+        self._by_type[record.type].remove(record.name)
+        self._by_size[record.size].remove(record.name)
+        self._by_regions[record.n_regions].remove(record.name)
+    
+    def get(self, name: str) -> TestCaseRecord:
+        """Record by name (KeyError if unknown)"""
+        return self._records[name]
+    
+    def names(self) -> List[str]:
+        return list(self._records)
+    
+    def query(self, type: str = None, size: str = None, n_regions: int = None) -> List[TestCaseRecord]:
+        """Records matching all given criteria (scans only the smallest matching index)"""
+        criteria = [(index, key, attr) for index, key, attr in (
+            (self._by_type, type, 'type'),
+            (self._by_size, size, 'size'),
+            (self._by_regions, n_regions, 'n_regions')) if key is not None]
+        if not criteria:
+            return list(self._records.values())
+        candidates = min((index.get(key, []) for index, key, _ in criteria), key=len)
+        return [record for record in (self._records[name] for name in candidates)
+                if all(getattr(record, attr) == key for _, key, attr in criteria)]
+    
+    def types(self) -> List[str]:
+        return [t for t, names in self._by_type.items() if names]
+    
+    def __len__(self):
+        return len(self._records)
+    
+    def __contains__(self, name):
+        return name in self._records
+    
+    def __iter__(self) -> Iterator[TestCaseRecord]:
+        return iter(self._records.values())
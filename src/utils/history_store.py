@@ -0,0 +1,116 @@
+"""
+=================================================================================
+MODULE: Convergence History Store
+=================================================================================
+Compact binary storage for per-run convergence histories (best fitness per
+iteration), replacing the indented <name>_history.json files:
+
+  <name>_history.npz   (uncompressed, written atomically)
+      values     all histories concatenated, float32
+      offsets    int64, history k = values[offsets[k]:offsets[k + 1]]
+                 (CSR layout, as the GBFS checkpoints)
+      index      JSON string: one small dict per history (param_value,
+                 value, ...) plus 'meta' (experiment, param_name)
+
+- HistoryStore reads only the index when opened; the values array is
+  loaded on the first history access
+- Legacy <name>_history.json files are still readable (same interface)
+=================================================================================
+"""
+
+import json
+import os
+import numpy as np
+from typing import Dict, List, Optional, Sequence
+
+
+def write_histories(path, entries: List[Dict], histories: Sequence[Sequence[float]], **meta):
+    """
+    Atomically write histories and their index entries to an .npz file
+
+    Args:
+        path: Output file (.npz)
+        entries: One JSON-serializable dict per history (e.g. param_value, value)
+        histories: Sequences of floats, same length as entries
+        meta: Extra JSON-serializable fields stored with the index
+    """
+    if len(entries) != len(histories):
+        raise ValueError(f"{len(entries)} index entries for {len(histories)} histories")
+    path = str(path)
+    lengths = np.fromiter((len(h) for h in histories), dtype=np.int64, count=len(histories))
+    offsets = np.zeros(len(histories) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    values = np.concatenate([np.asarray(h, dtype=np.float32) for h in histories]) \
+        if len(histories) else np.zeros(0, dtype=np.float32)
+    index = json.dumps({'meta': meta, 'entries': entries}, default=_to_builtin)
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        np.savez(f, values=values, offsets=offsets, index=np.array(index))
+    os.replace(tmp_path, path)
+
+
+def _to_builtin(value):
+    """json.dumps fallback for numpy scalars"""
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Not JSON serializable: {type(value).__name__}")
+
+
+class HistoryStore:
+    """Read side of write_histories (or of a legacy _history.json file)"""
+
+    def __init__(self, path):
+        self.path = str(path)
+        self._values = None
+        self._offsets = None
+        self._legacy = None
+        if self.path.endswith('.json'):
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            results = data.get('results', [])
+            self.meta = {k: v for k, v in data.items() if k != 'results'}
+            self.entries = [{k: v for k, v in r.items() if k != 'best_fitness_history'} for r in results]
+            self._legacy = [r.get('best_fitness_history', []) for r in results]
+        else:
+            with np.load(self.path, allow_pickle=False) as data:
+                index = json.loads(str(data['index']))
+            self.meta = index['meta']
+            self.entries = index['entries']
+
+    def __len__(self):
+        return len(self.entries)
+
+    def _load(self):
+        if self._values is None:
+            with np.load(self.path, allow_pickle=False) as data:
+                self._values = data['values']
+                self._offsets = data['offsets']
+
+    def history(self, k: int) -> np.ndarray:
+        """History of the k-th entry (float32 array)"""
+        if self._legacy is not None:
+            return np.asarray(self._legacy[k], dtype=np.float32)
+        self._load()
+        return self._values[self._offsets[k]:self._offsets[k + 1]]
+
+    def by(self, field: str) -> Dict:
+        """Map entry[field] -> history, e.g. by('param_value')"""
+        return {entry[field]: self.history(k) for k, entry in enumerate(self.entries)}
+
+
+def open_history_store(base_path) -> Optional[HistoryStore]:
+    """
+    Open '<base_path>_history.npz', falling back to '<base_path>_history.json'
+
+    Returns:
+        HistoryStore, or None when neither file exists
+    """
+    for extension in ('.npz', '.json'):
+        path = f'{base_path}_history{extension}'
+        if os.path.exists(path):
+            return HistoryStore(path)
+    return None
@@ -0,0 +1,112 @@
+"""
+=================================================================================
+MODULE: Typed, Column-Pruned Ingestion
+=================================================================================
+Single entry point for reading instance data from CSV / xlsx:
+
+- Only the used columns are read (Quantity, Total, Region, Category)
+- Explicit dtypes: int32 quantities, float64 values (float32 rounds large
+  revenues), categorical region/category
+- Each file is parsed at most once per session (memo keyed by path, mtime
+  and size); callers that add columns must .copy() the returned frame
+- data/sales_data.xlsx is converted once into the binary columnar cache
+  (instance_cache layout) because reading xlsx through openpyxl is slow
+=================================================================================
+"""
+
+import threading
+from pathlib import Path
+from typing import Dict
+
+from .instance_cache import (
+    cache_is_fresh, frame_to_instance_arrays, write_instance_arrays,
+    load_instance_arrays, source_stamp
+)
+
+
+INSTANCE_DTYPES = {
+    'Quantity': 'int32',
+    'Total': 'float64',
+    'Region': 'category',
+    'Category': 'category'
+}
+
+# sales_data.xlsx column -> instance column
+SALES_COLUMN_MAP = {
+    'Quantity_Sold': 'Quantity',
+    'Sales_Amount': 'Total',
+    'Region': 'Region',
+    'Product_Category': 'Category'
+}
+
+_session_frames = {}  # (path, mtime_ns, size) -> DataFrame
+_session_lock = threading.Lock()
+
+
+def read_instance_frame(csv_path):
+    """
+    Read the used columns of an instance CSV with compact dtypes
+    
+    Parsed once per session; the returned DataFrame is shared.
+    """
+    import pandas as pd
+    
+    csv_path = Path(csv_path).resolve()
+    stamp = source_stamp(csv_path)
+    key = (str(csv_path), stamp['source_mtime_ns'], stamp['source_size'])
+    frame = _session_frames.get(key)
+    if frame is None:
+        header = pd.read_csv(csv_path, nrows=0).columns
+        usecols = [c for c in INSTANCE_DTYPES if c in header]
+        frame = pd.read_csv(csv_path, usecols=usecols,
+                            dtype={c: INSTANCE_DTYPES[c] for c in usecols})
+        frame = frame[usecols]
+        with _session_lock:
+            for stale in [k for k in _session_frames if k[0] == key[0]]:
+                del _session_frames[stale]
+            _session_frames[key] = frame
+    return frame
+
+
+def clear_session_frames():
+    """Forget all frames parsed in this session"""
+    _session_frames.clear()
+
+
+def default_sales_cache_dir(xlsx_path) -> Path:
+    """Default cache location for a workbook: '.cache/<stem>' next to it"""
+    xlsx_path = Path(xlsx_path)
+    return xlsx_path.parent / '.cache' / xlsx_path.stem
+
+
+def convert_sales_workbook(xlsx_path='data/sales_data.xlsx', out_dir=None) -> Path:
+    """
+    Convert the sales workbook once into the binary columnar cache
+    
+    Reconverts only when the workbook's mtime/size changed. Requires openpyxl
+    for the (one-time) conversion.
+    """
+    import pandas as pd
+    
+    xlsx_path = Path(xlsx_path)
+    out_dir = Path(out_dir or default_sales_cache_dir(xlsx_path))
+    if cache_is_fresh(out_dir, xlsx_path):
+        return out_dir
+    
+    try:
+        df = pd.read_excel(xlsx_path, usecols=list(SALES_COLUMN_MAP), engine='openpyxl')
+    except ImportError as e:
+        raise ImportError(
+            f"Converting {xlsx_path} requires openpyxl: pip install openpyxl"
+        ) from e
+    df = df.rename(columns=SALES_COLUMN_MAP).astype(INSTANCE_DTYPES)
+    
+    arrays, meta = frame_to_instance_arrays(df)
+    meta.update(source_stamp(xlsx_path))
+    write_instance_arrays(out_dir, arrays, meta)
+    return out_dir
+
+
+def load_sales_data(xlsx_path='data/sales_data.xlsx', out_dir=None, mmap_mode='r') -> Dict:
+    """Memory-mapped arrays of the sales workbook (converted on first use)"""
+    return load_instance_arrays(convert_sales_workbook(xlsx_path, out_dir), mmap_mode)
@@ -0,0 +1,205 @@
+"""
+=================================================================================
+MODULE: Binary Instance Cache
+=================================================================================
+Compiled, memory-mapped copy of a test case CSV:
+
+  <cache_dir>/<csv stem>/
+      weights.npy          Quantity column (int32)
+      values.npy           Total column (float64)
+      region_codes.npy     int codes into meta['regions'] (-1 = missing)
+      category_codes.npy   int codes into meta['categories'] (-1 = missing)
+      meta.json            labels, n_items, source file mtime/size
+
+- Only the 4 used columns are read from the CSV (Quantity, Total, Region,
+  Category) through ingest.read_instance_frame, once; later loads np.load(..., mmap_mode='r') the arrays so
+  worker processes share the same pages
+- meta.json is written last; the cache is rebuilt automatically when it is
+  missing or the source CSV's mtime/size changed
+- A (re)build writes into a private staging directory next to the cache
+  and renames it into place (publish_directory), so processes rebuilding
+  the same stem at once never mix or truncate each other's files
+=================================================================================
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import numpy as np
+from pathlib import Path
+from typing import Dict
+
+
+CACHE_FORMAT = 3  # 3: float64 values (2 stored float32, rounding revenues)
+ARRAY_NAMES = ('weights', 'values', 'region_codes', 'category_codes')
+LOAD_ATTEMPTS = 5  # Retries while a concurrent rebuild publishes the directory
+
+
+def default_cache_dir(csv_path) -> Path:
+    """Default cache location: '.cache' next to the CSV file"""
+    return Path(csv_path).parent / '.cache'
+
+
+def source_stamp(path) -> Dict:
+    """mtime/size of a source file, stored in meta.json to detect changes"""
+    stat = os.stat(path)
+    return {'source_mtime_ns': stat.st_mtime_ns, 'source_size': stat.st_size}
+
+
+def encode_labels(column):
+    """Encode a label column as (int32 codes, list of labels); None/NaN -> -1"""
+    if column is None:
+        return None, []
+    codes, labels = column.factorize(sort=True)
+    return codes.astype(np.int32), [str(label) for label in labels]
+
+
+def frame_to_instance_arrays(df):
+    """Convert an instance DataFrame (Quantity, Total, Region, Category) to cache arrays + meta"""
+    n = len(df)
+    region_codes, region_labels = encode_labels(df['Region'] if 'Region' in df.columns else None)
+    category_codes, category_labels = encode_labels(df['Category'] if 'Category' in df.columns else None)
+    missing = np.full(n, -1, dtype=np.int32)
+    
+    arrays = {
+        'weights': df['Quantity'].to_numpy(dtype=np.int32),
+        'values': df['Total'].to_numpy(dtype=np.float64),
+        'region_codes': region_codes if region_codes is not None else missing,
+        'category_codes': category_codes if category_codes is not None else missing
+    }
+    meta = {
+        'n_items': n,
+        'regions': region_labels,
+        'categories': category_labels,
+        'has_regions': 'Region' in df.columns,
+        'has_categories': 'Category' in df.columns
+    }
+    return arrays, meta
+
+
+def staging_directory(out_dir) -> Path:
+    """Private (per process and call) build directory next to out_dir"""
+    out_dir = Path(out_dir)
+    out_dir.parent.mkdir(parents=True, exist_ok=True)
+    return Path(tempfile.mkdtemp(prefix=f'.{out_dir.name}.build-', dir=out_dir.parent))
+
+
+def publish_directory(staging_dir, out_dir):
+    """
+    Move a completely written staging directory to out_dir
+    
+    An existing out_dir is renamed away first (a directory can only be
+    renamed over an empty one). If another process publishes in between,
+    its cache is kept and ours is dropped: both come from the same source.
+    """
+    staging_dir, out_dir = Path(staging_dir), Path(out_dir)
+    try:
+        os.replace(staging_dir, out_dir)
+        return
+    except OSError:
+        pass  # out_dir exists and is not empty
+    old_dir = Path(tempfile.mkdtemp(prefix=f'.{out_dir.name}.old-', dir=out_dir.parent))
+    try:
+        os.replace(out_dir, old_dir)
+    except FileNotFoundError:
+        pass
+    try:
+        os.replace(staging_dir, out_dir)
+    except OSError:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+    shutil.rmtree(old_dir, ignore_errors=True)  # Open memmaps keep their pages
+
+
+def write_instance_arrays(out_dir, arrays: Dict, meta: Dict):
+    """Write cache arrays + meta.json into a staging directory, then publish it"""
+    staging_dir = staging_directory(out_dir)
+    for name in ARRAY_NAMES:
+        np.save(staging_dir / f'{name}.npy', np.ascontiguousarray(arrays[name]))
+    write_cache_meta(staging_dir, meta)
+    publish_directory(staging_dir, out_dir)
+
+
+def write_cache_meta(out_dir, meta: Dict):
+    """Atomically write meta.json, which marks the cache directory complete"""
+    out_dir = Path(out_dir)
+    meta = dict(meta, format=CACHE_FORMAT)
+    fd, tmp_path = tempfile.mkstemp(prefix='meta.json.', suffix='.tmp', dir=out_dir)
+    with os.fdopen(fd, 'w') as f:
+        json.dump(meta, f)
+    os.replace(tmp_path, out_dir / 'meta.json')
+
+
+def build_instance_cache(csv_path, cache_dir=None) -> Path:
+    """Parse a test case CSV (used columns only) into the binary cache"""
+    from .ingest import read_instance_frame
+    
+    csv_path = Path(csv_path)
+    out_dir = Path(cache_dir or default_cache_dir(csv_path)) / csv_path.stem
+    
+    arrays, meta = frame_to_instance_arrays(read_instance_frame(csv_path))
+    meta.update(source_stamp(csv_path))
+    write_instance_arrays(out_dir, arrays, meta)
+    return out_dir
+
+
+def read_cache_meta(out_dir):
+    """Read meta.json of a cache directory (None if missing or unreadable)"""
+    try:
+        with open(Path(out_dir) / 'meta.json') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def cache_is_fresh(out_dir, source_path) -> bool:
+    """True if out_dir holds a current-format cache of source_path's current version"""
+    meta = read_cache_meta(out_dir)
+    if meta is None or meta.get('format') != CACHE_FORMAT:
+        return False
+    return all(meta.get(k) == v for k, v in source_stamp(source_path).items())
+
+
+def load_instance_arrays(out_dir, mmap_mode='r') -> Dict:
+    """Memory-map the arrays of a cache directory"""
+    out_dir = Path(out_dir)
+    meta = read_cache_meta(out_dir)
+    if meta is None:
+        raise FileNotFoundError(f"No instance cache at {out_dir}")
+    n = meta['n_items']
+    # Arrays may be longer than n_items (streamed files are preallocated)
+    data = {name: np.load(out_dir / f'{name}.npy', mmap_mode=mmap_mode)[:n] for name in ARRAY_NAMES}
+    data['meta'] = meta
+    return data
+
+
+def load_instance_cache(csv_path, cache_dir=None, mmap_mode='r') -> Dict:
+    """
+    Load a test case through the binary cache, rebuilding it when stale
+    
+    Returns:
+        Dict with memory-mapped 'weights', 'values', 'region_codes',
+        'category_codes' and the 'meta' dict (labels, n_items, ...)
+    """
+    csv_path = Path(csv_path)
+    out_dir = Path(cache_dir or default_cache_dir(csv_path)) / csv_path.stem
+    
+    for attempt in range(LOAD_ATTEMPTS):
+        if not cache_is_fresh(out_dir, csv_path):
+            build_instance_cache(csv_path, cache_dir)
+        try:
+            return load_instance_arrays(out_dir, mmap_mode)
+        except FileNotFoundError:
+            # Swapped out by a concurrent rebuild between the check and the load
+            if attempt == LOAD_ATTEMPTS - 1:
+                raise
+
+
+def decode_labels(codes, labels, present=True):
+    """Object array of labels for codes (None where code is -1 or column missing)"""
+    decoded = np.full(len(codes), None, dtype=object)
+    if present and len(labels) > 0:
+        lookup = np.array(labels, dtype=object)
+        mask = np.asarray(codes) >= 0
+        decoded[mask] = lookup[np.asarray(codes)[mask]]
+    return decoded
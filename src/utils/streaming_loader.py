@@ -0,0 +1,208 @@
+"""
+=================================================================================
+MODULE: Chunked Streaming Loader for Catalogs Larger than RAM
+=================================================================================
+Streams a (huge) sales CSV into the binary instance cache layout without ever
+holding the whole file in memory:
+
+1. Count data rows with a raw byte scan (no parsing) to preallocate .npy files
+2. Read the CSV in chunks (used columns only, compact dtypes) and write
+   weights / values / region & category codes straight into memory-mapped
+   .npy files
+3. Accumulate summary statistics in the same pass: sums, sums of squares and
+   cross products (-> correlation), per-region counts
+
+The result loads with load_streamed_instance() as memmaps that the solvers
+use directly (items are named lazily, regions are integer codes).
+=================================================================================
+"""
+
+import numpy as np
+from pathlib import Path
+from typing import Dict
+
+from .instance_cache import (load_instance_arrays, source_stamp, write_cache_meta,
+                             staging_directory, publish_directory)
+from .ingest import INSTANCE_DTYPES
+
+
+class ItemNames:
+    """Lazy sequence of item names 'Item_1'..'Item_n' (no per-item strings in memory)"""
+    
+    def __init__(self, n):
+        self.n = n
+    
+    def __len__(self):
+        return self.n
+    
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[k] for k in range(*i.indices(self.n))]
+        if i < 0:
+            i += self.n
+        if not 0 <= i < self.n:
+            raise IndexError(i)
+        return f"Item_{i + 1}"
+    
+    def __iter__(self):
+        return (f"Item_{i + 1}" for i in range(self.n))
+
+
+def count_data_rows(csv_path, block_size=1 << 24) -> int:
+    """Number of lines after the header (upper bound on parsed rows)"""
+    lines = 0
+    last = b'\n'
+    with open(csv_path, 'rb') as f:
+        while True:
+            block = f.read(block_size)
+            if not block:
+                break
+            lines += block.count(b'\n')
+            last = block[-1:]
+    if last != b'\n':
+        lines += 1  # Last line without trailing newline
+    return max(lines - 1, 0)
+
+
+class _LabelEncoder:
+    """Incremental label -> code mapping across chunks (codes in first-seen order)"""
+    
+    def __init__(self):
+        self.codes = {}
+        self.labels = []
+    
+    def encode(self, column):
+        import pandas as pd
+        
+        chunk_codes, uniques = pd.factorize(column)
+        lookup = np.empty(len(uniques), dtype=np.int32)
+        for k, label in enumerate(uniques):
+            label = str(label)
+            if label not in self.codes:
+                self.codes[label] = len(self.labels)
+                self.labels.append(label)
+            lookup[k] = self.codes[label]
+        codes = np.full(len(chunk_codes), -1, dtype=np.int32)
+        present = chunk_codes >= 0
+        codes[present] = lookup[chunk_codes[present]]
+        return codes
+
+
+def stream_csv_to_cache(csv_path, out_dir=None, chunksize=1_000_000, column_map=None) -> Path:
+    """
+    Stream a CSV into a memory-mapped instance cache in one pass
+    
+    Args:
+        csv_path: Source CSV
+        out_dir: Cache directory (default: '.cache/<stem>' next to the CSV)
+        chunksize: Rows per parsed chunk
+        column_map: Optional source column -> instance column renames
+                    (e.g. {'Quantity_Sold': 'Quantity', 'Sales_Amount': 'Total'})
+    
+    Returns:
+        Path of the cache directory
+    """
+    import pandas as pd
+    
+    csv_path = Path(csv_path)
+    out_dir = Path(out_dir or csv_path.parent / '.cache' / csv_path.stem)
+    staging_dir = staging_directory(out_dir)  # Published when complete
+    column_map = column_map or {}
+    source_columns = {column_map.get(c, c): c for c in pd.read_csv(csv_path, nrows=0).columns}
+    usecols = [source_columns[c] for c in INSTANCE_DTYPES if c in source_columns]
+    numeric = {source_columns[c]: INSTANCE_DTYPES[c] for c in ('Quantity', 'Total')}
+    
+    capacity = count_data_rows(csv_path)
+    out = {
+        'weights': np.lib.format.open_memmap(staging_dir / 'weights.npy', mode='w+', dtype=np.int32, shape=(capacity,)),
+        'values': np.lib.format.open_memmap(staging_dir / 'values.npy', mode='w+', dtype=np.float64, shape=(capacity,)),
+        'region_codes': np.lib.format.open_memmap(staging_dir / 'region_codes.npy', mode='w+', dtype=np.int32, shape=(capacity,)),
+        'category_codes': np.lib.format.open_memmap(staging_dir / 'category_codes.npy', mode='w+', dtype=np.int32, shape=(capacity,))
+    }
+    
+    regions = _LabelEncoder()
+    categories = _LabelEncoder()
+    sums = np.zeros(5)  # sum w, sum v, sum w^2, sum v^2, sum w*v
+    region_counts = np.zeros(0, dtype=np.int64)
+    n = 0
+    
+    for chunk in pd.read_csv(csv_path, usecols=usecols, dtype=numeric, chunksize=chunksize):
+        chunk = chunk.rename(columns={v: k for k, v in source_columns.items()})
+        m = len(chunk)
+        w = chunk['Quantity'].to_numpy(dtype=np.int32)
+        v = chunk['Total'].to_numpy(dtype=np.float64)
+        out['weights'][n:n + m] = w
+        out['values'][n:n + m] = v
+        out['region_codes'][n:n + m] = (regions.encode(chunk['Region'])
+                                         if 'Region' in chunk.columns else -1)
+        out['category_codes'][n:n + m] = (categories.encode(chunk['Category'])
+                                           if 'Category' in chunk.columns else -1)
+        
+        # One-pass summary statistics
+        wf = w.astype(np.float64)
+        vf = v.astype(np.float64)
+        sums += (wf.sum(), vf.sum(), wf @ wf, vf @ vf, wf @ vf)
+        codes = out['region_codes'][n:n + m]
+        counts = np.bincount(codes[codes >= 0], minlength=len(regions.labels))
+        region_counts = np.pad(region_counts, (0, len(counts) - len(region_counts))) + counts
+        n += m
+    
+    for array in out.values():
+        array.flush()
+    del out
+    
+    sum_w, sum_v, sum_ww, sum_vv, sum_wv = sums
+    cov = sum_wv - sum_w * sum_v / n if n else 0.0
+    var_w = sum_ww - sum_w ** 2 / n if n else 0.0
+    var_v = sum_vv - sum_v ** 2 / n if n else 0.0
+    correlation = cov / np.sqrt(var_w * var_v) if var_w > 0 and var_v > 0 else 0.0
+    
+    header_columns = set(source_columns)
+    write_cache_meta(staging_dir, {
+        'n_items': n,
+        'regions': regions.labels,
+        'categories': categories.labels,
+        'has_regions': 'Region' in header_columns,
+        'has_categories': 'Category' in header_columns,
+        'stats': {
+            'total_weight': float(sum_w),
+            'total_value': float(sum_v),
+            'avg_value': float(sum_v / n) if n else 0.0,
+            'correlation': float(correlation),
+            'region_counts': {label: int(c) for label, c in zip(regions.labels, region_counts)}
+        },
+        **source_stamp(csv_path)
+    })
+    publish_directory(staging_dir, out_dir)
+    return out_dir
+
+
+def load_streamed_instance(out_dir, capacity_ratio=None, mmap_mode='r') -> Dict:
+    """
+    Problem dict over a streamed or generated cache (memmaps, no copies)
+    
+    'regions' holds integer region codes (-1 = missing); the labels are in
+    'region_labels'. Capacity: capacity_ratio * total weight, by default the
+    capacity stored in meta.json (generated instances) or 15%.
+    """
+    data = load_instance_arrays(out_dir, mmap_mode)
+    meta = data['meta']
+    stats = meta.get('stats', {})
+    total_weight = stats.get('total_weight', float(data['weights'].sum(dtype=np.int64)))
+    return {
+        'items': ItemNames(meta['n_items']),
+        'weights': data['weights'],
+        'values': data['values'],
+        'regions': data['region_codes'] if meta['has_regions'] else None,
+        'region_labels': meta['regions'],
+        'category_codes': data['category_codes'],
+        'category_labels': meta['categories'],
+        'capacity': (int(meta['capacity']) if capacity_ratio is None and 'capacity' in meta
+                     else int(total_weight * (capacity_ratio if capacity_ratio is not None else 0.15))),
+        'n_items': meta['n_items'],
+        'total_weight': total_weight,
+        'total_value': stats.get('total_value'),
+        'correlation': stats.get('correlation'),
+        'region_counts': stats.get('region_counts'),
+        'n_regions': len(meta['regions'])
+    }
@@ -10,42 +10,104 @@ STRATEGY:
 - Scenarios: Region (4×3), Category (4×3), Mixed (2×3)
 - Names match with data_generator output
 
+CACHING:
+- Loaded test cases are kept in a bounded LRU cache keyed by
+  (name, capacity_ratio, file mtime); editing the CSV invalidates the entry
+- Test cases hold numpy arrays, not lists: items is a tuple, weights
+  (int32) / values (float64) / regions / categories are read-only arrays
+  shared between callers, so solvers can reuse one load safely instead of
+  reloading to avoid mutation (copy before modifying or json-serializing)
+- On disk, each CSV is compiled once into .npy arrays (instance_cache.py)
+  that are memory-mapped on later loads and rebuilt when the CSV changes
+- The summary is compiled into a name-keyed TestCaseCatalog (catalog.py);
+  generated instance suites (src/data_generator.py) can be registered too
+- capacity_variants() derives many capacities from one load (shared arrays)
+- iter_test_cases() loads many instances on a thread pool with a bounded
+  prefetch window, so loading instance k+1 overlaps solving instance k
+
+IMPORTS:
+- Only NumPy at import time; pandas is imported when a CSV has to be
+  (re)compiled or a DataFrame view is requested
+
 =================================================================================
 """
 
-import pandas as pd
 import numpy as np
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from typing import Dict, List, Tuple
 from pathlib import Path
 
+from .instance_cache import load_instance_cache, decode_labels
+from .catalog import TestCaseCatalog, load_instance_data
+from .ingest import read_instance_frame
+
+
+def _readonly(array):
+    """Mark a numpy array read-only and return it"""
+    array.setflags(write=False)
+    return array
+
 
 class TestCaseLoader:
     """Load test cases from CSV files"""
     
-    def __init__(self, test_cases_dir='data/test_cases'):
+    def __init__(self, test_cases_dir='data/test_cases', cache_size=32, binary_cache_dir=None):
         self.test_cases_dir = Path(test_cases_dir)
+        self.binary_cache_dir = binary_cache_dir  # None: data/test_cases/.cache
+        
+        # LRU cache: (name, capacity_ratio, mtime_ns) -> test case dict
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()  # iter_test_cases loads from threads
         
-        # Load summary file
+        # Load summary file (test_cases_summary.csv, or summary.csv of a generated suite)
         summary_path = self.test_cases_dir / 'test_cases_summary.csv'
+        if not summary_path.exists() and (self.test_cases_dir / 'summary.csv').exists():
+            summary_path = self.test_cases_dir / 'summary.csv'
         if summary_path.exists():
-            self.summary = pd.read_csv(summary_path)
-            print(f" Loaded {len(self.summary)} test cases from {test_cases_dir}/")
+            self.catalog = TestCaseCatalog.from_csv(summary_path, base_dir=self.test_cases_dir)
+            print(f" Loaded {len(self.catalog)} test cases from {test_cases_dir}/")
         else:
             raise FileNotFoundError(
                 f"  Summary file not found at {summary_path}\n"
-                f"Please run: python src/data_generator.py"
+                f"Please run: python src/data_generator.py --out {test_cases_dir}"
             )
     
+    @property
+    def summary(self):
+        """Summary table as a pandas DataFrame (built on demand from the catalog)"""
+        import pandas as pd  # Optional: only needed for the DataFrame view
+        return pd.DataFrame([record.to_dict() for record in self.catalog])
+    
+    def register_instances(self, summary_path, base_dir=None) -> int:
+        """
+        Register an additional suite (e.g. data/generated/summary.csv)
+        
+        Returns:
+            Number of registered test cases
+        """
+        return self.catalog.register_summary(summary_path, base_dir)
+    
     def list_test_cases(self) -> List[str]:
         """Get list of all available test case names"""
-        return self.summary['Name'].tolist()
+        return self.catalog.names()
     
     def get_test_case_info(self, name: str) -> Dict:
         """Get information about a test case"""
-        row = self.summary[self.summary['Name'] == name]
-        if len(row) == 0:
+        try:
+            return self.catalog.get(name).to_dict()
+        except KeyError:
             raise ValueError(f"Test case '{name}' not found")
-        return row.iloc[0].to_dict()
+    
+    def query_test_cases(self, type: str = None, size: str = None, n_regions: int = None) -> List[str]:
+        """Names of test cases matching Type / Size / N_Regions"""
+        return [record.name for record in self.catalog.query(type=type, size=size, n_regions=n_regions)]
+    
+    def get_test_case_stats(self, name: str) -> Dict:
+        """Per-instance statistics (computed lazily, cached on the record)"""
+        return self.catalog.get(name).stats
     
     def load_test_case(self, name: str, capacity_ratio: float = None) -> Dict:
         """
@@ -57,32 +119,96 @@ class TestCaseLoader:
         
         Returns:
             Dict with keys: items, weights, values, capacity, ...
+            
+            Array contract (not lists): items is a tuple of names; weights
+            (int32), values (float64), regions and categories (object) are
+            read-only numpy arrays shared with the cache. Callers that need
+            to modify them, or to json-serialize them, take a copy first
+            (np.array(...) / .tolist()).
         """
         # Get file info
         try:
-            info = self.get_test_case_info(name)
-            filepath = self.test_cases_dir / info['File']
-        except (KeyError, ValueError) as e:
-            raise ValueError(f"Failed to load test case '{name}': {e}")
+            record = self.catalog.get(name)
+        except KeyError:
+            raise ValueError(f"Failed to load test case '{name}': not found")
+        info = record.to_dict()
+        filepath = record.path
         
-        # Load CSV
+        # Load CSV (or binary instance directory)
         if not filepath.exists():
             raise FileNotFoundError(f"Test case file not found: {filepath}")
         
-        df = pd.read_csv(filepath)
+        stamp_path = filepath / 'meta.json' if filepath.is_dir() else filepath
+        key = (name, capacity_ratio, stamp_path.stat().st_mtime_ns)
+        with self._cache_lock:
+            test_case = self._cache.get(key)
+            if test_case is not None:
+                self._cache.move_to_end(key)
+                return dict(test_case)
+        
+        test_case = self._read_test_case(name, info, filepath, capacity_ratio)
+        
+        with self._cache_lock:
+            # Drop entries built from an older version of the file
+            for stale in [k for k in self._cache if k[0] == name and k[2] != key[2]]:
+                del self._cache[stale]
+            self._cache[key] = test_case
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return dict(test_case)
+    
+    def capacity_variants(self, name: str, capacity_ratios: List[float] = None,
+                          capacities: List[int] = None) -> List[Dict]:
+        """
+        Several capacity variants of one test case, loaded once
+        
+        Variants share the read-only arrays of a single load; only
+        'capacity' (and 'capacity_ratio') differ.
+        
+        Args:
+            name: Test case name
+            capacity_ratios: Capacities as fractions of the total weight
+            capacities: Absolute capacities (used if capacity_ratios is None)
+        """
+        base = self.load_test_case(name)
+        if capacity_ratios is not None:
+            capacities = [int(base['total_weight'] * ratio) for ratio in capacity_ratios]
+        elif capacities is None:
+            raise ValueError("Either capacity_ratios or capacities is required")
+        
+        variants = []
+        for capacity in capacities:
+            variant = dict(base)
+            variant['capacity'] = int(capacity)
+            variant['capacity_ratio'] = capacity / base['total_weight'] if base['total_weight'] else 0.0
+            variants.append(variant)
+        return variants
+    
+    def _read_test_case(self, name: str, info: Dict, filepath: Path,
+                        capacity_ratio: float = None) -> Dict:
+        """Load a test case (via the binary cache) into a dict of read-only arrays"""
+        if filepath.is_dir():
+            data = load_instance_data(filepath)
+        else:
+            data = load_instance_cache(filepath, self.binary_cache_dir)
+        meta = data['meta']
         
-        # Extract data
-        items = [f"Item_{i+1}" for i in range(len(df))]
-        weights = df['Quantity'].values.tolist()
-        values = df['Total'].values.tolist()
+        # Extract data (memory-mapped, read-only)
+        items = tuple(f"Item_{i+1}" for i in range(meta['n_items']))
+        weights = data['weights']
+        values = data['values']
+        if values.dtype != np.float64:
+            # Generated instances store float32 values (exactly representable)
+            values = _readonly(values.astype(np.float64))
         
         # Extract Region and Category (for Multi-Objective)
-        regions = df['Region'].values.tolist() if 'Region' in df.columns else [None] * len(df)
-        categories = df['Category'].values.tolist() if 'Category' in df.columns else [None] * len(df)
+        regions = _readonly(decode_labels(data['region_codes'], meta['regions'], meta['has_regions']))
+        categories = _readonly(decode_labels(data['category_codes'], meta['categories'], meta['has_categories']))
         
         # Capacity
+        total_weight = int(weights.sum(dtype=np.int64))
         if capacity_ratio is not None:
-            capacity = int(sum(weights) * capacity_ratio)
+            capacity = int(total_weight * capacity_ratio)
         else:
             capacity = int(info['Capacity'])
         
@@ -98,14 +224,28 @@ class TestCaseLoader:
             'file': info['File'],
             'type': info['Type'],
             'size': info['Size'],
-            'total_weight': sum(weights),
-            'total_value': sum(values),
-            'avg_value': np.mean(values),
+            'total_weight': total_weight,
+            'total_value': float(values.sum(dtype=np.float64)),
+            'avg_value': float(np.mean(values, dtype=np.float64)),
             'correlation': np.corrcoef(weights, values)[0, 1],
             'n_regions': int(info['N_Regions']),
             'n_categories': int(info['N_Categories'])
         }
     
+    def load_test_case_frame(self, name: str):
+        """
+        Test case as a DataFrame (Quantity, Total, Region, Category only)
+        
+        The file is parsed once per session; a copy is returned so callers
+        may add columns.
+        """
+        return read_instance_frame(self.catalog.get(name).path).copy()
+    
+    def clear_cache(self):
+        """Drop all cached test cases"""
+        with self._cache_lock:
+            self._cache.clear()
+    
     def load_by_region(self, region: str, size: str = 'medium') -> Dict:
         """
         Load test case by region
@@ -138,17 +278,61 @@ class TestCaseLoader:
         name = f'High_Value_{size}'
         return self.load_test_case(name)
     
-    def get_all_test_cases(self, size: str = 'medium') -> List[Dict]:
-        """Get all test cases of a specific size"""
-        test_cases = []
-        for name in self.list_test_cases():
-            if name.endswith(f'_{size}'):
+    def iter_test_cases(self, names: List[str] = None, capacity_ratio: float = None,
+                        max_workers: int = 4, prefetch: int = 4, ordered: bool = True,
+                        skip_errors: bool = False):
+        """
+        Load many test cases concurrently, yielding (name, test_case) as they are ready
+        
+        At most `prefetch` loads are in flight; the next one is submitted
+        when the consumer takes a result, so a sweep overlaps loading the
+        next instance with solving the current one.
+        
+        Args:
+            names: Test case names (default: all)
+            capacity_ratio: Passed to load_test_case
+            max_workers: Loader threads
+            prefetch: Maximum number of loaded-but-not-consumed instances
+            ordered: Yield in the order of names (False: as completed)
+            skip_errors: Print and skip instances that fail to load
+        """
+        names = list(dict.fromkeys(names if names is not None else self.list_test_cases()))
+        pending_names = iter(names)
+        in_flight = deque()
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            def submit_next():
+                name = next(pending_names, None)
+                if name is not None:
+                    future = pool.submit(self.load_test_case, name, capacity_ratio)
+                    future.test_case_name = name
+                    in_flight.append(future)
+            
+            for _ in range(max(prefetch, 1)):
+                submit_next()
+            
+            while in_flight:
+                if ordered:
+                    future = in_flight.popleft()
+                else:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    future = next(f for f in in_flight if f in done)
+                    in_flight.remove(future)
+                submit_next()
+                
                 try:
-                    tc = self.load_test_case(name)
-                    test_cases.append(tc)
+                    test_case = future.result()
                 except Exception as e:
-                    print(f"  Failed to load {name}: {e}")
-        return test_cases
+                    if not skip_errors:
+                        raise
+                    print(f"  Failed to load {future.test_case_name}: {e}")
+                    continue
+                yield future.test_case_name, test_case
+    
+    def get_all_test_cases(self, size: str = 'medium') -> List[Dict]:
+        """Get all test cases of a specific size"""
+        return [tc for _, tc in self.iter_test_cases(self.query_test_cases(size=size),
+                                                     skip_errors=True)]
     
     def print_summary(self):
         """Print summary of all test cases"""
@@ -156,15 +340,13 @@ class TestCaseLoader:
         print("TEST CASES SUMMARY")
         print("="*80)
         
-        # Group by type and size
-        for test_type in ['region', 'category', 'mixed']:
-            type_cases = self.summary[self.summary['Type'] == test_type]
-            if len(type_cases) > 0:
-                print(f"\n{test_type.upper()}:")
-                for _, row in type_cases.iterrows():
-                    print(f"  - {row['Name']}: {row['N_Items']} items, "
-                          f"capacity={row['Capacity']}, "
-                          f"correlation={row['Correlation_VW']:.3f}")
+        # Group by type
+        for test_type in self.catalog.types():
+            print(f"\n{test_type.upper()}:")
+            for record in self.catalog.query(type=test_type):
+                print(f"  - {record.name}: {record.n_items} items, "
+                      f"capacity={record.capacity}, "
+                      f"correlation={record.correlation:.3f}")
 
 
 def load_data():
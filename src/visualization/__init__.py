@@ -1,16 +1,25 @@
 """
 Visualization Module
 Contains visualization functions for algorithm results and analysis
+
+Submodules import matplotlib/seaborn, so they are loaded on first attribute
+access (importing src.visualization itself stays cheap).
 """
 
-from .step_by_step_visualizer import (
-    visualize_gbfs_selection_steps,
-    visualize_bpso_swarm_behavior
-)
-from .advanced_visualizer import AdvancedKnapsackVisualizer
+import importlib
+
+_EXPORTS = {
+    'visualize_gbfs_selection_steps': '.step_by_step_visualizer',
+    'visualize_bpso_swarm_behavior': '.step_by_step_visualizer',
+    'AdvancedKnapsackVisualizer': '.advanced_visualizer'
+}
+
+__all__ = list(_EXPORTS)
+
 
-__all__ = [
-    'visualize_gbfs_selection_steps',
-    'visualize_bpso_swarm_behavior',
-    'AdvancedKnapsackVisualizer'
-]
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -20,7 +20,8 @@ import numpy as np
 import pandas as pd
 from typing import List, Dict, Tuple
 import os
-import json
+
+from ..utils.history_store import open_history_store
 
 # Set style
 sns.set_style("whitegrid")
@@ -145,7 +146,8 @@ class AdvancedKnapsackVisualizer:
             results_df: DataFrame với columns [param_value, value, time, convergence_iter, best_fitness_history]
             param_name: 'n_particles', 'max_iterations', 'w', 'c1', 'c2'
             
-        Note: Nếu best_fitness_history không có trong results_df, sẽ tìm file JSON tương ứng
+        Note: Nếu best_fitness_history không có trong results_df, sẽ đọc file
+        <save_path>_history.npz (hoặc _history.json cũ) tương ứng
         """
         param_labels = {
             'n_particles': 'Kích thước bầy đàn (Số hạt)',
@@ -155,29 +157,21 @@ class AdvancedKnapsackVisualizer:
             'c2': 'Hệ số xã hội (c₂)'
         }
         
-        # Try to load history from JSON if not in DataFrame
+        # Try to load history from the history store if not in DataFrame
         if 'best_fitness_history' not in results_df.columns or \
            results_df['best_fitness_history'].iloc[0] is None or \
            (isinstance(results_df['best_fitness_history'].iloc[0], float) and 
             pd.isna(results_df['best_fitness_history'].iloc[0])):
             
-            # Try to find JSON file
+            # Try to find the history store (.npz, or legacy .json)
             if save_path:
-                base_dir = os.path.dirname(save_path)
-                base_name = os.path.basename(save_path).replace('.png', '_history.json')
-                json_path = os.path.join(base_dir, base_name)
-                
-                if os.path.exists(json_path):
-                    print(f"  → Loading history from {json_path}")
-                    with open(json_path, 'r') as f:
-                        history_data = json.load(f)
-                    
-                    # Merge history into DataFrame
-                    for idx, row in results_df.iterrows():
-                        for hist_item in history_data['results']:
-                            if hist_item['param_value'] == row['param_value']:
-                                results_df.at[idx, 'best_fitness_history'] = hist_item['best_fitness_history']
-                                break
+                store = open_history_store(os.path.splitext(save_path)[0])
+                if store is not None:
+                    print(f"  → Loading history from {store.path}")
+                    histories = store.by('param_value')
+                    results_df['best_fitness_history'] = [
+                        histories.get(value, []) for value in results_df['param_value']
+                    ]
         
         fig = plt.figure(figsize=(16, 12))  # Tăng height để tránh overlap
         gs = GridSpec(2, 2, figure=fig, hspace=0.4, wspace=0.3)  # Tăng hspace
@@ -276,6 +270,56 @@ class AdvancedKnapsackVisualizer:
         
         return fig
     
+    def plot_memory_impact(self, results_df: pd.DataFrame, param_name: str, algorithm: str = 'gbfs',
+                           title=None, x_label=None, save_path=None):
+        """
+        Vẽ bộ nhớ theo một tham số (vd GBFS max_states, BPSO n_particles)
+        
+        Args:
+            results_df: DataFrame với columns [param_name, peak_memory_mb, gc_collections, time]
+            param_name: Cột tham số (trục x)
+            algorithm: Thuật toán (màu)
+        """
+        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
+        df = results_df.sort_values(param_name)
+        x = df[param_name]
+        color = self.colors.get(algorithm, '#3498db')
+        
+        # Plot 1: Peak memory (tracemalloc) và thời gian
+        ax1.plot(x, df['peak_memory_mb'], 'o-', linewidth=2.5, markersize=9, color=color,
+                 label='Peak memory (MB)')
+        ax1.set_xlabel(x_label or param_name, fontweight='bold')
+        ax1.set_ylabel('Peak Memory (MB)', fontweight='bold', color=color)
+        ax1.set_title('Peak Memory (tracemalloc)', fontweight='bold', pad=15)
+        ax1.grid(True, alpha=0.3)
+        if 'time' in df:
+            ax1_time = ax1.twinx()
+            ax1_time.plot(x, df['time'], 's--', linewidth=1.5, markersize=7, color='#7f8c8d',
+                          label='Time (s)')
+            ax1_time.set_ylabel('Execution Time (seconds)', fontweight='bold', color='#7f8c8d')
+        
+        for xi, mem in zip(x, df['peak_memory_mb']):
+            ax1.annotate(f'{mem:.2f}', (xi, mem), textcoords='offset points', xytext=(0, 8),
+                         ha='center', fontsize=9, fontweight='bold')
+        
+        # Plot 2: Số lần GC chạy (mức cấp phát object Python)
+        ax2.bar(range(len(x)), df['gc_collections'], color=color, alpha=0.8, edgecolor='black')
+        ax2.set_xticks(range(len(x)))
+        ax2.set_xticklabels([str(v) for v in x])
+        ax2.set_xlabel(x_label or param_name, fontweight='bold')
+        ax2.set_ylabel('GC Collections', fontweight='bold')
+        ax2.set_title('Allocation Churn (GC runs per solve)', fontweight='bold', pad=15)
+        ax2.grid(True, alpha=0.3, axis='y')
+        
+        plt.suptitle(title or f'{algorithm.upper()} Memory vs {x_label or param_name}',
+                     fontsize=16, fontweight='bold')
+        plt.tight_layout()
+        
+        if save_path:
+            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        
+        return fig
+    
     # =========================================================================
     # 3.1.2. ẢNH HƯỞNG CỦA THUẬT TOÁN (Algorithm Comparison)
     # =========================================================================
@@ -647,6 +691,82 @@ class AdvancedKnapsackVisualizer:
         
         return fig
     
+    # =========================================================================
+    # 3.1.4. KHẢ NĂNG MỞ RỘNG (Scaling Analysis)
+    # =========================================================================
+    
+    def plot_scaling_analysis(self, df_scaling: pd.DataFrame, df_exponents: pd.DataFrame = None,
+                              save_path=None, budget_note: Dict[str, str] = None):
+        """
+        Thời gian, bộ nhớ và chất lượng theo n_items / capacity / n_regions
+        
+        Args:
+            df_scaling: DataFrame [factor, algorithm, n_items, capacity_ratio, n_regions,
+                                   time_mean, time_std, peak_memory_mb, quality_mean,
+                                   feasible_rate (tùy chọn)]
+            df_exponents: DataFrame [factor, algorithm, time_exponent, memory_exponent]
+                          (số mũ hiển thị trong legend)
+            budget_note: algorithm -> mô tả ngân sách (vd 'capped: max_states=5000'),
+                         in dưới tiêu đề
+        """
+        factors = [f for f in ('n_items', 'capacity_ratio', 'n_regions') if f in set(df_scaling['factor'])]
+        labels = {'n_items': 'Số items (n)', 'capacity_ratio': 'Capacity ratio', 'n_regions': 'Số regions'}
+        exponent_factor = {'n_items': 'n_items', 'capacity_ratio': 'capacity', 'n_regions': 'n_regions'}
+        
+        fig, axes = plt.subplots(len(factors), 3, figsize=(18, 5 * len(factors)), squeeze=False)
+        
+        for row, factor in enumerate(factors):
+            data = df_scaling[df_scaling['factor'] == factor]
+            for alg in data['algorithm'].unique():
+                d = data[data['algorithm'] == alg].sort_values(factor)
+                time_label = mem_label = alg.upper()
+                if df_exponents is not None:
+                    e = df_exponents[(df_exponents['factor'] == exponent_factor[factor]) &
+                                     (df_exponents['algorithm'] == alg)]
+                    if len(e):
+                        time_label = f"{alg.upper()} (x^{e['time_exponent'].iloc[0]:.2f})"
+                        mem_label = f"{alg.upper()} (x^{e['memory_exponent'].iloc[0]:.2f})"
+                color = self.colors.get(alg)
+                
+                axes[row, 0].errorbar(d[factor], d['time_mean'], yerr=d['time_std'], marker='o',
+                                      linewidth=2, capsize=4, color=color, label=time_label)
+                axes[row, 1].plot(d[factor], d['peak_memory_mb'], marker='s', linewidth=2,
+                                  color=color, label=mem_label)
+                axes[row, 2].plot(d[factor], d['quality_mean'], marker='^', linewidth=2,
+                                  color=color, label=alg.upper())
+                if 'feasible_rate' in d:
+                    axes[row, 2].plot(d[factor], d['feasible_rate'], linestyle=':', linewidth=1.5,
+                                      color=color, label=f'{alg.upper()} feasible rate')
+            
+            for col, (ylabel, title) in enumerate([
+                ('Execution Time (seconds)', 'Thời gian'),
+                ('Peak Memory (MB)', 'Bộ nhớ'),
+                ('Value / LP bound (feasible runs)', 'Chất lượng lời giải')
+            ]):
+                ax = axes[row, col]
+                ax.set_xlabel(labels[factor], fontweight='bold')
+                ax.set_ylabel(ylabel, fontweight='bold')
+                ax.set_title(f'{title} theo {labels[factor].lower()}', fontweight='bold')
+                ax.set_xscale('log')
+                if col < 2:
+                    ax.set_yscale('log')
+                else:
+                    ax.set_ylim(0, 1.05)
+                ax.legend(loc='best', frameon=True, shadow=True)
+                ax.grid(True, alpha=0.3, which='both')
+        
+        plt.suptitle('3.1.4: Scaling Analysis', fontsize=18, fontweight='bold', y=1.0)
+        if budget_note:
+            fig.text(0.5, 0.0, 'Fixed solver budgets, not scaled with n — ' +
+                     '; '.join(f'{alg.upper()} {note}' for alg, note in budget_note.items()),
+                     ha='center', va='top', fontsize=11, style='italic')
+        plt.tight_layout()
+        
+        if save_path:
+            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        
+        return fig
+    
     # =========================================================================
     # KNAPSACK-SPECIFIC VISUALIZATIONS (Inspired by GA_TSP map)
     # =========================================================================
@@ -1043,6 +1163,8 @@ def demo_visualizations():
     print("   visualizer.plot_data_characteristics_impact(results_dict)")
     print("\n5. Solution Map:")
     print("   visualizer.plot_knapsack_solution_map(solution, items_df)")
+    print("\n6. Scaling Analysis:")
+    print("   visualizer.plot_scaling_analysis(df_scaling, df_exponents)")
 
 
 if __name__ == '__main__':
@@ -0,0 +1,21 @@
+"""Shared fixtures: repository test cases through TestCaseLoader"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.utils import TestCaseLoader
+
+
+@pytest.fixture(scope='session')
+def loader():
+    return TestCaseLoader(str(ROOT / 'data' / 'test_cases'))
+
+
+@pytest.fixture(params=['Size Small 30', 'Size Large 70', 'Region 3Regions Medium'])
+def test_case(request, loader):
+    return loader.load_test_case(request.param)
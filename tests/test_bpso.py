@@ -0,0 +1,72 @@
+"""BPSO: seeded determinism and warm start"""
+
+import numpy as np
+import pytest
+
+from src.algorithms import solve_knapsack_bpso, solve_knapsack_dp
+from src.algorithms.bpso_knapsack import KnapsackBPSO
+
+
+def _args(tc):
+    return (tc['items'], tc['weights'], tc['values'], tc['capacity'])
+
+
+@pytest.mark.parametrize('topology', ['gbest', 'ring', 'von_neumann'])
+def test_same_seed_same_run(test_case, topology):
+    kwargs = dict(regions=test_case['regions'], n_particles=20, max_iterations=30,
+                  seed=11, topology=topology)
+    a = solve_knapsack_bpso(*_args(test_case), **kwargs)
+    b = solve_knapsack_bpso(*_args(test_case), **kwargs)
+
+    assert a['selected_indices'] == b['selected_indices']
+    np.testing.assert_array_equal(a['best_fitness_history'], b['best_fitness_history'])
+    np.testing.assert_array_equal(a['avg_fitness_history'], b['avg_fitness_history'])
+
+
+def test_seed_solution_is_never_lost(test_case):
+    """The swarm best starts at (and never falls below) a seeded solution"""
+    optimum = solve_knapsack_dp(*_args(test_case))
+    bpso = KnapsackBPSO(*_args(test_case), regions=test_case['regions'])
+    seed_fitness = bpso.evaluate_fitness(bpso.seed_to_position(optimum))
+
+    result = solve_knapsack_bpso(*_args(test_case), regions=test_case['regions'], n_particles=10,
+                                 max_iterations=10, seed=0, seed_solutions=[optimum])
+
+    assert result['best_fitness_history'][0] >= seed_fitness
+    assert np.all(np.diff(result['best_fitness_history']) >= 0)
+    assert result['total_weight'] <= test_case['capacity']
+
+
+def test_seed_formats_are_equivalent(test_case):
+    bpso = KnapsackBPSO(*_args(test_case))
+    indices = [0, 2, 5]
+    mask = np.zeros(len(test_case['items']), dtype=bool)
+    mask[indices] = True
+
+    for seed in (indices, np.array(indices), mask, {'selected_indices': indices}):
+        np.testing.assert_array_equal(bpso.seed_to_position(seed), mask.astype(int))
+
+
+@pytest.mark.parametrize('indices', [[0], [0, 1], [1]])
+def test_integer_seed_is_always_indices(indices):
+    # [0, 1] with n=2 looks like a 0/1 mask but must select both items
+    n = max(indices) + 1
+    bpso = KnapsackBPSO([f'i{k}' for k in range(n)], np.ones(n), np.ones(n), n)
+    expected = np.zeros(n, dtype=int)
+    expected[indices] = 1
+    np.testing.assert_array_equal(bpso.seed_to_position(indices), expected)
+
+
+def test_bool_seed_mask_length_is_checked(test_case):
+    bpso = KnapsackBPSO(*_args(test_case))
+    with pytest.raises(ValueError):
+        bpso.seed_to_position(np.ones(3, dtype=bool))
+
+
+def test_greedy_init_starts_feasible(test_case):
+    result = solve_knapsack_bpso(*_args(test_case), regions=test_case['regions'], n_particles=10,
+                                 max_iterations=5, seed=0, init_strategy='greedy')
+    greedy = KnapsackBPSO(*_args(test_case), regions=test_case['regions']).greedy_position()
+
+    assert np.sum(np.asarray(test_case['weights'])[greedy == 1]) <= test_case['capacity']
+    assert result['total_weight'] <= test_case['capacity']
@@ -0,0 +1,27 @@
+"""Capacity sweep: each variant equals solving that capacity directly"""
+
+import pytest
+
+from src.algorithms import solve_capacity_sweep, solve_knapsack_gbfs, solve_knapsack_bpso, solve_knapsack_dp
+
+
+@pytest.mark.parametrize('algorithm, solve, params', [
+    ('gbfs', solve_knapsack_gbfs, {'max_states': 500}),
+    ('bpso', solve_knapsack_bpso, {'seed': 3, 'init_strategy': 'greedy', 'max_iterations': 30}),
+])
+def test_sweep_matches_direct_solve(test_case, algorithm, solve, params):
+    capacities = [int(test_case['total_weight'] * r) for r in (0.1, 0.25, 0.5)]
+    sweep = solve_capacity_sweep(test_case, capacities, algorithm, **params)
+    for capacity, result in zip(capacities, sweep):
+        direct = solve(test_case['items'], test_case['weights'], test_case['values'], capacity,
+                       regions=test_case['regions'], **params)
+        assert result['capacity'] == capacity
+        assert list(result['selected_indices']) == list(direct['selected_indices'])
+
+
+def test_dp_sweep_matches_direct_solve(test_case):
+    capacities = [int(test_case['total_weight'] * r) for r in (0.1, 0.25, 0.5)]
+    sweep = solve_capacity_sweep(test_case, capacities, 'dp')
+    for capacity, result in zip(capacities, sweep):
+        direct = solve_knapsack_dp(test_case['items'], test_case['weights'], test_case['values'], capacity)
+        assert result['total_value'] == pytest.approx(direct['total_value'])
@@ -0,0 +1,69 @@
+"""Checkpoint / resume: an interrupted and resumed solve equals an uninterrupted one"""
+
+import numpy as np
+import pytest
+
+from src.algorithms import solve_knapsack_gbfs, solve_knapsack_bpso
+
+
+def _args(tc):
+    return (tc['items'], tc['weights'], tc['values'], tc['capacity'])
+
+
+@pytest.mark.parametrize('every', [1, 7, 50])
+def test_gbfs_resume_matches_uninterrupted(test_case, tmp_path, every):
+    max_states = 300
+    reference = solve_knapsack_gbfs(*_args(test_case), regions=test_case['regions'],
+                                    max_states=max_states, profile=True)
+
+    path = tmp_path / 'gbfs.npz'
+    # Killed right after the checkpoint at `every` explored states
+    solve_knapsack_gbfs(*_args(test_case), regions=test_case['regions'],
+                        max_states=every + 1, checkpoint_path=path, checkpoint_every=every)
+    resumed = solve_knapsack_gbfs(*_args(test_case), regions=test_case['regions'],
+                                  max_states=max_states, resume_from=path, profile=True)
+
+    assert resumed['selected_indices'] == reference['selected_indices']
+    assert resumed['fitness'] == reference['fitness']
+    assert resumed['states_explored'] == reference['states_explored']
+    assert (resumed['profile']['counters']['states_pushed']
+            == reference['profile']['counters']['states_pushed'])
+
+
+def test_gbfs_resume_chain_and_new_path(test_case, tmp_path):
+    """Resuming twice from the same file, or checkpointing to a new file, keeps the search exact"""
+    kwargs = dict(regions=test_case['regions'], checkpoint_every=10)
+    reference = solve_knapsack_gbfs(*_args(test_case), regions=test_case['regions'], max_states=200)
+
+    first = tmp_path / 'first.npz'
+    solve_knapsack_gbfs(*_args(test_case), max_states=25, checkpoint_path=first, **kwargs)
+    # Same path: appends to the existing closed log (past the saved size)
+    solve_knapsack_gbfs(*_args(test_case), max_states=65, checkpoint_path=first,
+                        resume_from=first, **kwargs)
+    # New path: the new closed log starts with every restored state
+    second = tmp_path / 'second.npz'
+    solve_knapsack_gbfs(*_args(test_case), max_states=95, checkpoint_path=second,
+                        resume_from=first, **kwargs)
+    resumed = solve_knapsack_gbfs(*_args(test_case), regions=test_case['regions'],
+                                  max_states=200, resume_from=second)
+
+    assert resumed['selected_indices'] == reference['selected_indices']
+    assert resumed['fitness'] == reference['fitness']
+
+
+@pytest.mark.parametrize('schedule, topology', [
+    (None, 'gbest'), ('linear_inertia', 'ring'), ('tvac', 'gbest'), ('adaptive', 'von_neumann')
+])
+def test_bpso_resume_matches_uninterrupted(test_case, tmp_path, schedule, topology):
+    kwargs = dict(regions=test_case['regions'], n_particles=20, max_iterations=40, seed=7,
+                  schedule=schedule, topology=topology)
+    reference = solve_knapsack_bpso(*_args(test_case), **kwargs)
+
+    path = tmp_path / 'bpso.npz'
+    # Only checkpoint is written after iteration 25: resume from there
+    solve_knapsack_bpso(*_args(test_case), checkpoint_path=path, checkpoint_every=25, **kwargs)
+    resumed = solve_knapsack_bpso(*_args(test_case), resume_from=path, **kwargs)
+
+    assert resumed['selected_indices'] == reference['selected_indices']
+    np.testing.assert_array_equal(resumed['best_fitness_history'], reference['best_fitness_history'])
+    assert resumed['parameter_history'] == reference['parameter_history']
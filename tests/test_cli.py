@@ -0,0 +1,27 @@
+"""Headless solve CLI: input expansion and --workers precedence"""
+
+import argparse
+import os
+
+from src.cli import add_solve_arguments, expand_inputs
+
+
+def test_expand_inputs_dedups_resolved_paths(tmp_path, monkeypatch):
+    (tmp_path / 'a.csv').write_text('Quantity,Total\n1,2\n')
+    (tmp_path / 'b.csv').write_text('Quantity,Total\n1,2\n')
+    os.symlink(tmp_path / 'a.csv', tmp_path / 'link.csv')
+    monkeypatch.chdir(tmp_path)
+
+    assert expand_inputs(['a.csv', './a.csv', str(tmp_path / 'a.csv'), 'link.csv', '*.csv']) \
+        == ['a.csv', 'b.csv']
+
+
+def test_top_level_workers_not_overridden_by_solve_default():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--workers', type=int, default=1)
+    add_solve_arguments(parser.add_subparsers(dest='command').add_parser('solve'))
+
+    args = parser.parse_args(['--workers', '4', 'solve', 'x.csv'])
+    assert (args.workers, args.solve_workers) == (4, None)
+    args = parser.parse_args(['solve', 'x.csv', '--workers', '3'])
+    assert args.solve_workers == 3
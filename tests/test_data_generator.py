@@ -0,0 +1,18 @@
+"""Generated instances: staged build, published complete"""
+
+import numpy as np
+
+from src.data_generator import generate_instance
+from src.utils.instance_cache import read_cache_meta
+
+
+def test_regenerate_replaces_instance_without_leftovers(tmp_path):
+    first = generate_instance(500, tmp_path, seed=1, name='Gen Test')
+    inst_dir = tmp_path / first['File']
+    weights = np.load(inst_dir / 'weights.npy')
+
+    second = generate_instance(500, tmp_path, seed=1, name='Gen Test')
+    assert second == first
+    assert [p.name for p in tmp_path.iterdir()] == [inst_dir.name]
+    assert read_cache_meta(inst_dir)['summary'] == first
+    np.testing.assert_array_equal(np.load(inst_dir / 'weights.npy'), weights)
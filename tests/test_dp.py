@@ -0,0 +1,52 @@
+"""DP: exact optimum (brute force on small instances) and table reuse"""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from src.algorithms import solve_knapsack_dp
+
+
+def _random_instance(seed, n):
+    rng = np.random.RandomState(seed)
+    weights = rng.randint(1, 20, n)
+    values = np.round(rng.uniform(1, 100, n), 2)
+    capacity = int(weights.sum() * rng.uniform(0.2, 0.6))
+    return [f'Item_{i + 1}' for i in range(n)], weights, values, capacity
+
+
+def _brute_force(weights, values, capacity):
+    best = 0.0
+    for mask in itertools.product((0, 1), repeat=len(weights)):
+        mask = np.array(mask, dtype=bool)
+        if weights[mask].sum() <= capacity:
+            best = max(best, values[mask].sum())
+    return best
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_dp_matches_brute_force(seed):
+    items, weights, values, capacity = _random_instance(seed, n=4 + seed)
+    result = solve_knapsack_dp(items, weights, values, capacity)
+
+    assert result['total_value'] == pytest.approx(_brute_force(weights, values, capacity))
+    assert result['total_weight'] <= capacity
+    selected = result['selected_indices']
+    assert sum(values[i] for i in selected) == pytest.approx(result['total_value'])
+
+
+@pytest.mark.parametrize('valid_rows', [0, 3, 8])
+def test_dp_table_reuse_matches_fresh_solve(valid_rows):
+    items, weights, values, capacity = _random_instance(42, n=12)
+    previous = solve_knapsack_dp(items, weights, values, capacity - 10, keep_table=True)
+
+    # Change everything after the first valid_rows items, grow the capacity
+    values = values.copy()
+    values[valid_rows:] *= 1.5
+    reused = solve_knapsack_dp(items, weights, values, capacity,
+                               previous_table=previous['dp_table'], valid_rows=valid_rows)
+    fresh = solve_knapsack_dp(items, weights, values, capacity)
+
+    assert reused['total_value'] == pytest.approx(fresh['total_value'])
+    assert reused['reused_rows'] == valid_rows
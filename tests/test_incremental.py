@@ -0,0 +1,62 @@
+"""Incremental re-solve: diff application and index mapping"""
+
+import numpy as np
+import pytest
+
+from src.algorithms import apply_knapsack_diff, resolve_knapsack, solve_knapsack_dp
+
+
+@pytest.fixture
+def problem():
+    return {
+        'items': ['A', 'B', 'C', 'D', 'E'],
+        'weights': [4, 3, 2, 5, 1],
+        'values': [10.0, 8.0, 5.0, 12.0, 2.0],
+        'regions': ['North', 'South', 'North', 'East', None],
+        'capacity': 8
+    }
+
+
+def test_index_map_and_order(problem):
+    diff = {'removed': [1, 3], 'repriced': {4: 7.5},
+            'added': [{'item': 'F', 'weight': 2, 'value': 9.0, 'region': 'West'}],
+            'capacity': 6}
+    new, index_map, valid_rows = apply_knapsack_diff(problem, diff)
+
+    np.testing.assert_array_equal(index_map, [0, -1, 1, -1, 2])
+    assert new['items'] == ['A', 'C', 'E', 'F']
+    assert new['weights'] == [4, 2, 1, 2]
+    assert new['values'] == [10.0, 5.0, 7.5, 9.0]
+    assert new['regions'] == ['North', 'North', None, 'West']
+    assert new['capacity'] == 6
+    assert valid_rows == 1  # Only item A keeps its row
+
+
+def test_unchanged_prefix(problem):
+    _, index_map, valid_rows = apply_knapsack_diff(problem, {'repriced': {3: 1.0}})
+    np.testing.assert_array_equal(index_map, np.arange(5))
+    assert valid_rows == 3
+
+    _, _, valid_rows = apply_knapsack_diff(problem, {'added': [{'item': 'F', 'weight': 1, 'value': 1.0}]})
+    assert valid_rows == 5
+
+
+def test_out_of_range_index_rejected(problem):
+    with pytest.raises(ValueError):
+        apply_knapsack_diff(problem, {'removed': [5]})
+
+
+@pytest.mark.parametrize('algorithm', ['dp', 'gbfs', 'bpso'])
+def test_resolve_uses_new_indices(problem, algorithm):
+    params = {'seed': 0} if algorithm == 'bpso' else {}
+    previous = solve_knapsack_dp(problem['items'], problem['weights'], problem['values'],
+                                 problem['capacity'], keep_table=True)
+    diff = {'removed': [0], 'capacity': 7}
+    result = resolve_knapsack(problem, previous, diff, algorithm=algorithm, **params)
+
+    new = result['problem']
+    assert all(0 <= i < len(new['items']) for i in result['selected_indices'])
+    assert result['total_weight'] <= new['capacity']
+    if algorithm == 'dp':
+        fresh = solve_knapsack_dp(new['items'], new['weights'], new['values'], new['capacity'])
+        assert result['total_value'] == pytest.approx(fresh['total_value'])
@@ -0,0 +1,40 @@
+"""Binary instance cache: rebuilt when the source CSV changes"""
+
+import os
+import shutil
+from pathlib import Path
+
+import pandas as pd
+
+from src.utils.instance_cache import cache_is_fresh, load_instance_cache
+
+ROOT = Path(__file__).resolve().parent.parent
+
+CSV_NAME = 'size_small_30.csv'
+
+
+def _rewrite_totals(csv_path, factor, mtime_ns):
+    """Scale the Total column and stamp a new mtime"""
+    df = pd.read_csv(csv_path)
+    df['Total'] = df['Total'] * factor
+    df.to_csv(csv_path, index=False)
+    os.utime(csv_path, ns=(mtime_ns, mtime_ns))
+
+
+def test_cache_rebuilt_on_mtime_change(tmp_path):
+    csv_path = tmp_path / CSV_NAME
+    shutil.copy(ROOT / 'data' / 'test_cases' / CSV_NAME, csv_path)
+    cache_dir = tmp_path / 'cache'
+
+    before = load_instance_cache(csv_path, cache_dir)
+    expected = pd.read_csv(csv_path)['Total'].to_numpy()
+    assert before['values'].tolist() == expected.tolist()
+    assert cache_is_fresh(cache_dir / csv_path.stem, csv_path)
+
+    _rewrite_totals(csv_path, 2.0, os.stat(csv_path).st_mtime_ns + 10**9)
+    assert not cache_is_fresh(cache_dir / csv_path.stem, csv_path)
+
+    after = load_instance_cache(csv_path, cache_dir)
+    assert after['values'].dtype == 'float64'  # Revenues are not rounded to float32
+    assert after['values'].tolist() == pd.read_csv(csv_path)['Total'].tolist()
+    assert cache_is_fresh(cache_dir / csv_path.stem, csv_path)
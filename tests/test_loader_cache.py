@@ -0,0 +1,38 @@
+"""TestCaseLoader LRU cache: entries are invalidated when the CSV changes"""
+
+import os
+import shutil
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from src import utils
+
+ROOT = Path(__file__).resolve().parent.parent
+CSV_NAME = 'size_small_30.csv'
+
+
+def _rewrite_totals(csv_path, factor, mtime_ns):
+    """Scale the Total column and stamp a new mtime"""
+    df = pd.read_csv(csv_path)
+    df['Total'] = df['Total'] * factor
+    df.to_csv(csv_path, index=False)
+    os.utime(csv_path, ns=(mtime_ns, mtime_ns))
+
+
+def test_loader_lru_invalidated_on_mtime_change(tmp_path):
+    test_cases_dir = tmp_path / 'test_cases'
+    shutil.copytree(ROOT / 'data' / 'test_cases', test_cases_dir,
+                    ignore=shutil.ignore_patterns('.cache'))
+    loader = utils.TestCaseLoader(str(test_cases_dir), binary_cache_dir=str(tmp_path / 'cache'))
+
+    first = loader.load_test_case('Size Small 30')
+    assert loader.load_test_case('Size Small 30')['values'] is first['values']  # LRU hit
+
+    csv_path = test_cases_dir / CSV_NAME
+    _rewrite_totals(csv_path, 3.0, os.stat(csv_path).st_mtime_ns + 10**9)
+
+    second = loader.load_test_case('Size Small 30')
+    assert second['total_value'] == pytest.approx(3.0 * first['total_value'])
+    assert not second['values'].flags.writeable  # Shared with the cache
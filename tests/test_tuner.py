@@ -0,0 +1,47 @@
+"""Racing tuner: replicates and the paired test over test cases"""
+
+import numpy as np
+
+from experiment.chapter3.runner import execute_run
+from experiment.chapter3.tuner import RacingTuner, dominated
+
+INSTANCES = ['Size Small 30', 'Size Large 70', 'Region 3Regions Medium']
+
+
+class _Experiments:
+    """Serial stand-in for Chapter3Experiments.run_grid (no cache, no pool)"""
+
+    def __init__(self, loader):
+        self.loader = loader
+        self.runs = []
+
+    def run_grid(self, runs):
+        self.runs.extend(runs)
+        return {run: execute_run(run, self.loader) for run in runs}
+
+
+def test_deterministic_solver_runs_one_replicate(loader):
+    experiments = _Experiments(loader)
+    tuner = RacingTuner(experiments, 'gbfs', space={'max_states': [100, 500]}, max_replicates=3)
+    outcome = tuner.race(INSTANCES)
+    assert tuner.max_replicates == 1
+    assert {run.run_id for run in experiments.runs} == {0}
+    assert outcome['runs_exhaustive'] == 2 * len(INSTANCES)
+
+
+def test_seeded_solver_replicates(loader):
+    experiments = _Experiments(loader)
+    tuner = RacingTuner(experiments, 'bpso', space={'n_particles': [10], 'max_iterations': [10]},
+                        max_replicates=2)
+    tuner.race(INSTANCES[:1])
+    runs = experiments.runs
+    assert {run.run_id for run in runs} == {0, 1}
+    assert len({run.seed for run in runs}) == 2
+
+
+def test_dominated_uses_test_cases_as_samples():
+    # Two test cases: df = 1, t critical 6.314
+    scores = np.array([[1.0, 0.9], [0.5, 0.45]])
+    assert dominated(scores, 0).tolist() == [False, True]
+    # A single test case cannot show significance, however many replicates it had
+    assert not dominated(scores[:, :1], 0).any()